@@ -0,0 +1,96 @@
+"""
+크롬 프로필(default, perf)별 공고 상세 페이지 로딩 시간과 크롬 메모리를 비교합니다. (크롬 드라이버와 네트워크 필요)
+
+    uv run python -m bench.chrome_bench 123456 123457 123458
+    uv run python -m bench.chrome_bench --fixtures bench/fixtures --repeat 3 --output chrome.json
+
+공고 ID를 주지 않으면 bench/record.py로 녹화한 폴더의 recruit_<공고 ID>.html 파일 이름에서 ID를 가져온다.
+프로필마다 새 크롬을 임시 user-data-dir로 띄워, 첫 로딩(cold)과 다시 로딩(warm)을 나눠 잰다.
+메모리는 chromedriver 아래 모든 크롬 프로세스의 RSS 합계이다. (리눅스 전용)
+"""
+from contextlib import redirect_stdout
+import argparse
+import io
+import json
+import os
+import re
+import statistics
+import sys
+import time
+
+from crawltools.crawler import START_URL
+from crawltools.fetcher import Fetcher
+
+PROFILES = ("default", "perf")
+
+
+def fixture_ids(path):
+    return sorted(match.group(1) for name in os.listdir(path) if (match := re.fullmatch(r"recruit_(\w+)\.html", name)))
+
+
+def measure(profile, ids, repeat):
+    """
+    한 프로필로 공고 페이지들을 repeat번 돌아가며 열고 시간과 메모리를 측정합니다.
+
+    Returns:
+        dict: {"profile", "cold_ms", "warm_ms", "chrome_rss_kb", "found"}
+    """
+    with redirect_stdout(io.StringIO()):
+        fetcher = Fetcher(profile=profile, user_data_dir=False)
+    try:
+        cold, warm, peak_rss = [], [], 0
+        found = 0
+        for attempt in range(repeat):
+            for id in ids:
+                start = time.perf_counter()
+                with redirect_stdout(io.StringIO()):
+                    html = fetcher.fetch_with_selenium(f"{START_URL}/{id}")
+                (cold if attempt == 0 else warm).append((time.perf_counter() - start) * 1000)
+                found += html is not None and "~" in html
+                peak_rss = max(peak_rss, fetcher.chrome_rss_kb() or 0)
+        return {
+            "profile": profile,
+            "cold_ms": round(statistics.median(cold), 1),
+            "warm_ms": round(statistics.median(warm), 1) if warm else None,
+            "chrome_rss_kb": peak_rss or None,
+            "found": found,
+        }
+    finally:
+        with redirect_stdout(io.StringIO()):
+            fetcher.close_driver()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("ids", nargs="*", help="열어 볼 공고 ID")
+    arg_parser.add_argument("--fixtures", default="bench/fixtures", help="공고 ID를 가져올 녹화 폴더")
+    arg_parser.add_argument("--limit", type=int, default=10, help="최대 공고 수")
+    arg_parser.add_argument("--repeat", type=int, default=2, help="공고마다 여는 횟수 (두 번째부터 warm)")
+    arg_parser.add_argument("--output", help="결과 JSON 파일 경로. 없으면 화면에 출력")
+    args = arg_parser.parse_args()
+
+    ids = args.ids or (fixture_ids(args.fixtures) if os.path.isdir(args.fixtures) else [])
+    if not ids:
+        arg_parser.error("공고 ID를 주거나 --fixtures에 녹화 폴더를 지정하세요.")
+    ids = ids[:args.limit]
+
+    results = []
+    for profile in PROFILES:
+        result = measure(profile, ids, args.repeat)
+        results.append(result)
+        print(
+            f"[INFO] {profile}: cold {result['cold_ms']}ms, warm {result['warm_ms']}ms, "
+            f"크롬 메모리 {result['chrome_rss_kb']}KB, 마감 시간 {result['found']}개",
+            file=sys.stderr,
+        )
+
+    output = {"ids": ids, "repeat": args.repeat, "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2)
+    else:
+        print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
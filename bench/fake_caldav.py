@@ -0,0 +1,141 @@
+"""
+CalDAV 캘린더 컬렉션 하나를 흉내 내는 로컬 서버. (벤치마크와 CaldavOutput 확인용)
+
+outputs/caldav_output.py가 쓰는 요청만 구현한다.
+    PROPFIND (Depth 0: getctag, Depth 1: 리소스 목록과 getetag), PUT, GET, DELETE
+
+    server = FakeCaldavServer(latency=0.01)
+    server.start()
+    os.environ["CALDAV_URL"] = server.url
+    ...
+    server.stop()
+
+요청마다 requests[메서드]를 세고, latency초만큼 기다려 실제 서버 지연을 흉내 낼 수 있다.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote, urlsplit
+import hashlib
+import threading
+import time
+
+COLLECTION = "/calendars/user/recruit_schedule/"
+
+
+class FakeCaldavServer:
+    """
+    메모리 안에 리소스(이름 -> iCalendar 본문)를 두는 CalDAV 서버.
+
+    Attributes:
+        resources (dict): 리소스 이름 -> iCalendar 본문.
+        requests (dict): HTTP 메서드 -> 받은 요청 수.
+        ctag (int): 컬렉션이 바뀔 때마다 1씩 늘어나는 값.
+    """
+
+    def __init__(self, latency=0.0, port=0):
+        self.latency = latency
+        self.resources = {}
+        self.requests = {}
+        self.ctag = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self.handler())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_port}{COLLECTION}"
+
+    @property
+    def calls(self):
+        return sum(self.requests.values())
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def count(self, method):
+        with self.lock:
+            self.requests[method] = self.requests.get(method, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def propfind(self, depth):
+        responses = [f"<d:response><d:href>{COLLECTION}</d:href><d:propstat><d:prop>"
+                     f"<cs:getctag>{self.ctag}</cs:getctag></d:prop></d:propstat></d:response>"]
+        if depth != "0":
+            with self.lock:
+                items = list(self.resources.items())
+            for name, body in items:
+                etag = hashlib.md5(body).hexdigest()
+                responses.append(
+                    f"<d:response><d:href>{COLLECTION}{quote(name, safe='@')}</d:href><d:propstat><d:prop>"
+                    f"<d:getetag>\"{etag}\"</d:getetag></d:prop></d:propstat></d:response>"
+                )
+        return (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            '<d:multistatus xmlns:d="DAV:" xmlns:cs="http://calendarserver.org/ns/">'
+            + "".join(responses) + "</d:multistatus>"
+        ).encode()
+
+    def handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def resource(self):
+                path = unquote(urlsplit(self.path).path)
+                if not path.startswith(COLLECTION):
+                    return None
+                return path[len(COLLECTION):] or None
+
+            def reply(self, status, body=b"", content_type="text/plain"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def body(self):
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+            def do_PROPFIND(self):
+                fake.count("PROPFIND")
+                self.body()
+                self.reply(207, fake.propfind(self.headers.get("Depth", "1")), "application/xml; charset=utf-8")
+
+            def do_PUT(self):
+                fake.count("PUT")
+                name, body = self.resource(), self.body()
+                if name is None:
+                    return self.reply(403)
+                with fake.lock:
+                    status = 204 if name in fake.resources else 201
+                    fake.resources[name] = body
+                    fake.ctag += 1
+                self.reply(status)
+
+            def do_GET(self):
+                fake.count("GET")
+                body = fake.resources.get(self.resource())
+                if body is None:
+                    return self.reply(404)
+                self.reply(200, body, "text/calendar; charset=utf-8")
+
+            def do_DELETE(self):
+                fake.count("DELETE")
+                with fake.lock:
+                    if fake.resources.pop(self.resource(), None) is None:
+                        return self.reply(404)
+                    fake.ctag += 1
+                self.reply(204)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,205 @@
+"""
+googleapiclient의 Calendar 서비스 객체를 흉내 내는 로컬 스텁. (벤치마크용)
+
+google_calendar.py와 reset.py가 쓰는 호출만 구현한다.
+    calendarList().list(), calendars().insert()
+    events().list() (pageToken, syncToken, privateExtendedProperty), insert(), patch(), delete()
+    new_batch_http_request()
+
+HTTP 왕복 한 번마다 round_trips를 세고, latency초만큼 기다려 실제 API 지연을 흉내 낼 수 있다.
+"""
+from googleapiclient.errors import HttpError
+import copy
+import httplib2
+import itertools
+import time
+
+
+def http_error(status, reason):
+    return HttpError(httplib2.Response({"status": status, "reason": reason}), reason.encode())
+
+
+class FakeRequest:
+    """HttpRequest처럼 execute()로 실행되는 요청. 배치에 넣으면 배치가 대신 실행한다."""
+
+    def __init__(self, service, handler):
+        self.service = service
+        self.handler = handler
+
+    def execute(self):
+        self.service.round_trip()
+        return self.handler()
+
+
+class FakeBatch:
+    """BatchHttpRequest 흉내. 요청 여러 개를 HTTP 왕복 한 번으로 실행한다."""
+
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        self.requests.append((request_id or str(len(self.requests)), request))
+
+    def execute(self):
+        self.service.round_trip()
+        for request_id, request in self.requests:
+            try:
+                response, exception = request.handler(), None
+            except HttpError as e:
+                response, exception = None, e
+            self.callback(request_id, response, exception)
+
+
+class FakeCalendarService:
+    """
+    메모리 안에서 캘린더와 이벤트를 관리하는 Calendar API 스텁.
+
+    Attributes:
+        round_trips (int): HTTP 왕복 횟수. (배치는 한 번으로 센다)
+        calls (int): API 호출 수. (배치 안의 요청도 하나씩 센다)
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.round_trips = 0
+        self.calls = 0
+        self.calendars_by_id = {}
+        # 캘린더 ID -> 이벤트 ID -> 이벤트 (삭제된 이벤트는 status가 cancelled로 남는다)
+        self.events_by_calendar = {}
+        self.sequence = itertools.count(1)
+        self.change_seq = 0
+
+    def round_trip(self):
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _request(self, handler):
+        self.calls += 1
+        return FakeRequest(self, handler)
+
+    def _touch(self, event):
+        self.change_seq += 1
+        event["_seq"] = self.change_seq
+
+    # --- calendarList / calendars ---
+
+    def calendarList(self):
+        return _CalendarList(self)
+
+    def calendars(self):
+        return _Calendars(self)
+
+    def add_calendar(self, summary):
+        calendar_id = f"cal{next(self.sequence)}@fake"
+        self.calendars_by_id[calendar_id] = {"summary": summary}
+        self.events_by_calendar[calendar_id] = {}
+        return calendar_id
+
+    # --- events ---
+
+    def events(self):
+        return _Events(self)
+
+    def add_event(self, calendar_id, body):
+        """이벤트를 직접 넣습니다. (벤치마크 준비용, 왕복으로 세지 않는다)"""
+        event = copy.deepcopy(body)
+        event["id"] = f"ev{next(self.sequence)}"
+        event["status"] = "confirmed"
+        event["htmlLink"] = f"https://calendar.fake/{event['id']}"
+        self._touch(event)
+        self.events_by_calendar[calendar_id][event["id"]] = event
+        return event
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatch(self, callback)
+
+
+class _CalendarList:
+    def __init__(self, service):
+        self.service = service
+
+    def list(self, **params):
+        return self.service._request(lambda: {
+            "items": [{"id": id, "summary": c["summary"]} for id, c in self.service.calendars_by_id.items()]
+        })
+
+
+class _Calendars:
+    def __init__(self, service):
+        self.service = service
+
+    def insert(self, body):
+        def handler():
+            calendar_id = self.service.add_calendar(body["summary"])
+            return {"id": calendar_id, "summary": body["summary"]}
+        return self.service._request(handler)
+
+
+class _Events:
+    def __init__(self, service):
+        self.service = service
+
+    def _events(self, calendar_id):
+        if calendar_id not in self.service.events_by_calendar:
+            raise http_error(404, "Not Found")
+        return self.service.events_by_calendar[calendar_id]
+
+    @staticmethod
+    def _public(event):
+        return {key: value for key, value in event.items() if not key.startswith("_")}
+
+    def list(self, calendarId, maxResults=250, pageToken=None, syncToken=None,
+             privateExtendedProperty=None, **params):
+        def handler():
+            events = sorted(self._events(calendarId).values(), key=lambda e: e["_seq"])
+            if syncToken is not None:
+                if not syncToken.isdigit() or int(syncToken) > self.service.change_seq:
+                    raise http_error(410, "Gone")
+                events = [e for e in events if e["_seq"] > int(syncToken)]
+            else:
+                events = [e for e in events if e["status"] != "cancelled"]
+            if privateExtendedProperty:
+                key, value = privateExtendedProperty.split("=", 1)
+                events = [
+                    e for e in events
+                    if e.get("extendedProperties", {}).get("private", {}).get(key) == value
+                ]
+
+            start = int(pageToken or 0)
+            page = events[start:start + maxResults]
+            result = {"items": [self._public(e) for e in page]}
+            if start + maxResults < len(events):
+                result["nextPageToken"] = str(start + maxResults)
+            elif not privateExtendedProperty:
+                result["nextSyncToken"] = str(self.service.change_seq)
+            return result
+        return self.service._request(handler)
+
+    def insert(self, calendarId, body):
+        def handler():
+            self._events(calendarId)
+            return self._public(self.service.add_event(calendarId, body))
+        return self.service._request(handler)
+
+    def patch(self, calendarId, eventId, body):
+        def handler():
+            event = self._events(calendarId).get(eventId)
+            if event is None or event["status"] == "cancelled":
+                raise http_error(404, "Not Found")
+            event.update(copy.deepcopy(body))
+            self.service._touch(event)
+            return self._public(event)
+        return self.service._request(handler)
+
+    def delete(self, calendarId, eventId):
+        def handler():
+            event = self._events(calendarId).get(eventId)
+            if event is None or event["status"] == "cancelled":
+                raise http_error(410, "Deleted")
+            event["status"] = "cancelled"
+            self.service._touch(event)
+            return ""
+        return self.service._request(handler)
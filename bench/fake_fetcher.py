@@ -0,0 +1,120 @@
+"""
+녹화된(또는 합성) HTML을 돌려주는 가짜 Fetcher. 크롬 없이 Crawler와 Parser를 그대로 돌리기 위해 쓴다.
+"""
+from bench.synthetic import make_detail_page, make_month_page
+from crawltools.waits import Waiter
+import glob
+import os
+import re
+import threading
+import time
+
+
+class ReplayFetcher:
+    """
+    Fetcher와 같은 메서드로 미리 준비한 페이지를 돌려줍니다.
+
+    Args:
+        months (dict): 이번 달 기준 offset -> 달력 페이지 HTML.
+        details (dict | callable): 공고 ID -> 상세 페이지 HTML, 또는 ID를 받아 HTML을 만드는 함수.
+        page_latency (float): 페이지 하나를 여는 데 걸리는 시간(초)을 흉내 낸다.
+    """
+
+    def __init__(self, months, details, page_latency=0.0):
+        self.months = months
+        self.details = details
+        self.page_latency = page_latency
+        self.offset = 0
+        self.pages = 0
+        self.driver = None
+        self.waiter = Waiter(None)
+        # 워커(worker())들이 연 페이지도 이 fetcher의 pages로 센다
+        self.root = self
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_directory(cls, path, page_latency=0.0):
+        """
+        bench/record.py로 녹화한 폴더(month_<offset>.html, recruit_<id>.html)에서 페이지를 불러옵니다.
+        """
+        months, details = {}, {}
+        for file in glob.glob(os.path.join(path, "*.html")):
+            with open(file, encoding="utf-8") as f:
+                html = f.read()
+            name = os.path.basename(file)
+            if match := re.fullmatch(r"month_(-?\d+)\.html", name):
+                months[int(match.group(1))] = html
+            elif match := re.fullmatch(r"recruit_(\w+)\.html", name):
+                details[match.group(1)] = html
+        return cls(months, details, page_latency)
+
+    def worker(self):
+        """같은 페이지를 돌려주는 FetcherPool 워커용 fetcher를 만듭니다. (Crawler.worker_factory에 넣는다)"""
+        fetcher = ReplayFetcher(self.months, self.details, self.page_latency)
+        fetcher.root = self
+        return fetcher
+
+    def _load(self, html):
+        with self.root.lock:
+            self.root.pages += 1
+        if self.page_latency:
+            time.sleep(self.page_latency)
+        return html
+
+    def _month(self):
+        return self._load(self.months.get(self.offset) or make_month_page([], padding=0))
+
+    def close_driver(self):
+        pass
+
+    def get_cookies(self):
+        return []
+
+    def get_local_storage(self):
+        return {}
+
+    def is_logged_in(self):
+        return True
+
+    def restore_session(self, url, session):
+        self.offset = 0
+        return self._month()
+
+    def reload_if_logged_in(self, url):
+        self.offset = 0
+        return self._month()
+
+    def selenium_with_login(self, url, user_id, user_pw):
+        self.offset = 0
+        return self._month()
+
+    selenium_with_kakao_login = selenium_with_login
+
+    def selenium_move_month(self, offset):
+        self.offset += offset
+        return self._month()
+
+    def selenium_next_page(self):
+        return self.selenium_move_month(1)
+
+    def selenium_prev_page(self):
+        return self.selenium_move_month(-1)
+
+    def fetch_with_selenium(self, url):
+        id = url.rstrip("/").rsplit("/", 1)[-1]
+        if callable(self.details):
+            return self._load(self.details(id))
+        html = self.details.get(id)
+        return self._load(html) if html is not None else None
+
+
+def synthetic_fetcher(ids, months=2, page_latency=0.0):
+    """
+    ids 공고를 months개월에 나눠 담은 합성 달력과, 공고마다 상세 페이지를 만드는 ReplayFetcher를 반환합니다.
+    """
+    per_month = -(-len(ids) // months) if ids else 0
+    pages = {
+        offset: make_month_page(ids[offset * per_month:(offset + 1) * per_month], padding=500)
+        for offset in range(months)
+    }
+    return ReplayFetcher(pages, lambda id: make_detail_page(id, padding=200), page_latency)
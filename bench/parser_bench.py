@@ -0,0 +1,135 @@
+"""
+Parser 엔진(bs4, lxml)별 파싱 시간과 최대 메모리를 비교하는 마이크로 벤치마크.
+
+    uv run python -m bench.parser_bench
+    uv run python -m bench.parser_bench --month-html month.html --detail-html detail.html --repeat 50
+
+HTML 파일을 주지 않으면 실제 페이지 구조를 흉내 낸 합성 페이지를 쓴다.
+메모리는 엔진마다 새 프로세스에서 측정한다. lxml은 C 메모리를 쓰기 때문에 tracemalloc만으로는 잡히지 않아,
+파싱 전후 최대 RSS 증가량(peak_rss_kb)과 파이썬 할당 최대치(py_peak_kb)를 함께 보여준다.
+"""
+from contextlib import redirect_stdout
+import argparse
+import io
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bench.synthetic import make_detail_page, make_month_page
+from crawltools.parser import Parser
+
+ENGINES = ("bs4", "lxml")
+
+
+def run_parser(kind, html):
+    with redirect_stdout(io.StringIO()):
+        if kind == "calendar":
+            return Parser.calendar(html)
+        return Parser.extract_exp_time(html)
+
+
+def measure(engine, kind, path, repeat):
+    """
+    한 엔진으로 한 페이지를 repeat번 파싱하고 시간과 메모리를 측정합니다. (새 프로세스에서 실행)
+
+    Returns:
+        dict: 측정 결과.
+    """
+    Parser.engine = engine
+    with open(path, encoding="utf-8") as f:
+        html = f.read()
+
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    run_parser(kind, html)  # 준비 실행 (지연 초기화 등)
+
+    tracemalloc.start()
+    run_parser(kind, html)
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_parser(kind, html)
+        times.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "engine": engine,
+        "kind": kind,
+        "bytes": len(html.encode()),
+        "mean_ms": statistics.mean(times),
+        "min_ms": min(times),
+        "py_peak_kb": py_peak / 1024,
+        "peak_rss_kb": peak_rss - base_rss,
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--month-html", help="달력 페이지 HTML 파일")
+    arg_parser.add_argument("--detail-html", help="공고 상세 페이지 HTML 파일")
+    arg_parser.add_argument("--repeat", type=int, default=20)
+    arg_parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    arg_parser.add_argument("--worker", nargs=3, metavar=("ENGINE", "KIND", "PATH"), help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.worker:
+        engine, kind, path = args.worker
+        print(json.dumps(measure(engine, kind, path, args.repeat)))
+        return
+
+    pages = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind, given, make in (
+            ("calendar", args.month_html, make_month_page),
+            ("detail", args.detail_html, make_detail_page),
+        ):
+            if given:
+                pages[kind] = given
+            else:
+                pages[kind] = f"{tmp}/{kind}.html"
+                with open(pages[kind], "w", encoding="utf-8") as f:
+                    f.write(make())
+
+        # 두 엔진의 결과가 같은지 먼저 확인
+        for kind, path in pages.items():
+            with open(path, encoding="utf-8") as f:
+                html = f.read()
+            outputs = []
+            for engine in ENGINES:
+                Parser.engine = engine
+                outputs.append(run_parser(kind, html))
+            if outputs[0] != outputs[1]:
+                print(f"[ERROR] {kind}: 엔진별 결과가 다릅니다.\n  bs4: {outputs[0]}\n  lxml: {outputs[1]}")
+                sys.exit(1)
+
+        results = []
+        for kind, path in pages.items():
+            for engine in ENGINES:
+                output = subprocess.run(
+                    [sys.executable, "-m", "bench.parser_bench", "--repeat", str(args.repeat),
+                     "--worker", engine, kind, path],
+                    capture_output=True, text=True, check=True,
+                ).stdout
+                results.append(json.loads(output.strip().splitlines()[-1]))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'page':<10}{'engine':<8}{'KB':>8}{'mean ms':>10}{'min ms':>10}{'py peak KB':>12}{'peak RSS KB':>13}")
+    for r in results:
+        print(
+            f"{r['kind']:<10}{r['engine']:<8}{r['bytes'] / 1024:>8.0f}{r['mean_ms']:>10.2f}"
+            f"{r['min_ms']:>10.2f}{r['py_peak_kb']:>12.0f}{r['peak_rss_kb']:>13.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+크롬과 구글 계정 없이 main() 전체 파이프라인의 성능을 재는 오프라인 벤치마크.
+
+    uv run python -m bench.pipeline_bench
+    uv run python -m bench.pipeline_bench --scales 10 100 --api-latency 0.05 --output bench.json
+    uv run python -m bench.pipeline_bench --fixtures bench/fixtures
+    uv run python -m bench.pipeline_bench --backend caldav --api-latency 0.01
+    PIPELINE=async uv run python -m bench.pipeline_bench --page-latency 0.1 --detail-workers 4
+
+규모마다 공고 N개가 즐겨찾기된 합성 달력(2개월)과, 그중 절반이 이미 등록되고 다른 공고 일정도 섞인
+N개 이벤트가 있는 가짜 캘린더를 만든 뒤 main()을 두 번 실행한다.
+    cold: 처음 실행 (전체 목록 조회, 새 공고 상세 페이지 수집, 일정 등록)
+    warm: 바로 다시 실행 (증분 조회, 새로 할 일 없음)
+--detail-workers를 주면 상세 페이지를 크롬 대신 가짜 fetcher 워커 여러 개로 나눠서 연다.
+--backend ics, caldav는 가짜 캘린더 대신 임시 .ics 파일이나 로컬 CalDAV 서버(bench/fake_caldav.py)에
+빈 캘린더부터 내보낸다. (CalDAV는 HTTP 요청 수를 API 왕복/호출 수로 센다)
+결과는 커밋끼리 비교할 수 있도록 JSON으로 출력한다.
+"""
+from bench.fake_calendar import FakeCalendarService
+from bench.fake_caldav import FakeCaldavServer
+from bench.fake_fetcher import ReplayFetcher, synthetic_fetcher
+from bench.synthetic import deadline_for, employment_id
+from contextlib import redirect_stdout
+import argparse
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+DEFAULT_SCALES = (10, 100, 1000, 10000)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def isolate(tmp, detail_workers=1):
+    """세션, 상태 DB, 캐시를 임시 폴더로 돌리고, 크롬이 필요한 설정은 끈다."""
+    os.environ.update({
+        "SESSION_DIR": os.path.join(tmp, "session"),
+        "STATE_DIR": os.path.join(tmp, "state"),
+        "DETAIL_CACHE_PATH": os.path.join(tmp, "cache", "detail_cache.db"),
+        "DETAIL_WORKERS": str(detail_workers),
+        "DETAIL_BACKEND": "selenium",
+        "CRAWL_MONTHS_AHEAD": "1",
+        "CRAWL_MONTHS_BACK": "0",
+        "CALENDAR_SYNC": "incremental",
+        "DATA_SOURCE": "dom",
+    })
+
+
+def prepare_calendar(service, ids):
+    """
+    가짜 캘린더를 만들고 이벤트 len(ids)개를 넣습니다.
+    앞쪽 절반은 즐겨찾기 공고의 일정이고, 나머지는 크롤링 결과에 없는 다른 공고의 일정이다.
+    """
+    from crawltools.crawler import START_URL
+    from google.google_calendar import build_event
+
+    calendar_id = service.add_calendar("recruit_schedule")
+    existing = ids[:len(ids) // 2]
+    others = [employment_id(500000 + i) for i in range(len(ids) - len(existing))]
+    for id in existing + others:
+        body = build_event(f"회사 {id}", deadline_for(id), f"{id} 신입 채용\n{START_URL}/{id}", id)
+        service.add_event(calendar_id, body)
+    return calendar_id
+
+
+def open_backend(backend, tmp, api_latency):
+    """
+    벤치마크할 출력을 만듭니다.
+
+    Returns:
+        tuple: (main()에 넘길 service, main()에 넘길 output, (왕복 수, 호출 수)를 반환하는 함수, 정리 함수)
+    """
+    if backend == "ics":
+        from outputs.ics_output import IcsOutput
+
+        return None, IcsOutput(os.path.join(tmp, "recruit_schedule.ics")), lambda: (0, 0), lambda: None
+    if backend == "caldav":
+        from outputs.caldav_output import CaldavOutput
+
+        server = FakeCaldavServer(api_latency).start()
+        return None, CaldavOutput(server.url), lambda: (server.calls, server.calls), server.stop
+    service = FakeCalendarService(api_latency)
+    return service, None, lambda: (service.round_trips, service.calls), lambda: None
+
+
+def run_main(fetcher, service, output, sync):
+    """main()을 한 번 실행하고 (걸린 시간, 결과)를 반환합니다."""
+    from crawltools.crawler import Crawler
+    from main import main
+
+    crawler = Crawler(fetcher)
+    # DETAIL_WORKERS가 2 이상이면 워커도 크롬 대신 같은 페이지를 돌려주는 가짜로 띄운다
+    crawler.worker_factory = fetcher.worker
+    stdout = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(stdout):
+        report = main(sync=sync, crawler=crawler, service=service, output=output)
+    return time.perf_counter() - start, report
+
+
+def run_scenario(name, fetcher, service, output, counters, sync):
+    (round_trips, calls), pages = counters(), fetcher.pages
+    result = {"scale": name}
+    for phase in ("cold", "warm"):
+        seconds, report = run_main(fetcher, service, output, sync)
+        result[phase] = {
+            "seconds": round(seconds, 4),
+            "api_round_trips": counters()[0] - round_trips,
+            "api_calls": counters()[1] - calls,
+            "pages_loaded": fetcher.pages - pages,
+            "created": len(report["created"]),
+            "updated": len(report["updated"]),
+            "deleted": len(report["deleted"]),
+            "failed": len(report["failed"]),
+        }
+        (round_trips, calls), pages = counters(), fetcher.pages
+    result["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="공고/이벤트 수")
+    arg_parser.add_argument("--fixtures", help="bench/record.py로 녹화한 폴더. 주면 녹화된 페이지로도 실행한다.")
+    arg_parser.add_argument("--api-latency", type=float, default=0.0, help="API 왕복 한 번의 지연(초)")
+    arg_parser.add_argument("--page-latency", type=float, default=0.0, help="페이지 로딩 한 번의 지연(초)")
+    arg_parser.add_argument("--detail-workers", type=int, default=1, help="상세 페이지를 나눠서 열 워커 수 (DETAIL_WORKERS)")
+    arg_parser.add_argument("--sync", action="store_true", help="동기화 모드(main --sync)로 실행")
+    arg_parser.add_argument("--backend", choices=("google", "ics", "caldav"), default="google", help="일정을 내보낼 곳")
+    arg_parser.add_argument("--output", help="결과 JSON 파일 경로. 없으면 화면에 출력")
+    args = arg_parser.parse_args()
+
+    results = []
+    scenarios = [(scale, None) for scale in args.scales]
+    if args.fixtures:
+        scenarios.append(("recorded", args.fixtures))
+
+    for scale, fixtures in scenarios:
+        with tempfile.TemporaryDirectory() as tmp:
+            isolate(tmp, args.detail_workers)
+            service, output, counters, close = open_backend(args.backend, tmp, args.api_latency)
+            if fixtures:
+                fetcher = ReplayFetcher.from_directory(fixtures, args.page_latency)
+            else:
+                ids = [employment_id(i) for i in range(scale)]
+                fetcher = synthetic_fetcher(ids, page_latency=args.page_latency)
+            if service is not None:
+                if fixtures:
+                    service.add_calendar("recruit_schedule")
+                else:
+                    prepare_calendar(service, ids)
+
+            try:
+                result = run_scenario(scale, fetcher, service, output, counters, args.sync)
+            finally:
+                close()
+            results.append(result)
+            print(
+                f"[INFO] {scale}: cold {result['cold']['seconds']:.2f}초 "
+                f"(API 왕복 {result['cold']['api_round_trips']}, 페이지 {result['cold']['pages_loaded']}), "
+                f"warm {result['warm']['seconds']:.2f}초",
+                file=sys.stderr,
+            )
+
+    output = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "created_at": time.time(),
+        "options": {
+            "api_latency": args.api_latency,
+            "page_latency": args.page_latency,
+            "detail_workers": args.detail_workers,
+            "sync": args.sync,
+            "backend": args.backend,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2)
+    else:
+        print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+실제 자소설닷컴 페이지를 녹화해 벤치마크 픽스처로 저장합니다. (.env의 로그인 정보 필요)
+
+    uv run python -m bench.record bench/fixtures
+
+달력 페이지는 month_<offset>.html, 공고 상세 페이지는 recruit_<공고 ID>.html로 저장된다.
+저장한 폴더는 `python -m bench.pipeline_bench --fixtures bench/fixtures`로 재생할 수 있다.
+"""
+from crawltools.crawler import Crawler, START_URL
+from crawltools.parser import Parser
+import os
+import sys
+
+
+def save(path, name, html):
+    with open(os.path.join(path, name), "w", encoding="utf-8") as f:
+        f.write(html)
+    print(f"[INFO] 저장: {name}")
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else "bench/fixtures"
+    months_ahead = int(os.getenv("CRAWL_MONTHS_AHEAD", "1"))
+    os.makedirs(path, exist_ok=True)
+
+    crawler = Crawler()
+    html = crawler.login()
+    save(path, "month_0.html", html)
+    ids = set(Parser.calendar(html))
+
+    for offset in range(1, months_ahead + 1):
+        html = crawler.fetcher.selenium_next_page()
+        if html is None:
+            break
+        save(path, f"month_{offset}.html", html)
+        ids.update(Parser.calendar(html))
+
+    for id in sorted(ids):
+        html = crawler.fetcher.fetch_with_selenium(f"{START_URL}/{id}")
+        if html is not None:
+            save(path, f"recruit_{id}.html", html)
+
+
+if __name__ == "__main__":
+    main()
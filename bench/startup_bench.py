@@ -0,0 +1,94 @@
+"""
+실행 파일(main.py, reset.py 등)마다 모듈 import에 걸리는 시간을 잽니다. (크롬과 구글 계정 필요 없음)
+
+    uv run python -m bench.startup_bench
+    uv run python -m bench.startup_bench --entries main reset --repeat 5 --top 15 --output startup.json
+
+엔트리마다 새 파이썬 프로세스에서 `python -X importtime -c "import <엔트리>"`를 repeat번 실행해
+import 전체 시간의 중앙값과, 엔트리가 직접 import한 모듈 중 오래 걸린 순서를 출력한다.
+첫 실행은 .pyc를 만드는 시간이 섞이므로 버린다.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+DEFAULT_ENTRIES = ("main", "reset", "daemon", "multi")
+
+
+def import_times(entry):
+    """
+    새 프로세스에서 entry를 import합니다.
+
+    Returns:
+        tuple: (entry import 전체 시간(ms), entry가 직접 import한 모듈 이름 -> 누적 시간(ms))
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {entry}"],
+        capture_output=True, text=True, check=True,
+    )
+    children = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        # 들여쓰기 두 칸이 한 단계. 하위 모듈이 먼저 찍히고 그 모듈을 부른 모듈이 나중에 찍힌다
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        if depth == 1:
+            children[name] = int(cumulative) / 1000
+        elif depth == 0:
+            if name == entry:
+                return int(cumulative) / 1000, children
+            children = {}
+    return 0.0, {}
+
+
+def measure(entry, repeat, top):
+    """
+    Returns:
+        dict: {"entry", "import_ms", "top": [(entry가 직접 import한 모듈, ms), ...]}
+    """
+    import_times(entry)  # .pyc 생성
+    totals, modules = [], {}
+    for _ in range(repeat):
+        total, children = import_times(entry)
+        totals.append(total)
+        for name, ms in children.items():
+            modules.setdefault(name, []).append(ms)
+    ranked = sorted(((name, statistics.median(values)) for name, values in modules.items()), key=lambda item: -item[1])
+    return {
+        "entry": entry,
+        "import_ms": round(statistics.median(totals), 1),
+        "top": [(name, round(ms, 1)) for name, ms in ranked[:top]],
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--entries", nargs="+", default=DEFAULT_ENTRIES, help="import할 모듈")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="엔트리마다 실행 횟수")
+    arg_parser.add_argument("--top", type=int, default=10, help="출력할 패키지 수")
+    arg_parser.add_argument("--output", help="결과 JSON 파일 경로. 없으면 화면에 출력")
+    args = arg_parser.parse_args()
+
+    results = []
+    for entry in args.entries:
+        result = measure(entry, args.repeat, args.top)
+        results.append(result)
+        top = ", ".join(f"{name} {ms}ms" for name, ms in result["top"][:5])
+        print(f"[INFO] {entry}: import {result['import_ms']}ms ({top})", file=sys.stderr)
+
+    output = {"python": sys.version.split()[0], "repeat": args.repeat, "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2)
+    else:
+        print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+실제 자소설닷컴 페이지 구조를 흉내 낸 합성 HTML을 만듭니다. (벤치마크용)
+
+녹화된 페이지(bench/record.py)가 없을 때, 또는 원하는 규모의 공고 수를 만들 때 쓴다.
+"""
+from datetime import datetime, timedelta
+
+
+def employment_id(index):
+    """index번째 합성 공고의 ID."""
+    return str(100000 + index)
+
+
+def deadline_for(employment_id):
+    """합성 공고의 마감 시간. ID로부터 항상 같은 값을 만든다."""
+    number = int(employment_id)
+    return datetime(2025, 4, 1, 17, 0) + timedelta(days=number % 60, hours=number % 7)
+
+
+def calendar_item(employment_id, favorite=True):
+    """달력의 .calendar-item 하나."""
+    favorite_class = "favorite" if favorite else "no-favorite"
+    return (
+        f'<div class="calendar-item {favorite_class} ng-scope" employment_id="{employment_id}" ng-repeat="e in day.list">'
+        f'<a class="company" href="/recruit/{employment_id}" ng-click="open(e)">'
+        f'<div class="company-name"><span class="ng-binding">회사 {employment_id}</span></div></a>'
+        f'<div class="type ng-binding">마감</div></div>'
+    )
+
+
+def make_month_page(favorite_ids=None, items=200, favorite_ratio=0.2, padding=3000):
+    """
+    달력 페이지와 비슷한 합성 HTML을 만듭니다. (Angular 속성과 공고 외 마크업을 섞어 크기를 키운다)
+
+    Args:
+        favorite_ids (list): 즐겨찾기 공고 ID. 주어지면 이 공고들과 같은 수의 즐겨찾기 안 한 공고를 넣는다.
+        items (int): favorite_ids가 없을 때 .calendar-item 개수.
+        favorite_ratio (float): favorite_ids가 없을 때 즐겨찾기한 공고 비율.
+        padding (int): 공고 외 마크업 블록 수.
+
+    Returns:
+        str: HTML 소스.
+    """
+    if favorite_ids is None:
+        step = max(1, round(1 / favorite_ratio)) if favorite_ratio else items + 1
+        rows = [calendar_item(employment_id(i), i % step == 0) for i in range(items)]
+    else:
+        rows = [calendar_item(id) for id in favorite_ids]
+        rows += [calendar_item(employment_id(900000 + i), False) for i in range(len(favorite_ids))]
+
+    filler = "".join(
+        f'<div class="cell ng-scope" ng-class="{{today: d.today}}"><span class="day ng-binding">{i % 31 + 1}</span>'
+        f'<img src="/img/{i}.png" ng-show="false"/></div>'
+        for i in range(padding)
+    )
+    return (
+        "<html><head><title>자소설닷컴</title></head><body ng-app='app'>"
+        "<div class='calendar-header'>2025년 4월</div>"
+        f"<div class='calendar'>{filler}{''.join(rows)}</div></body></html>"
+    )
+
+
+def make_detail_page(employment_id="100000", padding=1500):
+    """
+    공고 상세 페이지와 비슷한 합성 HTML을 만듭니다.
+
+    Returns:
+        str: HTML 소스.
+    """
+    deadline = deadline_for(employment_id)
+    filler = "".join(f'<p class="body3 ng-binding">상세 요강 {i}</p>' for i in range(padding))
+    return (
+        "<html><head><title>공고</title></head><body>"
+        f'<h1 class="header4 text-gray-900 mb-[4px]">{employment_id} 신입 채용</h1>'
+        '<div class="body5 text-gray-600"><span>2025년 3월 14일 10:00</span><span>~</span>'
+        f"<span>{deadline.year}년 {deadline.month}월 {deadline.day}일 {deadline:%H:%M}</span></div>"
+        f"<div class='content'>{filler}</div></body></html>"
+    )
@@ -0,0 +1,157 @@
+from selenium.webdriver.chrome.options import Options
+import os
+
+# perf 프로필의 기본 user-data-dir. 실행이 끝나도 남겨 두고 다음 실행에서 HTTP 캐시 등을 그대로 쓴다.
+USER_DATA_DIR = ".cache/chrome-profile"
+
+# perf 프로필에서 요청 자체를 막을 URL 패턴 (이미지, 미디어, 폰트, 광고/분석 스크립트)
+BLOCKED_URLS = [
+    # 이미지
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    # 미디어
+    "*.mp4", "*.webm", "*.mp3", "*.m4a", "*.ogg",
+    # 폰트
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # 트래커
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*facebook.net*", "*facebook.com/tr*", "*connect.facebook.net*", "*analytics.tiktok.com*",
+    "*wcs.naver.net*", "*t1.daumcdn.net/kas*", "*hotjar.com*", "*clarity.ms*", "*amplitude.com*",
+    "*channel.io*", "*criteo.com*", "*adnxs.com*",
+]
+
+
+def get_profile(profile=None):
+    """
+    사용할 크롬 프로필 이름을 반환합니다.
+
+    Args:
+        profile (str): 'default'(보이는 크롬, 모든 리소스 로딩) 또는 'perf'. 없으면 .env의 CHROME_PROFILE (기본 default).
+    """
+    profile = (profile or os.getenv("CHROME_PROFILE", "default")).lower()
+    if profile not in ("default", "perf"):
+        raise ValueError("[ERROR] CHROME_PROFILE 값이 잘못되었습니다. 'default' 또는 'perf' 중 하나를 설정하세요.")
+    return profile
+
+
+def chrome_options(profile=None, user_data_dir=None, network_log=None):
+    """
+    프로필에 맞는 크롬 옵션을 만듭니다.
+
+    perf 프로필은 헤드리스로 띄우고, 이미지를 끄고, DOM이 준비되면(eager) 페이지 로딩을 끝낸 것으로 보며,
+    디스크에 남는 user-data-dir을 다시 쓴다. 달력과 마감 시간은 Waiter가 요소를 직접 기다리므로
+    이미지나 스크립트가 모두 끝날 때까지 기다릴 필요가 없다.
+
+    Args:
+        profile (str): 'default' 또는 'perf'. 없으면 .env의 CHROME_PROFILE.
+        user_data_dir (str | bool): user-data-dir 경로. 없으면 .env의 CHROME_USER_DATA_DIR
+            (perf 프로필에서만 기본 .cache/chrome-profile), False면 쓰지 않는다. (병렬 워커는 같은 폴더를 함께 못 쓴다)
+        network_log (bool): 네트워크 응답을 performance 로그에 남길지 (XhrCapture용).
+            없으면 .env의 DATA_SOURCE가 json일 때만 켠다.
+
+    Returns:
+        selenium.webdriver.chrome.options.Options: 크롬 옵션.
+    """
+    profile = get_profile(profile)
+    options = Options()
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+
+    if user_data_dir is None:
+        user_data_dir = os.getenv("CHROME_USER_DATA_DIR") or (USER_DATA_DIR if profile == "perf" else None)
+    if user_data_dir:
+        options.add_argument(f'--user-data-dir={os.path.abspath(user_data_dir)}')
+
+    if network_log is None:
+        network_log = os.getenv("DATA_SOURCE", "dom").lower() == "json"
+    if network_log:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+    if profile == "default":
+        return options
+
+    # CHROME_HEADLESS=0이면 perf 프로필에서도 창을 띄운다 (디버깅용)
+    if os.getenv("CHROME_HEADLESS", "1") != "0":
+        options.add_argument('--headless=new')
+        # 헤드리스 기본 창은 작아서 모바일 레이아웃이 나올 수 있다
+        options.add_argument('--window-size=1280,900')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--mute-audio')
+    options.add_argument('--no-first-run')
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--disable-renderer-backgrounding')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    options.page_load_strategy = "eager"
+    return options
+
+
+def block_resources(driver, profile=None):
+    """
+    perf 프로필이면 CDP로 이미지, 미디어, 폰트, 트래커 요청을 막습니다.
+
+    Args:
+        driver (selenium.webdriver.Chrome): 크롬 드라이버.
+        profile (str): 'default' 또는 'perf'. 없으면 .env의 CHROME_PROFILE.
+    """
+    if get_profile(profile) != "perf":
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    except Exception as e:
+        print(f"[ERROR] 리소스 차단 설정 실패: {e}")
+
+
+def process_tree(pid):
+    """
+    pid 프로세스와 모든 하위 프로세스(크롬 렌더러, GPU 프로세스 등)의 RSS를 /proc에서 읽습니다. (리눅스 전용)
+
+    Args:
+        pid (int): chromedriver 프로세스 ID.
+
+    Returns:
+        dict | None: 프로세스 ID -> RSS(KB). pid부터 위에서 아래 순서. /proc가 없으면 None.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+
+    children = {}
+    rss = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/status", encoding="utf-8") as f:
+                fields = dict(line.split(":", 1) for line in f if ":" in line)
+        except OSError:
+            continue
+        child = int(entry)
+        children.setdefault(int(fields.get("PPid", "0").strip()), []).append(child)
+        rss[child] = int(fields["VmRSS"].split()[0]) if "VmRSS" in fields else 0
+
+    tree = {}
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        tree[current] = rss.get(current, 0)
+        stack.extend(children.get(current, []))
+    return tree
+
+
+def process_tree_rss_kb(pid):
+    """
+    pid 프로세스와 모든 하위 프로세스의 RSS 합계를 반환합니다. (리눅스 전용)
+
+    Args:
+        pid (int): chromedriver 프로세스 ID.
+
+    Returns:
+        int | None: RSS 합계(KB). /proc가 없으면 None.
+    """
+    tree = process_tree(pid)
+    return None if tree is None else sum(tree.values())
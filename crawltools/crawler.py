@@ -1,6 +1,15 @@
 from crawltools.fetcher import Fetcher
 from crawltools.parser import Parser
+from crawltools.fetcher_pool import FetcherPool
+from crawltools.fetch_stats import FetchStats
+from crawltools.detail_cache import DetailCache
+from crawltools.metrics import METRICS
+from crawltools.session_store import SessionStore
+from crawltools.xhr_capture import XhrCapture
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from dotenv import load_dotenv
+import hashlib
 import os
 
 START_URL = "https://jasoseol.com/recruit"
@@ -8,49 +17,508 @@ START_URL = "https://jasoseol.com/recruit"
 # .env 파일 강제 재로드
 load_dotenv(override=True)
 
+def month_start(day, offset=0):
+    """
+    day가 속한 달에서 offset개월 떨어진 달의 1일 0시를 반환합니다.
+
+    Args:
+        day (datetime): 기준 날짜.
+        offset (int): 이동할 개월 수 (음수 가능).
+
+    Returns:
+        datetime: 해당 달의 1일.
+    """
+    month = day.month - 1 + offset
+    return datetime(day.year + month // 12, month % 12 + 1, 1)
+
+
 class Crawler:
-    def __init__(self):
-        self.fetcher = Fetcher()
+    def __init__(self, fetcher=None, scheduler=None):
+        """
+        Args:
+            fetcher (Fetcher): 사용할 Fetcher. 없으면 새 크롬 드라이버를 띄운다. (벤치마크에서는 녹화된 페이지를 돌려주는 가짜를 넣는다)
+            scheduler (FetchScheduler): 주어지면 HTTP 상세 페이지를 스케줄러의 연결 풀과 호스트별 제한으로 가져온다.
+        """
+        self.fetcher = fetcher or Fetcher()
+        self.http_fetcher = None
+        self.scheduler = scheduler
+        self.stats = FetchStats()
+        self.cache = DetailCache()
+        # 마지막으로 크롤링한 기간 (시작 datetime, 끝 datetime)
+        self.window = None
+        # 이 드라이버로 로그인을 마쳤는지 (데몬처럼 여러 번 크롤링할 때 다시 로그인하지 않기 위해)
+        self.logged_in = False
+        # DATA_SOURCE=json이면 달력 API 응답(JSON)을 먼저 쓰고, 응답이 없을 때만 DOM을 파싱한다
+        self.capture = XhrCapture(self.fetcher) if os.getenv("DATA_SOURCE", "dom").lower() == "json" else None
+        # 달력 API 응답에 있던 마감 시간 (공고 ID -> (마감 시간, subtitle))
+        self.json_details = {}
+        # 크롤링 중 새 공고를 찾을 때마다 부를 함수와, 이미 알린 공고 ID (get_all_stars의 on_found)
+        self.on_found = None
+        self.emitted = set()
+        # FetcherPool 워커의 Fetcher를 만드는 함수. None이면 크롬 드라이버를 띄운다 (벤치마크에서 가짜를 넣는다)
+        self.worker_factory = None
 
-    def get_all_stars(self):
-        print(f"\n시작 URL: {START_URL}")
+    def login(self):
+        """
+        자소설닷컴에 로그인하고 달력 페이지 HTML을 반환합니다.
+
+        이미 로그인한 드라이버라면 페이지만 다시 엽니다.
+        저장된 로그인 세션이 있으면 먼저 복원해 보고, 만료되었을 때만 전체 로그인 과정을 거칩니다.
+
+        Returns:
+            str: 로그인 후의 HTML 소스.
+        """
+        if self.logged_in:
+            html = self.fetcher.reload_if_logged_in(START_URL)
+            if html is not None:
+                return html
+            print("[INFO] 로그인이 풀려 다시 로그인합니다.")
+            self.logged_in = False
 
         # .env에서 LOGIN_METHOD 값 읽기
         login_method = os.getenv("LOGIN_METHOD", "general").lower()  # 기본값은 "kakao"
+        account = os.getenv("KAKAO_ID") if login_method == "kakao" else os.getenv("USER_ID")
+        store = SessionStore(login_method, account)
+
+        # 저장된 세션으로 로그인 시도
+        session = store.load()
+        if session:
+            with METRICS.span("login", method="session"):
+                html = self.fetcher.restore_session(START_URL, session)
+            if html is not None:
+                print("[INFO] 저장된 로그인 세션 사용")
+                self.logged_in = True
+                return html
+            print("[INFO] 저장된 로그인 세션이 만료되어 다시 로그인합니다.")
+            store.clear()
 
         # Selenium으로 HTML 가져오기
         if login_method == "kakao":
             print("[INFO] 카카오 로그인")
-            html = self.fetcher.selenium_with_kakao_login(
-                START_URL, os.getenv("KAKAO_ID"), os.getenv("KAKAO_PW")
-            )
+            with METRICS.span("login", method=login_method):
+                html = self.fetcher.selenium_with_kakao_login(
+                    START_URL, os.getenv("KAKAO_ID"), os.getenv("KAKAO_PW")
+                )
         elif login_method == "general":
             print("[INFO] 일반 로그인")
-            html = self.fetcher.selenium_with_login(
-                START_URL, os.getenv("USER_ID"), os.getenv("USER_PW")
-            )
+            with METRICS.span("login", method=login_method):
+                html = self.fetcher.selenium_with_login(
+                    START_URL, os.getenv("USER_ID"), os.getenv("USER_PW")
+                )
         else:
             raise ValueError("[ERROR] LOGIN_METHOD 값이 잘못되었습니다. 'kakao' 또는 'general' 중 하나를 설정하세요.")
 
-        # HTML 파싱
-        results = Parser.calendar(html)
+        # 다음 실행에서 로그인을 건너뛸 수 있도록 세션 저장
+        if html is not None:
+            store.save(self.fetcher.get_cookies(), self.fetcher.get_local_storage())
+            self.logged_in = True
+        return html
+
+    def get_all_stars(self, months_ahead=None, months_back=None, empty_stop=None, on_found=None):
+        """
+        로그인 후 달력을 한 달씩 넘기면서 즐겨찾기한 공고를 모읍니다.
+
+        이번 달부터 앞으로 months_ahead개월, 필요하면 지난 months_back개월까지 보고,
+        즐겨찾기한 공고가 없는 달이 empty_stop번 연속되면 그 방향의 크롤링을 멈춥니다.
+        여러 달에 걸쳐 나오는 공고는 처음 나온 달에서만 파싱합니다.
+
+        Args:
+            months_ahead (int): 이번 달 이후 볼 개월 수. 없으면 .env의 CRAWL_MONTHS_AHEAD (기본 1).
+            months_back (int): 이번 달 이전 볼 개월 수. 없으면 .env의 CRAWL_MONTHS_BACK (기본 0).
+            empty_stop (int): 빈 달이 몇 번 연속되면 멈출지. 없으면 .env의 CRAWL_EMPTY_STOP (기본 0, 멈추지 않음).
+            on_found (callable): 한 달을 파싱할 때마다 새로 찾은 공고 dict를 받아 부를 함수.
+                크롤링이 끝나기 전에 다음 단계를 시작할 때 쓴다. (pipeline.py)
+
+        Returns:
+            dict: 공고 ID -> {"company_name", "link"}
+        """
+        if months_ahead is None:
+            months_ahead = int(os.getenv("CRAWL_MONTHS_AHEAD", "1"))
+        if months_back is None:
+            months_back = int(os.getenv("CRAWL_MONTHS_BACK", "0"))
+        if empty_stop is None:
+            empty_stop = int(os.getenv("CRAWL_EMPTY_STOP", "0"))
+
+        print(f"\n시작 URL: {START_URL}")
+
+        html = self.login()
+        if html is not None:
+            self.remember_session()
+
+        # 이번 달 파싱
+        results = {}
+        self.json_details = {}
+        self.on_found = on_found
+        self.emitted = set()
+        parsed = self.capture.calendar() if self.capture else None
+        if parsed is not None:
+            self.merge_json(results, parsed)
+        else:
+            self.merge_month(results, html)
+        self.emit_found(results)
 
-        # 다음 달 HTML 가져오기
-        html = self.fetcher.selenium_next_page()
+        # 지난 달들: 한 달씩 뒤로 가며 파싱한 뒤 이번 달로 돌아온다
+        first = self.crawl_months(results, -1, months_back, empty_stop)
+        for _ in range(-first):
+            self.fetcher.selenium_next_page()
 
-        # HTML 파싱
-        next_results = Parser.calendar(html)
+        # 다음 달들: 한 달씩 앞으로 가며 파싱
+        last = self.crawl_months(results, 1, months_ahead, empty_stop)
 
-        for id, nresult in next_results.items():
-            results[id] = nresult
+        # 실제로 크롤링한 기간
+        today = datetime.now()
+        self.window = (month_start(today, first), month_start(today, last + 1))
 
         print(f"파싱 결과: ")
         print(*results.values(), sep="\n")
         return results
 
-    def add_times(self, posts, ids):
+    def crawl_months(self, results, step, count, empty_stop):
+        """
+        달력을 step 방향으로 최대 count번 넘기면서 각 달을 바로 파싱해 results에 더합니다.
+
+        Returns:
+            int: 마지막으로 파싱한 달의 이번 달 기준 offset.
+        """
+        offset = 0
+        empty_months = 0
+        for _ in range(count):
+            found = self.load_month(results, step)
+            if found is None and self.recover(offset):
+                found = self.load_month(results, step)
+            if found is None:
+                break
+            offset += step
+            self.emit_found(results)
+
+            if found:
+                empty_months = 0
+            else:
+                empty_months += 1
+                if empty_stop and empty_months >= empty_stop:
+                    print(f"[INFO] 즐겨찾기한 공고가 없는 달이 {empty_months}번 연속되어 크롤링을 멈춥니다.")
+                    break
+        return offset
+
+    def window_for(self, key):
+        """
+        공고 키가 자소설닷컴 공고면 마지막으로 크롤링한 기간을 반환합니다. 동기화 모드는 이 기간 안의 공고만 지운다.
+
+        Returns:
+            tuple | None: (시작, 끝). 다른 사이트(sources/)의 공고면 None.
+        """
+        return self.window if ":" not in str(key) else None
+
+    def reset_login(self):
+        """다음 크롤링에서 로그인 상태부터 다시 확인하게 합니다."""
+        self.logged_in = False
+
+    def reset_stats(self):
+        """대기 시간과 백엔드별 처리량 기록을 비웁니다. 데몬처럼 크롤러를 재사용하면 크롤링마다 부른다."""
+        self.fetcher.waiter.timings = []
+        self.stats = FetchStats()
+
+    def report(self):
+        """단계별 대기 시간, 백엔드별 처리량, 캐시 통계를 출력합니다."""
+        self.fetcher.waiter.report()
+        self.stats.report()
+        self.cache.report()
+
+    def close(self):
+        if self.http_fetcher is not None:
+            self.http_fetcher.close()
+        self.fetcher.close_driver()
+
+    def remember_session(self):
+        """크롬이 멈춰 드라이버를 새로 띄울 때 복원할 로그인 세션을 Watchdog에 넘깁니다."""
+        watchdog = getattr(self.fetcher, "watchdog", None)
+        if watchdog is None:
+            return
+        try:
+            watchdog.remember(START_URL, {
+                "cookies": self.fetcher.get_cookies(),
+                "local_storage": self.fetcher.get_local_storage(),
+            })
+        except Exception as e:
+            print(f"[ERROR] 로그인 세션 기억 실패: {e}")
+
+    def recover(self, offset):
+        """
+        크롬이 멈춰서 달을 넘기지 못했으면 새 드라이버로 바꾸고, 로그인 세션을 복원한 뒤 offset 달로 돌아갑니다.
+
+        Args:
+            offset (int): 마지막으로 파싱한 달의 이번 달 기준 offset.
+
+        Returns:
+            bool: 복구해서 다음 달을 다시 시도할 수 있으면 True.
+        """
+        watchdog = getattr(self.fetcher, "watchdog", None)
+        if watchdog is None or not watchdog.hung:
+            return False
+        if not watchdog.recycle("hung"):
+            # 기억해 둔 세션이 만료되었으면 다시 로그인
+            self.logged_in = False
+            if self.login() is None:
+                return False
+            self.remember_session()
+        if self.capture:
+            self.capture.clear()
+
+        # 새 드라이버는 이번 달 달력에서 시작한다
+        step = 1 if offset > 0 else -1
+        for _ in range(abs(offset)):
+            if self.fetcher.selenium_move_month(step) is None:
+                return False
+        print(f"[INFO] 새 드라이버로 {offset:+d}개월 달력까지 돌아왔습니다.")
+        return True
+
+    def emit_found(self, results):
+        """on_found가 있으면 아직 알리지 않은 공고를 넘깁니다."""
+        if self.on_found is None:
+            return
+        new_posts = {id: post for id, post in results.items() if id not in self.emitted}
+        if new_posts:
+            self.emitted.update(new_posts)
+            self.on_found(new_posts)
+
+    def load_month(self, results, step):
+        """
+        달력을 step 방향으로 한 달 넘기고 그 달의 공고를 results에 더합니다.
+
+        DATA_SOURCE=json이면 새 달이 화면에 다 그려질 때까지 기다리지 않고 달력 API 응답을 바로 쓰고,
+        응답이 오지 않을 때만 화면이 그려지길 기다려 DOM을 파싱합니다.
+
+        Returns:
+            bool | None: 이 달에 즐겨찾기한 공고가 있었는지. 달을 넘기지 못했으면 None.
+        """
+        if self.capture is None:
+            with METRICS.span("month_page_load"):
+                html = self.fetcher.selenium_move_month(step)
+            return None if html is None else self.merge_month(results, html)
+
+        # 앞에서 쌓인 응답을 새 달의 응답으로 착각하지 않도록 비운다
+        self.capture.clear()
+        with METRICS.span("month_page_load", source="json"):
+            snapshot = self.fetcher.click_month(step)
+            parsed = None if snapshot is None else self.capture.wait_calendar(self.fetcher.waiter, set(results))
+        if snapshot is None:
+            return None
+        if parsed is not None:
+            return self.merge_json(results, parsed)
+
+        print("[INFO] 달력 API 응답이 없어 화면을 파싱합니다.")
+        with METRICS.span("month_page_load"):
+            html = self.fetcher.wait_month(snapshot)
+        return None if html is None else self.merge_month(results, html)
+
+    def merge_json(self, results, parsed):
+        """
+        달력 API 응답에서 뽑은 한 달의 공고를 results에 더하고, 응답에 있던 마감 시간을 기억해 둡니다.
+
+        Args:
+            parsed (tuple): JsonParser.calendar의 결과.
+
+        Returns:
+            bool: 이 달에 즐겨찾기한 공고가 하나라도 있었는지.
+        """
+        month_results, details = parsed
+        METRICS.inc("pages_fetched", kind="month_json")
+        for id, result in month_results.items():
+            if result is not None:
+                results[id] = result
+        self.json_details.update(details)
+        return bool(month_results)
+
+    @staticmethod
+    def merge_month(results, html):
+        """
+        한 달의 HTML을 파싱해 새 공고만 results에 더합니다. 이미 나온 공고는 다시 파싱하지 않는다.
+
+        Returns:
+            bool: 이 달에 즐겨찾기한 공고가 하나라도 있었는지.
+        """
+        METRICS.inc("pages_fetched", kind="month")
+        METRICS.inc("html_bytes", len(html), kind="month")
+        month_results = Parser.calendar(html, set(results))
+        for id, result in month_results.items():
+            if result is not None:
+                results[id] = result
+        return bool(month_results)
+
+    def parse_detail(self, id, html):
+        """
+        상세 페이지 HTML을 파싱합니다. 마감 시간 부분이 캐시에 저장된 것과 같으면 파싱하지 않고 캐시 결과를 쓴다.
+
+        Returns:
+            tuple | None: (마감 시간, subtitle). 마감 시간을 찾지 못하면 None.
+        """
+        fragment = Parser.detail_fragment(html)
+        fragment_hash = hashlib.sha256(fragment.encode()).hexdigest() if fragment else None
+        if fragment_hash:
+            cached = self.cache.get_by_hash(id, fragment_hash)
+            if cached is not None:
+                return cached
+
+        ext = Parser.extract_exp_time(html)
+        # 마감 시간을 찾은 결과만 캐시 (로딩이 덜 된 페이지를 저장하지 않도록)
+        if ext and ext[0] and fragment_hash:
+            self.cache.put(id, ext, fragment_hash)
+        return ext
+
+    def detail_html(self, fetcher, id):
+        """
+        브라우저로 공고 상세 페이지 HTML을 가져옵니다.
+
+        Returns:
+            str | None: HTML 소스. 페이지 로딩에 실패하면 None.
+        """
+        with METRICS.span("detail_fetch", backend="selenium"):
+            html = fetcher.fetch_with_selenium(f"{START_URL}/{id}")
+        if html is None:
+            return None
+        self.stats.add_pages("selenium")
+        METRICS.inc("pages_fetched", kind="detail", backend="selenium")
+        METRICS.inc("html_bytes", len(html), kind="detail", backend="selenium")
+        return html
+
+    def detail_html_http(self, id):
+        """
+        HTTP로 공고 상세 페이지 HTML을 가져옵니다.
+
+        Returns:
+            str | None: HTML 소스. 요청에 실패하면 None.
+        """
+        with METRICS.span("detail_fetch", backend="http"):
+            html = self.get_http_fetcher().fetch(f"{START_URL}/{id}")
+        if html is None:
+            return None
+        self.stats.add_pages("http")
+        METRICS.inc("pages_fetched", kind="detail", backend="http")
+        METRICS.inc("html_bytes", len(html), kind="detail", backend="http")
+        return html
+
+    def fetch_detail(self, fetcher, id):
+        """
+        브라우저로 공고 상세 페이지를 가져와 (마감 시간, subtitle)을 반환합니다.
+
+        Returns:
+            tuple | None: 파싱 결과. 페이지 로딩에 실패하면 None.
+        """
+        html = self.detail_html(fetcher, id)
+        if html is None:
+            return None
+        return self.parse_detail(id, html) or (None, None)
+
+    def fetch_details_browser(self, ids, workers, on_result=None):
+        """
+        브라우저로 여러 공고의 상세 페이지를 가져옵니다.
+        workers가 2 이상이면 FetcherPool로 나눠서 가져오고, 워커가 끝내 처리하지 못한 공고는 메인 드라이버로 마저 처리한다.
+
+        Args:
+            ids (list): 공고 ID 목록.
+            workers (int): 병렬 워커 수.
+            on_result (callable): 주어지면 공고 하나를 처리할 때마다 on_result(공고 ID, 결과)를 부른다. (워커 스레드에서 불릴 수 있다)
+
+        Returns:
+            dict: 공고 ID -> (마감 시간, subtitle). 페이지 로딩에 실패한 공고는 None.
+        """
+        results = {}
+        with self.stats.measure("selenium"):
+            if workers > 1 and len(ids) > 1:
+                print(f"[INFO] 상세 페이지 병렬 수집 (워커 {workers}개)")
+                pool = FetcherPool(workers, self.fetcher.get_cookies(), START_URL, self.worker_factory)
+                pool_results, failed = pool.run(self.fetch_detail, ids, on_result)
+                results.update(pool_results)
+                self.fetcher.waiter.timings.extend(pool.wait_timings)
+
+                # 워커가 끝내 처리하지 못한 공고는 메인 드라이버로 마저 처리
+                for id in failed:
+                    print(f"[INFO] 메인 드라이버로 재시도: {id}")
+                    results[id] = self.fetch_detail(self.fetcher, id)
+                    if on_result is not None:
+                        on_result(id, results[id])
+            else:
+                for id in ids:
+                    results[id] = self.fetch_detail(self.fetcher, id)
+                    if on_result is not None:
+                        on_result(id, results[id])
+        return results
+
+    def fetch_detail_http(self, id):
+        """
+        HTTP로 공고 상세 페이지를 가져와 (마감 시간, subtitle)을 반환합니다.
+
+        Returns:
+            tuple | None: 파싱 결과. 요청에 실패했거나 HTML에 마감 시간이 없으면 None (브라우저로 다시 가져와야 함).
+        """
+        html = self.detail_html_http(id)
+        if html is None:
+            return None
+        return self.parse_detail(id, html)
+
+    def get_http_fetcher(self):
+        """Selenium 세션의 쿠키를 공유하는 HttpFetcher를 만들어 재사용합니다."""
+        if self.http_fetcher is None:
+            cookies = self.fetcher.get_cookies()
+            user_agent = self.fetcher.driver.execute_script("return navigator.userAgent")
+            if self.scheduler is not None:
+                from crawltools.scheduler import SharedHttpFetcher
+                self.http_fetcher = SharedHttpFetcher(self.scheduler, cookies, user_agent)
+            else:
+                # requests는 DETAIL_BACKEND=http일 때만 필요하므로 처음 쓸 때 불러온다
+                from crawltools.http_fetcher import HttpFetcher
+                self.http_fetcher = HttpFetcher(cookies, user_agent)
+        return self.http_fetcher
+
+    def add_times(self, posts, ids, workers=None, backend=None):
+        """
+        새 공고들의 상세 페이지에서 마감 시간과 subtitle을 가져와 posts에 채웁니다.
+
+        Args:
+            posts (dict): 크롤링된 공고 데이터.
+            ids (set): 상세 정보를 가져올 공고 ID 집합.
+            workers (int): 병렬 워커 수. 없으면 .env의 DETAIL_WORKERS (기본 1, 순차 처리).
+            backend (str): 'selenium' 또는 'http'. 없으면 .env의 DETAIL_BACKEND (기본 'selenium').
+                'http'는 HTTP로 먼저 가져오고, 마감 시간이 없는 페이지만 브라우저로 다시 가져온다.
+        """
+        if workers is None:
+            workers = int(os.getenv("DETAIL_WORKERS", "1"))
+        if backend is None:
+            backend = os.getenv("DETAIL_BACKEND", "selenium").lower()
+        if backend not in ("selenium", "http"):
+            raise ValueError("[ERROR] DETAIL_BACKEND 값이 잘못되었습니다. 'selenium' 또는 'http' 중 하나를 설정하세요.")
+
+        # 결과는 항상 같은 순서로 posts에 반영
+        ids = sorted(ids, key=lambda id: (len(id), id))
+
+        # 0. 달력 API 응답에 마감 시간이 있었거나, TTL 안에 가져온 결과가 캐시에 있으면 페이지를 가져오지 않음
+        results = {}
+        for id in ids:
+            cached = self.json_details.get(id) or self.cache.get(id)
+            if cached is not None:
+                results[id] = cached
+        fetch_ids = [id for id in ids if id not in results]
+
+        # 1. HTTP로 먼저 가져오기
+        if backend == "http" and fetch_ids:
+            http_workers = int(os.getenv("HTTP_WORKERS", "8"))
+            fetched = 0
+            with self.stats.measure("http"), ThreadPoolExecutor(http_workers) as executor:
+                for id, ext in zip(fetch_ids, executor.map(self.fetch_detail_http, fetch_ids)):
+                    if ext is not None:
+                        results[id] = ext
+                        fetched += 1
+            print(f"[INFO] HTTP로 가져온 공고: {fetched}/{len(fetch_ids)}")
+
+        # 2. 나머지는 브라우저로 가져오기
+        remaining = [id for id in fetch_ids if id not in results]
+        results.update(self.fetch_details_browser(remaining, workers))
+
+        # 상세 페이지를 열며 쌓인 네트워크 로그는 쓰지 않으므로 버린다
+        if self.capture and remaining:
+            self.capture.clear()
+
         for id in ids:
-            html = self.fetcher.fetch_with_selenium(f"{START_URL}/{id}")
-            ext = Parser.extract_exp_time(html)
+            ext = results.get(id) or (None, None)
             posts[id]["date"] = ext[0]
-            posts[id]["subtitle"] = ext[1]
\ No newline at end of file
+            posts[id]["subtitle"] = ext[1]
@@ -0,0 +1,142 @@
+from datetime import datetime
+from crawltools.metrics import METRICS
+import os
+import sqlite3
+import threading
+import time
+
+# 캐시 DB 경로와 기본 설정
+CACHE_PATH = ".cache/detail_cache.db"
+DEFAULT_TTL = 6 * 60 * 60   # 6시간
+DEFAULT_MAX_SIZE = 2000     # 최대 공고 수
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS details (
+    employment_id TEXT PRIMARY KEY,
+    deadline TEXT,
+    subtitle TEXT,
+    fragment_hash TEXT,
+    fetched_at REAL,
+    last_access REAL
+);
+CREATE INDEX IF NOT EXISTS details_last_access ON details (last_access);
+"""
+
+
+class DetailCache:
+    """
+    공고 상세 페이지의 파싱 결과(마감 시간, subtitle)를 디스크(SQLite)에 캐시합니다.
+
+    - TTL 안에 가져온 결과가 있으면 페이지를 다시 가져오지 않는다.
+    - TTL이 지났어도 마감 시간 부분 HTML의 해시가 같으면 다시 파싱하지 않는다.
+    - 최대 개수를 넘으면 가장 오래 쓰지 않은 공고부터 지운다. (LRU)
+
+    히트/미스/해시 히트/삭제 횟수를 stats에 기록합니다. 여러 워커 스레드에서 함께 쓸 수 있습니다.
+    """
+
+    def __init__(self, path=None, ttl=None, max_size=None):
+        """
+        Args:
+            path (str): DB 파일 경로. 없으면 .env의 DETAIL_CACHE_PATH (기본 .cache/detail_cache.db).
+            ttl (float): 결과를 그대로 쓸 시간(초). 없으면 .env의 DETAIL_CACHE_TTL (기본 6시간, 0이면 항상 다시 가져옴).
+            max_size (int): 최대 공고 수. 없으면 .env의 DETAIL_CACHE_SIZE (기본 2000).
+        """
+        self.path = path or os.getenv("DETAIL_CACHE_PATH", CACHE_PATH)
+        self.ttl = ttl if ttl is not None else float(os.getenv("DETAIL_CACHE_TTL", DEFAULT_TTL))
+        self.max_size = max_size if max_size is not None else int(os.getenv("DETAIL_CACHE_SIZE", DEFAULT_MAX_SIZE))
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self.stats = {"hits": 0, "misses": 0, "hash_hits": 0, "evictions": 0}
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def _to_result(row):
+        deadline, subtitle = row
+        return (datetime.fromisoformat(deadline) if deadline else None), subtitle
+
+    def get(self, employment_id):
+        """
+        TTL 안에 저장된 결과를 반환합니다.
+
+        Returns:
+            tuple | None: (마감 시간 datetime, subtitle). 없거나 오래되었으면 None.
+        """
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT deadline, subtitle FROM details WHERE employment_id = ? AND fetched_at >= ?",
+                (employment_id, now - self.ttl),
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                METRICS.inc("cache_misses")
+                return None
+            self.stats["hits"] += 1
+            METRICS.inc("cache_hits")
+            with self.conn:
+                self.conn.execute("UPDATE details SET last_access = ? WHERE employment_id = ?", (now, employment_id))
+        return self._to_result(row)
+
+    def get_by_hash(self, employment_id, fragment_hash):
+        """
+        마감 시간 부분 HTML의 해시가 저장된 것과 같으면 저장된 결과를 반환하고 TTL을 새로 시작합니다.
+
+        Returns:
+            tuple | None: (마감 시간 datetime, subtitle). 해시가 다르면 None.
+        """
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT deadline, subtitle FROM details WHERE employment_id = ? AND fragment_hash = ?",
+                (employment_id, fragment_hash),
+            ).fetchone()
+            if row is None:
+                return None
+            self.stats["hash_hits"] += 1
+            METRICS.inc("cache_hash_hits")
+            with self.conn:
+                self.conn.execute(
+                    "UPDATE details SET fetched_at = ?, last_access = ? WHERE employment_id = ?",
+                    (now, now, employment_id),
+                )
+        return self._to_result(row)
+
+    def put(self, employment_id, result, fragment_hash):
+        """
+        파싱 결과를 저장하고, 최대 개수를 넘으면 오래 쓰지 않은 공고부터 지웁니다.
+
+        Args:
+            employment_id (str): 공고 ID.
+            result (tuple): (마감 시간 datetime, subtitle).
+            fragment_hash (str): 마감 시간 부분 HTML의 해시.
+        """
+        deadline, subtitle = result
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO details VALUES (?, ?, ?, ?, ?, ?)",
+                (employment_id, deadline.isoformat() if deadline else None, subtitle, fragment_hash, now, now),
+            )
+            count = self.conn.execute("SELECT COUNT(*) FROM details").fetchone()[0]
+            if count > self.max_size:
+                self.conn.execute(
+                    "DELETE FROM details WHERE employment_id IN "
+                    "(SELECT employment_id FROM details ORDER BY last_access LIMIT ?)",
+                    (count - self.max_size,),
+                )
+                self.stats["evictions"] += count - self.max_size
+                METRICS.inc("cache_evictions", count - self.max_size)
+
+    def report(self):
+        """캐시 히트/미스/삭제 횟수를 출력합니다."""
+        stats = self.stats
+        print(
+            f"[INFO] 상세 페이지 캐시: 히트 {stats['hits']}, 미스 {stats['misses']}, "
+            f"해시 히트(파싱 생략) {stats['hash_hits']}, 삭제 {stats['evictions']}"
+        )
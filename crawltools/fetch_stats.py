@@ -0,0 +1,49 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class FetchStats:
+    """
+    Fetcher 백엔드별 처리량을 기록합니다.
+
+    구간 단위로 가져온 페이지 수, 걸린 시간, 이 프로세스가 쓴 CPU 시간을 모아
+    초당 페이지 수와 페이지당 CPU 시간을 계산합니다. (Chrome 프로세스의 CPU는 포함되지 않는다)
+    """
+
+    def __init__(self):
+        self.backends = {}
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, backend):
+        """
+        with 블록 동안의 시간과 CPU를 backend에 더합니다. 블록 안에서 add_pages로 페이지 수를 센다.
+
+        Args:
+            backend (str): 백엔드 이름 ('selenium', 'http' 등).
+        """
+        start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            with self.lock:
+                entry = self._entry(backend)
+                entry["seconds"] += time.perf_counter() - start
+                entry["cpu"] += time.process_time() - cpu_start
+
+    def add_pages(self, backend, count=1):
+        with self.lock:
+            self._entry(backend)["pages"] += count
+
+    def _entry(self, backend):
+        return self.backends.setdefault(backend, {"pages": 0, "seconds": 0.0, "cpu": 0.0})
+
+    def report(self):
+        """백엔드별 초당 페이지 수와 페이지당 CPU 시간을 출력합니다."""
+        for backend, entry in self.backends.items():
+            if not entry["pages"]:
+                continue
+            rate = entry["pages"] / entry["seconds"] if entry["seconds"] else 0.0
+            cpu = entry["cpu"] / entry["pages"] * 1000
+            print(f"[INFO] {backend}: {entry['pages']}페이지, {rate:.2f}페이지/초, 페이지당 CPU {cpu:.1f}ms")
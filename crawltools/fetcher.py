@@ -1,40 +1,220 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (
+    InvalidSessionIdException, NoSuchElementException, NoSuchWindowException, TimeoutException, WebDriverException
+)
 from selenium import webdriver
-import time
+from crawltools.waits import Waiter
+from crawltools.chrome_profile import block_resources, chrome_options, get_profile, process_tree_rss_kb
+from crawltools.retry import retry_call
+from crawltools.watchdog import Watchdog
 import atexit
+import os
+
+# 페이지 로딩 최대 시도 횟수 (.env의 PAGE_ATTEMPTS)
+DEFAULT_PAGE_ATTEMPTS = 3
+
+
+def is_page_retryable(error):
+    """다시 열어 볼 만한 페이지 로딩 오류인지 확인합니다. 드라이버 세션이나 창이 없어졌으면 다시 시도하지 않는다."""
+    return isinstance(error, WebDriverException) and not isinstance(
+        error, (InvalidSessionIdException, NoSuchWindowException)
+    )
+
 
 class Fetcher:
-    def __init__(self, timeout=5):
+    def __init__(self, timeout=5, wait_timeouts=None, profile=None, user_data_dir=None, network_log=None):
+        """
+        Args:
+            timeout (int): 기본 대기 시간(초).
+            wait_timeouts (dict): 단계별 대기 시간. Waiter 참고.
+            profile (str): 크롬 프로필 ('default' 또는 'perf'). 없으면 .env의 CHROME_PROFILE.
+            user_data_dir (str | bool): 크롬 user-data-dir. chrome_options 참고.
+            network_log (bool): 네트워크 응답을 performance 로그에 남길지. chrome_options 참고.
+        """
         self.timeout = timeout
-        chrome_options = Options()
-        # chrome_options.add_argument('--headless')  # 필요 시 사용
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
+        self.profile = get_profile(profile)
+        self.user_data_dir = user_data_dir
+        self.network_log = network_log
 
-        self.driver_service = Service("./chromedriver/chromedriver")
-        self.driver = webdriver.Chrome(service=self.driver_service, options=chrome_options)
+        self.driver = None
+        self.waiter = Waiter(None, wait_timeouts)
+        # 페이지 로딩 타임아웃, 멈춘 드라이버 교체, 페이지 수/메모리 한도에 따른 재시작
+        self.watchdog = Watchdog(self)
+        self.start_driver()
 
         # 프로그램 종료 시 자동으로 드라이버 종료
         atexit.register(self.close_driver)
 
+    def start_driver(self):
+        """크롬 드라이버를 띄웁니다. Waiter와 XhrCapture는 이 Fetcher를 통해 새 드라이버를 쓴다."""
+        self.driver_service = Service("./chromedriver/chromedriver")
+        self.driver = webdriver.Chrome(
+            service=self.driver_service, options=chrome_options(self.profile, self.user_data_dir, self.network_log)
+        )
+        block_resources(self.driver, self.profile)
+        self.watchdog.configure(self.driver)
+        self.waiter.driver = self.driver
+
+    def restart_driver(self, kill=False):
+        """
+        드라이버를 닫고 새로 띄웁니다.
+
+        Args:
+            kill (bool): True면 이미 강제로 종료된 드라이버로 보고 quit()을 부르지 않는다. (멈춘 드라이버에 부르면 또 막힌다)
+        """
+        if kill:
+            self.driver = None
+        else:
+            try:
+                self.close_driver()
+            except Exception as e:
+                print(f"[ERROR] 드라이버 종료 실패: {e}")
+                self.driver = None
+        self.start_driver()
+
     def close_driver(self):
         if self.driver:
             self.driver.quit()
             self.driver = None
             print("[INFO] Selenium 드라이버 종료")
 
+    def chrome_pid(self):
+        """chromedriver 프로세스 ID를 반환합니다. 알 수 없으면 None."""
+        process = getattr(self.driver_service, "process", None)
+        return process.pid if process else None
+
+    def guard(self):
+        """페이지 이동을 Watchdog으로 감시하는 with 블록을 반환합니다."""
+        return self.watchdog.navigation()
+
+    def chrome_rss_kb(self):
+        """
+        chromedriver와 크롬 프로세스 전체의 메모리 사용량(RSS, KB)을 반환합니다. 알 수 없으면 None.
+        """
+        pid = self.chrome_pid()
+        return process_tree_rss_kb(pid) if pid else None
+
     def fetch_with_selenium(self, url):
+        """
+        페이지를 열고 마감 시간이 나올 때까지 기다린 뒤 HTML을 반환합니다.
+        네트워크 오류나 페이지 로딩 타임아웃이면 지수 백오프로 PAGE_ATTEMPTS번까지 다시 연다.
+        크롬이 멈춰서 Watchdog이 강제로 종료했으면 새 드라이버로 다시 연다.
+
+        Returns:
+            str | None: HTML 소스. 끝내 로딩에 실패하면 None.
+        """
         try:
-            self.driver.get(url)
-            time.sleep(3)
-            return self.driver.page_source
+            return retry_call(
+                self.load_page, url, attempts=int(os.getenv("PAGE_ATTEMPTS", DEFAULT_PAGE_ATTEMPTS)),
+                retryable=self.is_retryable, name="페이지 로딩",
+            )
         except Exception as e:
             print(f"[ERROR] 페이지 로딩 실패: {e}")
             return None
 
+    def load_page(self, url):
+        # 멈췄거나 페이지 수/메모리 한도를 넘은 드라이버는 여기서 새로 띄운다
+        self.watchdog.check()
+        with self.guard():
+            self.driver.get(url)
+            self.waiter.deadline_present()
+            return self.driver.page_source
+
+    def is_retryable(self, error):
+        return self.watchdog.hung or is_page_retryable(error)
+
+    def get_cookies(self):
+        """
+        현재 드라이버의 쿠키 목록을 반환합니다. (로그인 세션 공유용)
+
+        Returns:
+            list: Selenium 쿠키 딕셔너리 목록.
+        """
+        return self.driver.get_cookies()
+
+    def add_cookies(self, url, cookies):
+        """
+        다른 드라이버에서 가져온 쿠키를 현재 드라이버에 넣어 로그인 세션을 공유합니다.
+
+        Args:
+            url (str): 쿠키 도메인에 해당하는 페이지 URL.
+            cookies (list): Selenium 쿠키 딕셔너리 목록.
+        """
+        # 쿠키는 같은 도메인 페이지에 있어야 추가할 수 있다
+        self.driver.get(url)
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception as e:
+                print(f"[ERROR] 쿠키 추가 실패 ({cookie.get('name')}): {e}")
+
+    def get_local_storage(self):
+        """
+        현재 페이지의 localStorage 내용을 반환합니다.
+
+        Returns:
+            dict: localStorage 키/값.
+        """
+        return self.driver.execute_script(
+            "var items = {};"
+            "for (var i = 0; i < localStorage.length; i++) {"
+            "  var key = localStorage.key(i); items[key] = localStorage.getItem(key);"
+            "}"
+            "return items;"
+        )
+
+    def is_logged_in(self):
+        """
+        현재 페이지가 로그인된 상태인지 확인합니다. 달력이 그려진 뒤 로그인 버튼이 보이지 않으면 로그인 상태로 본다.
+
+        Returns:
+            bool: 로그인 여부.
+        """
+        self.waiter.calendar_rendered()
+        buttons = self.driver.find_elements(By.CSS_SELECTOR, ".sign-in-button.btn")
+        return not any(button.is_displayed() for button in buttons)
+
+    def reload_if_logged_in(self, url):
+        """
+        이미 로그인한 드라이버로 페이지를 다시 열고, 로그인 상태가 유지되고 있으면 HTML을 반환합니다.
+
+        Returns:
+            str | None: HTML 소스. 로그인이 풀렸거나 로딩에 실패하면 None.
+        """
+        try:
+            self.driver.get(url)
+            if self.is_logged_in():
+                return self.driver.page_source
+        except Exception as e:
+            print(f"[ERROR] 페이지 다시 열기 실패: {e}")
+        return None
+
+    def restore_session(self, url, session):
+        """
+        저장해 둔 쿠키와 localStorage를 넣고 페이지를 다시 열어 로그인 상태를 복원합니다.
+
+        Args:
+            url (str): 세션을 복원할 페이지 URL.
+            session (dict): SessionStore.load()가 반환한 세션.
+
+        Returns:
+            str | None: 로그인 상태가 확인되면 HTML 소스, 세션이 만료되었으면 None.
+        """
+        try:
+            self.add_cookies(url, session.get("cookies", []))
+            self.driver.execute_script(
+                "var items = arguments[0];"
+                "for (var key in items) { localStorage.setItem(key, items[key]); }",
+                session.get("local_storage", {}),
+            )
+            self.driver.get(url)
+            if self.is_logged_in():
+                return self.driver.page_source
+        except Exception as e:
+            print(f"[ERROR] 세션 복원 실패: {e}")
+        return None
+
     def selenium_with_login(self, url, user_id, user_pw):
         """
         일반 로그인 기능을 수행하고 HTML 소스를 반환합니다.
@@ -50,15 +230,15 @@ class Fetcher:
         try:
             # 로그인 페이지로 이동
             self.driver.get(url)
-            time.sleep(2)
+            self.waiter.page_ready()
 
             # 1. 로그인 버튼 클릭
             login_button = self.driver.find_element(By.CSS_SELECTOR, ".sign-in-button.btn")
             login_button.click()
             print("[INFO] 로그인 버튼 클릭 완료")
-            time.sleep(2)  # 모달 창 로드 대기
 
             # 2. 모달 창 찾기
+            self.waiter.visible(By.CSS_SELECTOR, "div.sign-modal-container")
             modal = self.driver.find_element(By.CSS_SELECTOR, "div.sign-modal-container")
             print("[INFO] 모달 창 찾기 완료")
 
@@ -77,8 +257,9 @@ class Fetcher:
             modal_login_button.click()
             print("[INFO] 로그인 버튼 클릭 완료")
 
-            # 로그인 완료 대기
-            time.sleep(10)
+            # 로그인 완료 후 달력이 그려질 때까지 대기
+            self.waiter.login_finished()
+            self.waiter.calendar_rendered()
 
             # 로그인 후 HTML 반환
             return self.driver.page_source
@@ -93,22 +274,24 @@ class Fetcher:
     def selenium_with_kakao_login(self, url, kakao_id, kakao_pw):
         try:
             self.driver.get(url)
-            time.sleep(2)
+            self.waiter.page_ready()
+            main_window = self.driver.current_window_handle
 
             # 1. 로그인 버튼 클릭
             login_button = self.driver.find_element(By.CSS_SELECTOR, ".sign-in-button.btn")
             login_button.click()
-            time.sleep(1)
 
             # 2. 카카오 로그인 버튼 클릭
+            self.waiter.visible(By.CSS_SELECTOR, ".ga-sign-in-with-kakao")
             kakao_button = self.driver.find_element(By.CSS_SELECTOR, ".ga-sign-in-with-kakao")
             kakao_button.click()
-            time.sleep(2)
 
-            # 3. 카카오 로그인 창으로 전환
+            # 3. 카카오 로그인 창으로 전환 (새 창이 뜨지 않으면 현재 창에서 진행)
+            self.waiter.until("modal", lambda driver: len(driver.window_handles) > 1)
             self.driver.switch_to.window(self.driver.window_handles[-1])
 
             # 4. 아이디/비밀번호 입력
+            self.waiter.visible(By.ID, "loginId--1")
             id_input = self.driver.find_element(By.ID, "loginId--1")
             id_input.send_keys(kakao_id)
             pw_input = self.driver.find_element(By.ID, "password--2")
@@ -118,7 +301,12 @@ class Fetcher:
             login_btn = self.driver.find_element(By.CSS_SELECTOR, "button.submit")
             login_btn.click()
 
-            time.sleep(10)  # 로그인 완료 대기
+            # 로그인 완료 대기: 카카오 창이 닫히면 원래 창으로 돌아와 달력이 그려질 때까지 기다린다
+            if main_window != self.driver.current_window_handle:
+                self.waiter.until("login", lambda driver: main_window in driver.window_handles and len(driver.window_handles) == 1)
+                self.driver.switch_to.window(main_window)
+            self.waiter.login_finished()
+            self.waiter.calendar_rendered()
 
             return self.driver.page_source
 
@@ -133,26 +321,74 @@ class Fetcher:
         Returns:
             str: 다음 페이지의 HTML 소스.
         """
-        try:
-            # 다음 페이지 버튼 찾기
-            next_button = self.driver.find_element(By.CSS_SELECTOR, "div.icon-wrapper img[ng-click='addMonth(1)']")
-            
-            # 버튼 클릭
-            next_button.click()
-            print("[INFO] 다음 페이지 버튼 클릭 완료")
+        return self.selenium_move_month(1)
 
-            # 페이지 로드 대기
-            time.sleep(5)
+    def selenium_prev_page(self):
+        """
+        셀레니움으로 이전 페이지 버튼을 클릭하고 HTML을 가져옵니다.
 
-            # 현재 페이지의 HTML 반환
-            return self.driver.page_source
+        Returns:
+            str: 이전 페이지의 HTML 소스.
+        """
+        return self.selenium_move_month(-1)
+
+    def selenium_move_month(self, offset):
+        """
+        달력의 addMonth(offset) 버튼을 클릭하고, 달이 바뀐 뒤의 HTML을 가져옵니다.
+
+        Args:
+            offset (int): 1이면 다음 달, -1이면 이전 달.
+
+        Returns:
+            str: 이동한 달의 HTML 소스. 실패하면 None.
+        """
+        snapshot = self.click_month(offset)
+        if snapshot is None:
+            return None
+        return self.wait_month(snapshot)
+
+    def click_month(self, offset):
+        """
+        달력의 addMonth(offset) 버튼만 클릭하고, 새 달이 그려질 때까지는 기다리지 않습니다.
+
+        Args:
+            offset (int): 1이면 다음 달, -1이면 이전 달.
+
+        Returns:
+            tuple: 클릭 전 상태 (wait_month에 넘겨 쓴다). 실패하면 None.
+        """
+        direction = "다음" if offset > 0 else "이전"
+        try:
+            with self.guard():
+                # 페이지 이동 버튼 찾기
+                button = self.driver.find_element(By.CSS_SELECTOR, f"div.icon-wrapper img[ng-click='addMonth({offset})']")
+
+                # 버튼 클릭 (클릭 전 상태를 저장해 달이 바뀌었는지 확인)
+                snapshot = self.waiter.month_snapshot()
+                button.click()
+            print(f"[INFO] {direction} 페이지 버튼 클릭 완료")
+            return snapshot
         except NoSuchElementException:
-            
-            print("[ERROR] 다음 페이지 버튼을 찾을 수 없습니다.")
+            print(f"[ERROR] {direction} 페이지 버튼을 찾을 수 없습니다.")
+            return None
+        except Exception as e:
+            print(f"[ERROR] {direction} 페이지로 이동 중 오류 발생: {e}")
             return None
+
+    def wait_month(self, snapshot):
+        """
+        click_month 후 달이 바뀌고 새 공고 목록이 그려질 때까지 기다린 뒤 HTML을 가져옵니다.
+
+        Returns:
+            str: 이동한 달의 HTML 소스. 실패하면 None.
+        """
+        try:
+            with self.guard():
+                self.waiter.month_changed(snapshot)
+                return self.driver.page_source
         except TimeoutException:
             print("[ERROR] 페이지 로드가 시간 초과되었습니다.")
             return None
         except Exception as e:
-            print(f"[ERROR] 다음 페이지로 이동 중 오류 발생: {e}")
+            print(f"[ERROR] 달 이동 후 페이지를 가져오는 중 오류 발생: {e}")
             return None
@@ -0,0 +1,111 @@
+from crawltools.fetcher import Fetcher
+import queue
+import threading
+
+# 한 공고를 몇 번까지 다른 워커에게 다시 맡길지
+MAX_ATTEMPTS = 2
+
+
+class FetcherPool:
+    """
+    로그인 세션을 공유하는 여러 개의 Selenium 워커로 페이지를 병렬 처리합니다.
+
+    각 워커는 자기 Chrome 드라이버를 띄우고, 메인 드라이버의 쿠키를 받아 로그인 상태를 공유합니다.
+    워커들은 하나의 큐에서 공고 ID를 꺼내 처리하며, 실패한 워커가 있어도 남은 작업은 다른 워커가 이어받습니다.
+    """
+
+    def __init__(self, size, cookies=None, cookie_url=None, factory=None):
+        """
+        Args:
+            size (int): 워커(드라이버) 수.
+            cookies (list): 메인 드라이버에서 가져온 쿠키 목록.
+            cookie_url (str): 쿠키를 넣을 도메인의 페이지 URL.
+            factory (callable): 워커의 Fetcher를 만드는 함수. 없으면 크롬 드라이버를 띄운다. (벤치마크에서는 가짜를 넣는다)
+        """
+        self.size = size
+        self.factory = factory
+        self.cookies = cookies or []
+        self.cookie_url = cookie_url
+        # 워커들이 기다린 시간 기록 (Waiter.timings 형식)
+        self.wait_timings = []
+
+    def _start_fetcher(self):
+        if self.factory is not None:
+            return self.factory()
+        # 워커끼리 같은 user-data-dir을 함께 쓸 수 없으므로 임시 프로필로 띄운다. 상세 페이지만 열므로 네트워크 로그도 끈다
+        fetcher = Fetcher(user_data_dir=False, network_log=False)
+        if self.cookies and self.cookie_url:
+            fetcher.add_cookies(self.cookie_url, self.cookies)
+            # 워커의 드라이버를 새로 띄우면 같은 쿠키를 다시 넣는다
+            fetcher.watchdog.remember(self.cookie_url, {"cookies": self.cookies})
+        return fetcher
+
+    def _worker(self, number, task, jobs, results, lock, on_result):
+        try:
+            fetcher = self._start_fetcher()
+        except Exception as e:
+            print(f"[ERROR] 워커 {number} 드라이버 시작 실패: {e}")
+            return
+
+        try:
+            while True:
+                try:
+                    key, attempt = jobs.get_nowait()
+                except queue.Empty:
+                    return
+
+                try:
+                    result = task(fetcher, key)
+                except Exception as e:
+                    print(f"[ERROR] 워커 {number} 처리 실패 ({key}): {e}")
+                    result = None
+
+                if result is not None:
+                    with lock:
+                        results[key] = result
+                    if on_result is not None:
+                        on_result(key, result)
+                    continue
+
+                # 실패한 공고는 다른 워커에게 다시 맡기고, 이 워커는 드라이버가 망가졌을 수 있으니 종료
+                if attempt + 1 < MAX_ATTEMPTS:
+                    jobs.put((key, attempt + 1))
+                print(f"[INFO] 워커 {number} 종료 (실패: {key})")
+                return
+        finally:
+            with lock:
+                self.wait_timings.extend(fetcher.waiter.timings)
+            fetcher.close_driver()
+
+    def run(self, task, keys, on_result=None):
+        """
+        keys 각각에 대해 task(fetcher, key)를 워커들이 나눠서 실행합니다.
+
+        task가 None을 반환하거나 예외를 던지면 실패로 보고 다른 워커에게 한 번 더 맡깁니다.
+
+        Args:
+            task (callable): (Fetcher, key)를 받아 결과를 반환하는 함수.
+            keys (iterable): 처리할 키(공고 ID) 목록.
+            on_result (callable): 주어지면 성공한 결과마다 워커 스레드에서 on_result(key, 결과)를 부른다.
+
+        Returns:
+            tuple: (성공한 key -> 결과 dict, 끝내 처리하지 못한 key 리스트)
+        """
+        keys = list(keys)
+        jobs = queue.Queue()
+        for key in keys:
+            jobs.put((key, 0))
+
+        results = {}
+        lock = threading.Lock()
+        threads = [
+            threading.Thread(target=self._worker, args=(n, task, jobs, results, lock, on_result), daemon=True)
+            for n in range(min(self.size, len(keys)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        failed = [key for key in keys if key not in results]
+        return results, failed
@@ -0,0 +1,70 @@
+from requests.adapters import HTTPAdapter
+from crawltools.retry import AdaptiveLimiter, retry_call
+import requests
+
+
+class HttpFetcher:
+    """
+    브라우저 없이 HTTP로 페이지를 가져오는 가벼운 Fetcher입니다.
+
+    keep-alive 연결 풀을 쓰는 requests.Session 하나를 재사용하고,
+    Selenium 드라이버의 쿠키를 받아 같은 로그인 세션으로 요청합니다.
+    429나 5xx 응답은 지수 백오프(Retry-After가 있으면 그만큼)로 다시 요청하고,
+    그런 응답이 늘면 동시에 보내는 요청 수를 줄였다가 성공이 이어지면 pool_size까지 다시 늘린다.
+    """
+
+    def __init__(self, cookies=None, user_agent=None, pool_size=8, timeout=10):
+        """
+        Args:
+            cookies (list): Selenium 쿠키 딕셔너리 목록.
+            user_agent (str): 요청에 쓸 User-Agent. 브라우저와 같게 맞추는 것이 좋다.
+            pool_size (int): 호스트당 유지할 연결 수. 동시에 보내는 요청 수의 최대값이기도 하다.
+            timeout (float): 요청 타임아웃(초).
+        """
+        self.timeout = timeout
+        self.limiter = AdaptiveLimiter(pool_size, name="HTTP")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+        self.set_cookies(cookies or [])
+
+    def set_cookies(self, cookies):
+        """
+        Selenium 쿠키를 세션에 넣습니다.
+
+        Args:
+            cookies (list): Selenium 쿠키 딕셔너리 목록.
+        """
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain"), path=cookie.get("path", "/"),
+            )
+
+    def fetch(self, url):
+        """
+        페이지 HTML을 가져옵니다.
+
+        Args:
+            url (str): 가져올 페이지 URL.
+
+        Returns:
+            str | None: HTML 소스. 요청에 실패하면 None.
+        """
+        try:
+            with self.limiter.slot():
+                return retry_call(self.get, url, limiter=self.limiter, name="HTTP 요청")
+        except requests.RequestException as e:
+            print(f"[ERROR] HTTP 요청 실패: {e}")
+            return None
+
+    def get(self, url):
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+    def close(self):
+        self.session.close()
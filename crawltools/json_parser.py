@@ -0,0 +1,110 @@
+from datetime import datetime
+from crawltools.metrics import METRICS
+import pytz
+
+# 달력 API 응답에서 찾을 키 (앞에 있는 것부터 쓴다)
+ID_KEYS = ("employment_id", "employmentId", "id")
+FAVORITE_KEYS = ("favorite", "is_favorite", "isFavorite", "favorited")
+COMPANY_KEYS = ("company_name", "companyName")
+DEADLINE_KEYS = ("end_time", "endTime", "end_at", "endAt", "ended_at", "deadline")
+TITLE_KEYS = ("title", "subtitle", "employment_title")
+LINK_KEYS = ("link", "url")
+
+# 사이트의 시간대. 화면에 보이는 마감 시간과 같은 naive datetime으로 맞춘다.
+SITE_TIMEZONE = pytz.timezone("Asia/Seoul")
+
+
+def _first(item, keys):
+    for key in keys:
+        if item.get(key) not in (None, ""):
+            return item[key]
+    return None
+
+
+def _walk(data):
+    """JSON 안의 모든 딕셔너리를 차례로 돌려줍니다."""
+    stack = [data]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            yield current
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
+def parse_time(value):
+    """
+    API의 시간 값(ISO 8601 문자열 또는 유닉스 시간)을 사이트 시간대의 naive datetime으로 바꿉니다.
+
+    Returns:
+        datetime | None: 변환한 시간. 알 수 없는 형식이면 None.
+    """
+    try:
+        if isinstance(value, (int, float)):
+            # 밀리초 단위도 받는다
+            seconds = value / 1000 if value > 1e11 else value
+            return datetime.fromtimestamp(seconds, SITE_TIMEZONE).replace(tzinfo=None)
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (ValueError, OverflowError, OSError):
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(SITE_TIMEZONE).replace(tzinfo=None)
+    return dt
+
+
+class JsonParser:
+    """
+    브라우저가 받은 달력 API(JSON) 응답에서 Parser와 같은 결과를 바로 뽑습니다.
+
+    응답 구조를 고정하지 않고, 공고 ID와 즐겨찾기 여부를 함께 가진 객체를 달력 공고로 본다.
+    그런 객체가 하나도 없으면 달력 응답이 아닌 것으로 보고 None을 반환해 DOM 파싱으로 넘어가게 한다.
+    """
+
+    @staticmethod
+    @METRICS.timed("parse", kind="calendar_json")
+    def calendar(payloads, skip_ids=frozenset()):
+        """
+        Args:
+            payloads (list): (URL, JSON 데이터) 목록.
+            skip_ids (set): 이미 파싱한 공고 ID. 이 공고들은 값을 None으로 넣는다.
+
+        Returns:
+            tuple | None: (공고 ID -> {"company_name", "link"}, 공고 ID -> (마감 시간, subtitle)).
+                달력 공고를 하나도 찾지 못하면 None.
+        """
+        results, details = {}, {}
+        found = False
+        for _, data in payloads:
+            for item in _walk(data):
+                id = _first(item, ID_KEYS)
+                favorite_key = next((key for key in FAVORITE_KEYS if key in item), None)
+                if id is None or favorite_key is None:
+                    continue
+                found = True
+                if not item[favorite_key]:
+                    continue
+
+                id = str(id)
+                if id in skip_ids:
+                    results[id] = None
+                    continue
+
+                company = item.get("company")
+                company_name = _first(item, COMPANY_KEYS)
+                if company_name is None and isinstance(company, dict):
+                    company_name = company.get("name")
+                results[id] = {
+                    "company_name": company_name or "회사 이름 없음",
+                    "link": _first(item, LINK_KEYS) or f"/recruit/{id}",
+                }
+
+                deadline = _first(item, DEADLINE_KEYS)
+                deadline = parse_time(deadline) if deadline is not None else None
+                if deadline is not None:
+                    details[id] = (deadline, _first(item, TITLE_KEYS))
+
+        if not found:
+            return None
+        print(results)
+        return results, details
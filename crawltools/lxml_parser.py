@@ -0,0 +1,108 @@
+from datetime import datetime
+from lxml import html as lxml_html
+import re
+
+# Parser와 같은 부분을 XPath로 직접 찾는다
+CALENDAR_ITEM = "//*[contains(concat(' ', normalize-space(@class), ' '), ' calendar-item ')]"
+COMPANY_NAME = ".//*[contains(concat(' ', normalize-space(@class), ' '), ' company-name ')]//span"
+COMPANY_LINK = ".//a[contains(concat(' ', normalize-space(@class), ' '), ' company ')]"
+SUBTITLE = "//h1[@class='header4 text-gray-900 mb-[4px]']"
+TIME_DIV = "//div[contains(concat(' ', normalize-space(@class), ' '), ' body5 ')]"
+
+# 상세 페이지에서 subtitle h1과 body5 div를 파싱 전에 빠르게 잘라낸다. 안에 div가 더 있으면 중간에서 끊기므로
+# 파싱할 범위를 줄이는 데만 쓰고(못 찾으면 문서 전체를 파싱), 페이지가 바뀌었는지 비교하는 데는 쓰지 않는다
+DETAIL_FRAGMENT = re.compile(
+    r'<h1[^>]*class="(?:[^"]*\s)?header4(?:\s[^"]*)?"[^>]*>.*?</h1>'
+    r'|<div[^>]*class="(?:[^"]*\s)?body5(?:\s[^"]*)?"[^>]*>.*?</div>',
+    re.S,
+)
+
+# _find_exp_time이 "~" 뒤의 마감 시간을 아예 찾지 못했을 때 반환하는 값 (날짜 파싱 실패 None과 구분)
+NOT_FOUND = object()
+
+
+def _text(element):
+    """BeautifulSoup의 get_text(strip=True)와 같이 하위 텍스트를 각각 strip해서 이어 붙입니다."""
+    return "".join(text.strip() for text in element.itertext())
+
+
+class LxmlParser:
+    """
+    Parser와 같은 결과를 BeautifulSoup 없이 lxml XPath로 바로 뽑는 파서입니다.
+
+    - calendar: 문서를 lxml로 한 번 파싱하고 .calendar-item 요소만 XPath로 훑는다.
+    - extract_exp_time: 정규식으로 h1.header4와 div.body5 부분만 잘라 그 조각만 파싱한다.
+      조각에서 마감 시간을 찾지 못하면 문서 전체를 파싱해서 다시 찾는다.
+    """
+
+    @staticmethod
+    def calendar(html, skip_ids=frozenset()):
+        root = lxml_html.fromstring(html)
+        results = {}
+
+        for item in root.xpath(CALENDAR_ITEM):
+            # 정확하게 즐겨찾기 여부 판단
+            class_list = item.get("class", "").split()
+            if "favorite" not in class_list or "no-favorite" in class_list:
+                continue
+
+            employment_id = item.get("employment_id", "ID 없음")
+
+            # 다른 달에서 이미 파싱한 공고
+            if employment_id in skip_ids:
+                results[employment_id] = None
+                continue
+
+            company_name_tags = item.xpath(COMPANY_NAME)
+            company_name = _text(company_name_tags[0]) if company_name_tags else "회사 이름 없음"
+
+            link_tags = item.xpath(COMPANY_LINK)
+            link = link_tags[0].get("href") if link_tags else "링크 없음"
+
+            results[employment_id] = {
+                "company_name": company_name,
+                "link": link,
+            }
+
+        return results
+
+    @staticmethod
+    def extract_exp_time(html):
+        fragment = "".join(DETAIL_FRAGMENT.findall(html))
+        if fragment:
+            result = LxmlParser._find_exp_time(lxml_html.fromstring(f"<div>{fragment}</div>"))
+            if result is not NOT_FOUND:
+                return result
+        result = LxmlParser._find_exp_time(lxml_html.fromstring(html))
+        return None if result is NOT_FOUND else result
+
+    @staticmethod
+    def detail_fragment(html):
+        """
+        extract_exp_time이 읽는 노드(subtitle h1, body5 div의 하위 전체)를 직렬화해 이어 붙입니다.
+
+        Returns:
+            str: 노드 HTML을 이어 붙인 문자열. 해당 노드가 없으면 빈 문자열.
+        """
+        root = lxml_html.fromstring(html)
+        nodes = root.xpath(SUBTITLE) + root.xpath(TIME_DIV)
+        return "".join(lxml_html.tostring(node, encoding="unicode", with_tail=False) for node in nodes)
+
+    @staticmethod
+    def _find_exp_time(root):
+        subtitle_tags = root.xpath(SUBTITLE)
+        subtitle = _text(subtitle_tags[0]) if subtitle_tags else None
+
+        for time_div in root.xpath(TIME_DIV):
+            spans = time_div.xpath(".//span")
+            for i, span in enumerate(spans):
+                if _text(span) == "~" and i + 1 < len(spans):
+                    try:
+                        end_text = _text(spans[i + 1])  # "2025년 4월 28일 17:00"
+                        exp_dt = datetime.strptime(end_text, "%Y년 %m월 %d일 %H:%M")
+                        return exp_dt, subtitle
+                    except Exception as e:
+                        print(f"[ERROR] 날짜 파싱 실패: {e}")
+                        return None
+
+        return NOT_FOUND
@@ -0,0 +1,192 @@
+from collections import deque
+from contextlib import contextmanager
+import functools
+import json
+import os
+import threading
+import time
+
+# Prometheus 메트릭 이름 앞에 붙일 접두사
+PREFIX = "recruit_calendar"
+
+# JSON lines로 내보내기 전까지 모아 둘 span 수 (넘으면 오래된 것부터 버린다)
+MAX_SPANS = 10000
+
+
+def _label_key(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _prom_escape(value):
+    # Prometheus 텍스트 형식의 라벨 값은 역슬래시, 큰따옴표, 줄바꿈을 이스케이프해야 한다
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prom_labels(key):
+    if not key:
+        return ""
+    return "{" + ",".join(f'{name}="{_prom_escape(value)}"' for name, value in key) + "}"
+
+
+class Metrics:
+    """
+    단계별 시간(span)과 카운터를 모아 JSON lines 또는 Prometheus 텍스트 형식으로 내보냅니다.
+
+    span은 하나하나 기록되어 JSON lines로 나가고, Prometheus에는 이름/라벨별 횟수, 합계, 최대값으로 요약된다.
+    내보내지 않은 span은 최근 MAX_SPANS개만 남기고, export()를 부를 때마다 비운다.
+    여러 스레드(워커)에서 함께 쓸 수 있습니다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.spans = deque(maxlen=MAX_SPANS)
+        # (이름, 라벨) -> {"count", "sum", "max"}
+        self.durations = {}
+        # (이름, 라벨) -> 값
+        self.counters = {}
+
+    @contextmanager
+    def span(self, name, **labels):
+        """
+        with 블록에 걸린 시간을 name 단계로 기록합니다.
+
+        Args:
+            name (str): 단계 이름 ('login', 'detail_fetch' 등).
+            **labels: 구분용 라벨 (backend='http' 등).
+        """
+        start = time.time()
+        perf_start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - perf_start, start=start, error=error, **labels)
+
+    def observe(self, name, seconds, start=None, error=None, **labels):
+        """이미 잰 시간을 name 단계로 기록합니다."""
+        record = {"type": "span", "name": name, "labels": labels, "start": start or time.time() - seconds,
+                  "duration": seconds}
+        if error:
+            record["error"] = error
+        key = (name, _label_key(labels))
+        with self.lock:
+            self.spans.append(record)
+            entry = self.durations.setdefault(key, {"count": 0, "sum": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["sum"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+
+    def inc(self, name, value=1, **labels):
+        """
+        카운터를 늘립니다.
+
+        Args:
+            name (str): 카운터 이름 ('pages_fetched', 'html_bytes', 'api_calls' 등).
+            value (int): 늘릴 값.
+            **labels: 구분용 라벨.
+        """
+        key = (name, _label_key(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def timed(self, name, **labels):
+        """함수 실행 시간을 name 단계로 기록하는 데코레이터."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name, **labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def export_jsonl(self, path):
+        """
+        지금까지 기록한 span과 카운터를 JSON lines로 파일 끝에 덧붙이고, 내보낸 span은 비웁니다.
+
+        Args:
+            path (str): 파일 경로.
+        """
+        with self.lock:
+            spans, self.spans = self.spans, deque(maxlen=MAX_SPANS)
+            counters = dict(self.counters)
+        now = time.time()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for record in spans:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            for (name, key), value in counters.items():
+                f.write(json.dumps(
+                    {"type": "counter", "name": name, "labels": dict(key), "value": value, "time": now},
+                    ensure_ascii=False,
+                ) + "\n")
+
+    def prometheus_text(self):
+        """Prometheus 텍스트 형식 문자열을 반환합니다."""
+        with self.lock:
+            durations = dict(self.durations)
+            counters = dict(self.counters)
+
+        lines = []
+        for name in sorted({name for name, _ in durations}):
+            metric = f"{PREFIX}_{name}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for (entry_name, key), entry in sorted(durations.items()):
+                if entry_name != name:
+                    continue
+                lines.append(f"{metric}_count{_prom_labels(key)} {entry['count']}")
+                lines.append(f"{metric}_sum{_prom_labels(key)} {entry['sum']:.6f}")
+            lines.append(f"# TYPE {metric}_max gauge")
+            for (entry_name, key), entry in sorted(durations.items()):
+                if entry_name == name:
+                    lines.append(f"{metric}_max{_prom_labels(key)} {entry['max']:.6f}")
+
+        for name in sorted({name for name, _ in counters}):
+            metric = f"{PREFIX}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for (entry_name, key), value in sorted(counters.items()):
+                if entry_name == name:
+                    lines.append(f"{metric}{_prom_labels(key)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def export_prometheus(self, path):
+        """Prometheus 텍스트 형식으로 파일을 덮어씁니다. (node_exporter textfile collector 등에서 읽을 수 있다)"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+
+    def export(self):
+        """
+        .env의 METRICS_JSONL, METRICS_PROM에 경로가 있으면 그 파일로 내보냅니다.
+
+        span은 JSON lines로 내보낼 때만 쓰므로, METRICS_JSONL이 없어도 비운다. (데몬 모드에서 계속 쌓이지 않게)
+        """
+        prom_path = os.getenv("METRICS_PROM")
+        jsonl_path = os.getenv("METRICS_JSONL")
+        if prom_path:
+            self.export_prometheus(prom_path)
+            print(f"[INFO] 메트릭 저장: {prom_path}")
+        if jsonl_path:
+            self.export_jsonl(jsonl_path)
+            print(f"[INFO] 메트릭 저장: {jsonl_path}")
+        else:
+            with self.lock:
+                self.spans.clear()
+
+    def report(self):
+        """단계별 횟수와 시간 합계를 출력합니다."""
+        with self.lock:
+            durations = sorted(self.durations.items(), key=lambda item: -item[1]["sum"])
+        for (name, key), entry in durations:
+            print(
+                f"[INFO] {name}{_prom_labels(key)}: {entry['count']}회, "
+                f"합계 {entry['sum']:.2f}초, 최대 {entry['max']:.2f}초"
+            )
+
+
+# 프로그램 전체에서 함께 쓰는 메트릭
+METRICS = Metrics()
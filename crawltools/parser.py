@@ -1,11 +1,39 @@
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
+from crawltools.lxml_parser import LxmlParser
+from crawltools.metrics import METRICS
+import os
 
 class Parser:
+    # 파싱 엔진: 'bs4'(BeautifulSoup) 또는 'lxml'(LxmlParser). None이면 .env의 PARSER_ENGINE (기본 'bs4')
+    engine = None
+
+    @staticmethod
+    def use_lxml():
+        engine = Parser.engine or os.getenv("PARSER_ENGINE", "bs4")
+        return engine.lower() == "lxml"
+
     @staticmethod
-    def calendar(html):
-        # HTML 문자열을 BeautifulSoup 객체로 파싱
+    @METRICS.timed("parse", kind="calendar")
+    def calendar(html, skip_ids=None):
+        """
+        달력 페이지 HTML에서 즐겨찾기한 공고를 추출합니다.
+
+        Args:
+            html (str): HTML 소스 코드.
+            skip_ids (set): 이미 파싱한 공고 ID. 이 공고들은 회사 이름/링크를 파싱하지 않고 값을 None으로 넣는다.
+
+        Returns:
+            dict: 공고 ID -> {"company_name", "link"} (skip_ids에 있는 공고는 None)
+        """
+        skip_ids = skip_ids or set()
+        if Parser.use_lxml():
+            results = LxmlParser.calendar(html, skip_ids)
+            print(results)
+            return results
+
+        # HTML 문자열을 BeautifulSoup 객체로 파싱 (bs4는 import가 느리므로 이 엔진을 쓸 때만 불러온다)
+        from bs4 import BeautifulSoup
         soup = BeautifulSoup(html, "lxml")
 
         # 모든 calendar-item 선택
@@ -25,6 +53,11 @@ class Parser:
             if not is_favorite:
                 continue
 
+            # 다른 달에서 이미 파싱한 공고
+            if employment_id in skip_ids:
+                results[employment_id] = None
+                continue
+
             # 회사 이름 추출
             company_name_tag = item.select_one(".company-name span")
             company_name = company_name_tag.get_text(strip=True) if company_name_tag else "회사 이름 없음"
@@ -42,6 +75,22 @@ class Parser:
         return results
 
     @staticmethod
+    def detail_fragment(html):
+        """
+        상세 페이지 HTML에서 extract_exp_time이 보는 부분(subtitle h1, body5 div의 하위 전체)만 반환합니다.
+        lxml로 파싱해 노드를 그대로 직렬화하므로, 이 값이 같으면 마감 시간과 subtitle도 같다.
+        페이지가 바뀌었는지 비교해서 BeautifulSoup 파싱을 건너뛰는 데 쓴다.
+
+        Args:
+            html (str): HTML 소스 코드.
+
+        Returns:
+            str: 해당 부분을 이어 붙인 문자열. 없으면 빈 문자열.
+        """
+        return LxmlParser.detail_fragment(html)
+
+    @staticmethod
+    @METRICS.timed("parse", kind="detail")
     def extract_exp_time(html):
         """
         HTML에서 마감 시간과 subtitle 텍스트를 추출합니다.
@@ -52,6 +101,10 @@ class Parser:
         Returns:
             tuple: (마감 시간 datetime 객체, subtitle 텍스트) 또는 (None, None) 반환.
         """
+        if Parser.use_lxml():
+            return LxmlParser.extract_exp_time(html)
+
+        from bs4 import BeautifulSoup
         soup = BeautifulSoup(html, "lxml")
 
         # subtitle 텍스트 추출
@@ -0,0 +1,282 @@
+from contextlib import contextmanager
+from crawltools.metrics import METRICS
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+# 다시 시도할 HTTP 상태 코드 (요청 한도 초과, 서버 오류)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# 403이어도 다시 시도할 Google API 오류 이유 (초당/사용자당 한도 초과). 하루 할당량 초과는 기다려도 풀리지 않는다.
+RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+
+# 최대 시도 횟수 (.env의 RETRY_ATTEMPTS), 첫 대기 시간과 최대 대기 시간(초) (.env의 RETRY_BASE, RETRY_CAP)
+DEFAULT_ATTEMPTS = 5
+DEFAULT_BASE = 1.0
+DEFAULT_CAP = 32.0
+
+
+def http_status(error):
+    """
+    예외에서 HTTP 상태 코드를 꺼냅니다. (googleapiclient의 HttpError, requests의 HTTPError)
+
+    Returns:
+        int | None: 상태 코드. HTTP 응답이 없는 예외면 None.
+    """
+    resp = getattr(error, "resp", None)
+    if resp is not None and getattr(resp, "status", None) is not None:
+        return int(resp.status)
+    response = getattr(error, "response", None)
+    if response is not None and getattr(response, "status_code", None) is not None:
+        return int(response.status_code)
+    return None
+
+
+def error_reasons(error):
+    """
+    Google API 오류 응답의 reason 값들을 꺼냅니다.
+
+    Returns:
+        set: reason 값 (예: {"rateLimitExceeded"}).
+    """
+    details = getattr(error, "error_details", None)
+    if not details:
+        try:
+            details = json.loads(getattr(error, "content", b"") or b"{}").get("error", {}).get("errors", [])
+        except (ValueError, AttributeError):
+            details = []
+    if not isinstance(details, list):
+        return set()
+    return {detail.get("reason") for detail in details if isinstance(detail, dict) and detail.get("reason")}
+
+
+def is_rate_limited(error):
+    """요청 한도 초과(429, 또는 rateLimitExceeded/userRateLimitExceeded인 403) 오류인지 확인합니다."""
+    status = http_status(error)
+    return status == 429 or (status == 403 and bool(error_reasons(error) & RATE_LIMIT_REASONS))
+
+
+def is_retryable(error):
+    """
+    다시 시도하면 성공할 수 있는 오류인지 확인합니다.
+
+    요청 한도 초과, 5xx, 응답을 받지 못한 연결 오류/타임아웃은 다시 시도하고,
+    잘못된 요청(400), 권한 없음, 없는 일정(404) 같은 오류는 다시 시도하지 않는다.
+    """
+    status = http_status(error)
+    if status is None:
+        return is_connection_error(error)
+    return status in RETRY_STATUSES or is_rate_limited(error)
+
+
+def is_connection_error(error):
+    """
+    응답을 받지 못한 연결 오류나 타임아웃인지 확인합니다.
+
+    잘못된 URL(InvalidURL, MissingSchema), 인증서 오류(SSLError), 로컬 파일 오류처럼
+    다시 보내도 똑같이 실패하는 OSError는 여기에 들지 않는다. (socket.timeout은 TimeoutError와 같다)
+    """
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    # requests를 쓰지 않은 실행이면 requests 예외일 수 없으므로 불러오지 않는다
+    requests = sys.modules.get("requests")
+    if requests is None or isinstance(error, requests.exceptions.SSLError):
+        return False
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+def retry_after(error):
+    """
+    응답의 Retry-After 헤더(초)를 반환합니다.
+
+    Returns:
+        float | None: 기다릴 시간(초). 헤더가 없거나 날짜 형식이면 None.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or getattr(error, "resp", None) or {}
+    try:
+        value = headers.get("Retry-After") or headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, base=None, cap=None):
+    """
+    attempt번째 재시도 전에 기다릴 시간을 full jitter 지수 백오프로 정합니다.
+
+    0과 min(cap, base * 2^attempt) 사이에서 무작위로 고르므로, 동시에 실패한 요청들이 한꺼번에 다시 몰리지 않는다.
+
+    Args:
+        attempt (int): 0부터 시작하는 재시도 순번.
+        base (float): 첫 대기 시간의 상한(초). 없으면 .env의 RETRY_BASE (기본 1).
+        cap (float): 대기 시간의 최대값(초). 없으면 .env의 RETRY_CAP (기본 32).
+
+    Returns:
+        float: 기다릴 시간(초).
+    """
+    base = base if base is not None else float(os.getenv("RETRY_BASE", DEFAULT_BASE))
+    cap = cap if cap is not None else float(os.getenv("RETRY_CAP", DEFAULT_CAP))
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def retry_attempts(attempts=None):
+    """최대 시도 횟수를 반환합니다. 없으면 .env의 RETRY_ATTEMPTS (기본 5)."""
+    attempts = attempts or int(os.getenv("RETRY_ATTEMPTS", DEFAULT_ATTEMPTS))
+    if attempts < 1:
+        raise ValueError("[ERROR] RETRY_ATTEMPTS 값이 잘못되었습니다. 1 이상의 정수를 설정하세요.")
+    return attempts
+
+
+def retry_call(func, *args, attempts=None, retryable=is_retryable, bucket=None, limiter=None, name="call", **kwargs):
+    """
+    func를 호출하고, 다시 시도할 수 있는 오류면 지수 백오프로 기다렸다가 다시 호출합니다.
+
+    Args:
+        func (callable): 호출할 함수.
+        attempts (int): 최대 시도 횟수. 없으면 .env의 RETRY_ATTEMPTS (기본 5).
+        retryable (callable): 예외를 받아 다시 시도할지 정하는 함수.
+        bucket (TokenBucket): 호출마다 토큰 하나를 받을 버킷.
+        limiter (AdaptiveLimiter): 성공/실패를 알려 줄 동시성 제한기.
+        name (str): 로그와 지표에 쓸 이름.
+
+    Returns:
+        func의 반환값. 마지막 시도까지 실패하면 그 예외를 그대로 올린다.
+    """
+    attempts = retry_attempts(attempts)
+    for attempt in range(attempts):
+        if bucket is not None:
+            bucket.acquire()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if limiter is not None:
+                limiter.record(False)
+            if not retryable(e) or attempt + 1 >= attempts:
+                raise
+            delay = max(backoff_delay(attempt), retry_after(e) or 0)
+            METRICS.inc("retries", call=name)
+            print(f"[INFO] {name} 재시도 {attempt + 1}/{attempts - 1} ({delay:.1f}초 후): {e}")
+            time.sleep(delay)
+        else:
+            if limiter is not None:
+                limiter.record(True)
+            return result
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 토큰이 차는 버킷입니다. 요청 전에 토큰을 받아서 API 할당량보다 빠르게 보내지 않는다.
+
+    여러 스레드(파이프라인, HTTP 워커)가 함께 써도 된다.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """
+        Args:
+            rate (float): 초당 토큰 수. 0 이하면 제한하지 않는다.
+            capacity (int): 한 번에 쌓일 수 있는 최대 토큰 수 (순간 허용량). 없으면 rate.
+        """
+        self.rate = rate
+        self.capacity = max(capacity or rate, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """
+        토큰을 받을 때까지 기다립니다.
+
+        Args:
+            tokens (int): 받을 토큰 수. 버킷 크기보다 크면 버킷 크기만큼만 받는다.
+
+        Returns:
+            float: 기다린 시간(초).
+        """
+        if self.rate <= 0:
+            return 0.0
+        tokens = min(tokens, self.capacity)
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    if waited:
+                        METRICS.observe("rate_limit_wait", waited)
+                    return waited
+                delay = (tokens - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class AdaptiveLimiter:
+    """
+    오류가 늘면 동시성을 줄이고, 성공이 이어지면 다시 늘리는 제한기입니다. (AIMD)
+
+    - 실패하면 limit을 절반으로 줄인다. 한꺼번에 실패한 요청들이 limit을 연달아 줄이지 않도록
+      cooldown초 안에는 한 번만 줄인다.
+    - limit번 연속으로 성공하면 limit을 1 늘린다. (maximum까지)
+
+    slot()으로 동시에 실행되는 작업 수를 limit 이하로 막거나, limit 값을 배치 크기로 쓴다.
+    """
+
+    def __init__(self, limit, minimum=1, maximum=None, cooldown=1.0, name="limiter"):
+        """
+        Args:
+            limit (int): 처음 동시성.
+            minimum (int): 줄일 수 있는 최소값.
+            maximum (int): 늘릴 수 있는 최대값. 없으면 limit.
+            cooldown (float): 줄인 뒤 다시 줄이지 않는 시간(초).
+            name (str): 로그와 지표에 쓸 이름.
+        """
+        self.minimum = max(minimum, 1)
+        self.maximum = max(maximum or limit, self.minimum)
+        self.limit = min(max(limit, self.minimum), self.maximum)
+        self.cooldown = cooldown
+        self.name = name
+        self.active = 0
+        self.successes = 0
+        self.decreased = 0.0
+        self.condition = threading.Condition()
+
+    def record(self, ok):
+        """
+        작업 결과를 알립니다.
+
+        Args:
+            ok (bool): 성공했으면 True.
+        """
+        with self.condition:
+            if ok:
+                self.successes += 1
+                if self.successes >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self.successes = 0
+                    self.condition.notify()
+                return
+            self.successes = 0
+            now = time.monotonic()
+            if self.limit > self.minimum and now - self.decreased >= self.cooldown:
+                self.limit = max(self.minimum, self.limit // 2)
+                self.decreased = now
+                METRICS.inc("concurrency_decreased", limiter=self.name)
+                print(f"[INFO] 오류가 늘어 {self.name} 동시성을 {self.limit}(으)로 줄입니다.")
+
+    @contextmanager
+    def slot(self):
+        """동시에 실행 중인 작업이 limit보다 적어질 때까지 기다렸다가 자리를 차지합니다."""
+        with self.condition:
+            while self.active >= self.limit:
+                self.condition.wait()
+            self.active += 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.active -= 1
+                self.condition.notify()
@@ -0,0 +1,305 @@
+from concurrent.futures import ThreadPoolExecutor
+from crawltools.detail_cache import DetailCache
+from crawltools.metrics import METRICS
+from crawltools.retry import AdaptiveLimiter, TokenBucket, retry_call
+from urllib.parse import urlsplit
+import os
+import threading
+import time
+
+# 호스트 하나에 보낼 초당 요청 수와 동시 요청 수 (.env의 HOST_RATE, HOST_CONCURRENCY)
+DEFAULT_HOST_RATE = 2.0
+DEFAULT_HOST_CONCURRENCY = 4
+
+# 모든 호스트를 합쳐 동시에 가져올 페이지 수 (.env의 SCHEDULER_WORKERS)
+DEFAULT_WORKERS = 8
+
+# HTTP 요청 타임아웃(초)
+TIMEOUT = 10
+
+
+class HostLimit:
+    """호스트 하나의 요청 제한. 초당 요청 수는 토큰 버킷으로, 동시 요청 수는 AdaptiveLimiter로 막는다."""
+
+    def __init__(self, host, rate, concurrency):
+        self.host = host
+        self.bucket = TokenBucket(rate, 1)
+        self.limiter = AdaptiveLimiter(concurrency, name=host)
+        self.requests = 0
+        self.seconds = 0.0
+
+
+class SharedHttpFetcher:
+    """
+    FetchScheduler의 HTTP 연결 풀과 호스트별 제한으로 요청하는 HttpFetcher입니다.
+
+    자소설닷컴 소스의 Crawler가 DETAIL_BACKEND=http로 상세 페이지를 가져올 때 쓴다.
+    크롬의 쿠키는 공유 세션의 쿠키 저장소에 도메인별로 넣으므로 다른 사이트 요청에는 붙지 않는다.
+    """
+
+    def __init__(self, scheduler, cookies=None, user_agent=None):
+        """
+        Args:
+            scheduler (FetchScheduler): 요청을 보낼 스케줄러.
+            cookies (list): Selenium 쿠키 딕셔너리 목록.
+            user_agent (str): 요청에 쓸 User-Agent. 공유 세션이므로 요청마다 헤더로 보낸다.
+        """
+        self.scheduler = scheduler
+        self.headers = {"User-Agent": user_agent} if user_agent else None
+        self.set_cookies(cookies or [])
+
+    def set_cookies(self, cookies):
+        jar = self.scheduler.get_session().cookies
+        for cookie in cookies:
+            jar.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+
+    def fetch(self, url):
+        return self.scheduler.fetch(url, headers=self.headers)
+
+    def close(self):
+        """연결 풀은 스케줄러가 닫으므로 할 일이 없다."""
+
+
+class FetchScheduler:
+    """
+    여러 공고 사이트(sources/)를 함께 크롤링하는 스케줄러입니다.
+
+    - 크롬 하나와 HTTP 연결 풀 하나를 모든 소스가 함께 쓴다. 크롬은 처음 필요할 때 띄우고,
+      한 번에 한 소스만 쓰도록 browser_lock으로 막는다.
+    - 호스트마다 초당 요청 수와 동시 요청 수를 제한한다. (오류가 늘면 동시 요청 수를 줄인다)
+    - 소스들의 목록 크롤링과 상세 페이지 수집을 동시에 실행하고, 결과를 하나의 공고 dict로 합친다.
+
+    Crawler와 같은 get_all_stars, add_times, window_for, reset_stats, report, close를 제공하므로
+    main.run_cycle의 상태 DB 비교와 캘린더 등록을 그대로 쓴다.
+    """
+
+    def __init__(self, names=None, fetcher=None, rate=None, concurrency=None, workers=None):
+        """
+        Args:
+            names (str | list): 크롤링할 소스 이름. 없으면 .env의 SOURCES (기본 'jasoseol').
+            fetcher (Fetcher): 쓸 크롬 Fetcher. 없으면 처음 필요할 때 띄운다.
+            rate (float): 호스트별 초당 요청 수. 없으면 .env의 HOST_RATE (기본 2).
+            concurrency (int): 호스트별 동시 요청 수. 없으면 .env의 HOST_CONCURRENCY (기본 4).
+            workers (int): 모든 호스트를 합친 동시 요청 수. 없으면 .env의 SCHEDULER_WORKERS (기본 8).
+        """
+        from sources.registry import open_sources
+
+        self.rate = rate or float(os.getenv("HOST_RATE", DEFAULT_HOST_RATE))
+        self.concurrency = concurrency or int(os.getenv("HOST_CONCURRENCY", DEFAULT_HOST_CONCURRENCY))
+        self.workers = workers or int(os.getenv("SCHEDULER_WORKERS", DEFAULT_WORKERS))
+        self.fetcher = fetcher
+        self.browser_lock = threading.RLock()
+        self.hosts = {}
+        self.lock = threading.Lock()
+        self.session = None
+        self.cache = DetailCache()
+        self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix="fetch")
+        self.sources = open_sources(self, names)
+        # 사이트 설정에 rate, concurrency가 있으면 그 호스트의 제한을 따로 둔다
+        for source in self.sources:
+            if "list_url" in source.config:
+                self.host(source.config["list_url"], source.config.get("rate"), source.config.get("concurrency"))
+        # 이번 크롤링에서 목록을 가져오지 못한 소스 (이 소스의 공고는 동기화 모드에서 지우지 않는다)
+        self.failed_sources = set()
+
+    def host(self, url, rate=None, concurrency=None):
+        """url 호스트의 요청 제한을 반환합니다. 처음 보는 호스트면 만든다."""
+        host = urlsplit(url).hostname or url
+        with self.lock:
+            if host not in self.hosts:
+                self.hosts[host] = HostLimit(host, rate or self.rate, concurrency or self.concurrency)
+            return self.hosts[host]
+
+    def browser(self):
+        """모든 소스가 함께 쓰는 크롬 Fetcher를 반환합니다. 처음 부를 때 띄운다."""
+        with self.browser_lock:
+            if self.fetcher is None:
+                from crawltools.fetcher import Fetcher
+                self.fetcher = Fetcher()
+            return self.fetcher
+
+    def get_session(self):
+        with self.lock:
+            if self.session is None:
+                # requests는 HTTP로 가져오는 소스가 있을 때만 불러온다
+                from requests.adapters import HTTPAdapter
+                import requests
+
+                self.session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=max(len(self.sources), 1), pool_maxsize=self.workers)
+                self.session.mount("https://", adapter)
+                self.session.mount("http://", adapter)
+            return self.session
+
+    def get(self, url, headers=None):
+        response = self.get_session().get(url, headers=headers, timeout=TIMEOUT)
+        response.raise_for_status()
+        return response.text
+
+    def fetch(self, url, headers=None):
+        """
+        HTTP로 페이지를 가져옵니다. 호스트의 요청 제한을 지키고, 429나 5xx면 백오프로 다시 요청한다.
+
+        Returns:
+            str | None: HTML 소스. 요청에 실패하면 None.
+        """
+        limit = self.host(url)
+        start = time.perf_counter()
+        try:
+            with limit.limiter.slot(), METRICS.span("source_fetch", host=limit.host):
+                return retry_call(
+                    self.get, url, headers=headers, bucket=limit.bucket, limiter=limit.limiter,
+                    name=f"{limit.host} 요청",
+                )
+        except Exception as e:
+            print(f"[ERROR] HTTP 요청 실패 ({url}): {e}")
+            return None
+        finally:
+            with self.lock:
+                limit.requests += 1
+                limit.seconds += time.perf_counter() - start
+
+    def fetch_browser(self, url):
+        """크롬으로 페이지를 엽니다. 호스트의 초당 요청 수를 지키고, 다른 소스와 번갈아 쓴다."""
+        limit = self.host(url)
+        limit.bucket.acquire()
+        start = time.perf_counter()
+        with self.browser_lock:
+            try:
+                with METRICS.span("source_fetch", host=limit.host, backend="selenium"):
+                    return self.browser().fetch_with_selenium(url)
+            finally:
+                with self.lock:
+                    limit.requests += 1
+                    limit.seconds += time.perf_counter() - start
+
+    def map(self, func, items):
+        """items 각각에 func를 실행합니다. (호스트 제한은 func 안의 fetch가 지킨다)"""
+        return list(self.executor.map(func, items))
+
+    def run_sources(self, task, sources):
+        """
+        소스마다 task(source)를 동시에 실행합니다.
+
+        Returns:
+            dict: 소스 이름 -> 결과 또는 예외.
+        """
+        def run(source):
+            try:
+                return task(source)
+            except Exception as e:
+                print(f"🚨 {source.name} 크롤링 실패: {e}")
+                return e
+
+        with ThreadPoolExecutor(max(len(sources), 1), thread_name_prefix="source") as executor:
+            return dict(zip([source.name for source in sources], executor.map(run, sources)))
+
+    def get_all_stars(self):
+        """
+        모든 소스의 즐겨찾기 공고를 동시에 가져와 합칩니다. 일부 소스가 실패해도 나머지 결과는 쓴다.
+
+        Returns:
+            dict: 공고 키 -> {"company_name", "link"}
+        """
+        results = self.run_sources(lambda source: source.list_postings(), self.sources)
+        self.failed_sources = {name for name, result in results.items() if isinstance(result, Exception)}
+        if len(self.failed_sources) == len(self.sources):
+            raise next(iter(results.values()))
+
+        posts = {}
+        for name, result in results.items():
+            if name not in self.failed_sources:
+                posts.update(result)
+                print(f"[INFO] {name}: 즐겨찾기 공고 {len(result)}개")
+        return posts
+
+    def add_times(self, posts, ids):
+        """공고 키를 소스별로 나눠 각 소스가 동시에 마감 시간을 채웁니다."""
+        from sources.base import split_key
+
+        groups = {}
+        for key in ids:
+            groups.setdefault(split_key(key)[0], []).append(key)
+        sources = [source for source in self.sources if source.name in groups]
+        for name in set(groups) - {source.name for source in sources}:
+            # 설정에서 빠진 소스의 공고 (지난 실행에서 처리하지 못한 공고)
+            for key in groups[name]:
+                posts[key]["date"] = posts[key]["subtitle"] = None
+        results = self.run_sources(lambda source: source.add_times(posts, groups[source.name]), sources)
+        for name, result in results.items():
+            if isinstance(result, Exception):
+                for key in groups[name]:
+                    posts[key].setdefault("date", None)
+                    posts[key].setdefault("subtitle", None)
+
+    def window_for(self, key):
+        """
+        공고 키가 속한 소스의 크롤링 기간을 반환합니다. 동기화 모드는 이 기간 안의 공고만 지운다.
+
+        Returns:
+            tuple | None: (시작, 끝). 목록을 가져오지 못한 소스나 이번에 크롤링하지 않은 소스의 공고면 None.
+        """
+        for source in self.sources:
+            if source.name not in self.failed_sources:
+                window = source.window_for(key)
+                if window is not None:
+                    return window
+        return None
+
+    def reset_login(self):
+        for source in self.sources:
+            source.reset_login()
+
+    def reset_stats(self):
+        """소스별 통계와 호스트별 요청 수를 비웁니다. 데몬처럼 스케줄러를 재사용하면 크롤링마다 부른다."""
+        for source in self.sources:
+            source.reset_stats()
+        with self.lock:
+            for limit in self.hosts.values():
+                limit.requests = 0
+                limit.seconds = 0.0
+
+    def report(self):
+        """소스별 통계와 호스트별 요청 수, 평균 응답 시간을 출력합니다."""
+        for source in self.sources:
+            source.report()
+        for limit in self.hosts.values():
+            if limit.requests:
+                print(
+                    f"[INFO] {limit.host}: 요청 {limit.requests}개, 평균 {limit.seconds / limit.requests:.2f}초, "
+                    f"동시 요청 {limit.limiter.limit}개"
+                )
+        if any(self.cache.stats.values()):
+            self.cache.report()
+
+    def close(self):
+        for source in self.sources:
+            source.close()
+        self.executor.shutdown(wait=False)
+        if self.session is not None:
+            self.session.close()
+        if self.fetcher is not None:
+            self.fetcher.close_driver()
+
+
+def open_crawler(fetcher=None):
+    """
+    .env의 SOURCES에 맞는 크롤러를 만듭니다.
+
+    자소설닷컴만 크롤링하면 예전처럼 Crawler를 쓰고(비동기 파이프라인도 쓸 수 있다),
+    다른 사이트가 있으면 FetchScheduler가 모든 소스를 함께 크롤링한다.
+
+    Args:
+        fetcher (Fetcher): 쓸 크롬 Fetcher. 없으면 새로 띄운다.
+
+    Returns:
+        Crawler | FetchScheduler: get_all_stars, add_times, window_for, reset_stats, report, close가 있는 크롤러.
+    """
+    from sources.base import DEFAULT_SOURCE
+    from sources.registry import source_names
+
+    names = source_names()
+    if names == [DEFAULT_SOURCE]:
+        from crawltools.crawler import Crawler
+        return Crawler(fetcher)
+    return FetchScheduler(names, fetcher)
@@ -0,0 +1,62 @@
+import hashlib
+import json
+import os
+import time
+
+# 로그인 세션(쿠키, localStorage)을 저장할 폴더
+SESSION_DIR = ".session"
+
+
+class SessionStore:
+    """
+    로그인에 성공한 브라우저 세션을 파일로 저장하고 다음 실행에서 다시 불러옵니다.
+
+    파일은 로그인 방식과 계정별로 따로 저장됩니다. 계정 이름은 해시로만 남깁니다.
+    """
+
+    def __init__(self, login_method, account, directory=None):
+        """
+        Args:
+            login_method (str): 로그인 방식 ('general' 또는 'kakao').
+            account (str): 로그인 계정 ID.
+            directory (str): 세션 파일 폴더. 없으면 .env의 SESSION_DIR (기본 .session).
+        """
+        directory = directory or os.getenv("SESSION_DIR", SESSION_DIR)
+        account_hash = hashlib.sha256((account or "").encode()).hexdigest()[:16]
+        self.path = os.path.join(directory, f"{login_method}_{account_hash}.json")
+
+    def load(self):
+        """
+        저장된 세션을 불러옵니다.
+
+        Returns:
+            dict | None: {"cookies", "local_storage", "saved_at"} 또는 저장된 세션이 없으면 None.
+        """
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] 세션 파일을 읽을 수 없습니다: {e}")
+            return None
+
+    def save(self, cookies, local_storage):
+        """
+        세션을 저장합니다. 쿠키가 들어 있으므로 본인만 읽을 수 있게 권한을 제한합니다.
+
+        Args:
+            cookies (list): Selenium 쿠키 딕셔너리 목록.
+            local_storage (dict): localStorage 키/값.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {"cookies": cookies, "local_storage": local_storage, "saved_at": time.time()}
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        print(f"[INFO] 로그인 세션 저장: {self.path}")
+
+    def clear(self):
+        """만료된 세션 파일을 삭제합니다."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
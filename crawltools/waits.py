@@ -0,0 +1,153 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from crawltools.metrics import METRICS
+import os
+import time
+
+# 단계별 기본 타임아웃(초). .env의 WAIT_TIMEOUT_<단계 이름 대문자>로 덮어쓸 수 있다.
+DEFAULT_TIMEOUTS = {
+    "page": 10,       # 첫 페이지 로딩 (로그인 버튼 표시)
+    "modal": 5,       # 로그인 모달 / 카카오 창
+    "login": 20,      # 로그인 완료
+    "calendar": 15,   # .calendar-item 목록 렌더링
+    "month": 10,      # addMonth(1) 후 달 변경
+    "detail": 10,     # 상세 페이지의 body5 마감 시간
+    "xhr": 5,         # DATA_SOURCE=json일 때 달력 API 응답 (안 오면 DOM으로 넘어간다)
+}
+
+CALENDAR_ITEM = ".calendar-item"
+SIGN_IN_BUTTON = ".sign-in-button.btn"
+# 달력 상단의 "YYYY년 M월" 헤더 (.env의 MONTH_HEADER_SELECTOR). 못 찾으면 첫 공고가 다시 그려지는지로 판단한다.
+MONTH_HEADER = ".calendar-header, .month-title"
+DEADLINE_SPAN = (
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' body5 ')]"
+    "//span[normalize-space()='~']/following-sibling::span"
+)
+
+
+class Waiter:
+    """
+    고정된 time.sleep 대신 페이지 상태를 직접 확인하면서 기다립니다.
+
+    단계마다 타임아웃을 따로 두고, 실제로 기다린 시간을 timings에 기록합니다.
+    타임아웃이 나도 예외를 던지지 않고 False를 반환해, 예전처럼 현재 페이지로 계속 진행할 수 있게 합니다.
+    """
+
+    def __init__(self, driver, timeouts=None):
+        self.driver = driver
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        for step in DEFAULT_TIMEOUTS:
+            value = os.getenv(f"WAIT_TIMEOUT_{step.upper()}")
+            if value:
+                self.timeouts[step] = float(value)
+        self.timeouts.update(timeouts or {})
+        self.month_header = os.getenv("MONTH_HEADER_SELECTOR") or MONTH_HEADER
+
+        # (단계 이름, 기다린 초, 성공 여부)
+        self.timings = []
+
+    def until(self, step, condition, timeout=None):
+        """
+        condition이 참이 될 때까지 기다리고 걸린 시간을 기록합니다.
+
+        Args:
+            step (str): 단계 이름. 타임아웃 설정과 기록에 쓰인다.
+            condition (callable): driver를 받아 참/거짓(또는 요소)을 반환하는 함수.
+            timeout (float): 이 호출에만 쓸 타임아웃. 없으면 단계 설정값.
+
+        Returns:
+            object: 조건의 반환값. 타임아웃이면 False.
+        """
+        timeout = timeout if timeout is not None else self.timeouts.get(step, 10)
+        start = time.perf_counter()
+        try:
+            result = WebDriverWait(
+                self.driver, timeout, ignored_exceptions=(StaleElementReferenceException,)
+            ).until(condition)
+        except TimeoutException:
+            print(f"[ERROR] '{step}' 대기 시간 초과 ({timeout}초)")
+            result = False
+        seconds = time.perf_counter() - start
+        self.timings.append((step, seconds, bool(result)))
+        METRICS.observe("wait", seconds, step=step, timeout=not result)
+        return result
+
+    def page_ready(self):
+        """첫 페이지에서 로그인 버튼을 누를 수 있을 때까지 기다립니다."""
+        return self.until("page", EC.element_to_be_clickable((By.CSS_SELECTOR, SIGN_IN_BUTTON)))
+
+    def visible(self, by, selector, step="modal"):
+        """요소가 화면에 보일 때까지 기다리고 그 요소를 반환합니다."""
+        return self.until(step, EC.visibility_of_element_located((by, selector)))
+
+    def calendar_rendered(self):
+        """.calendar-item 목록이 그려질 때까지 기다립니다."""
+        return self.until("calendar", EC.presence_of_element_located((By.CSS_SELECTOR, CALENDAR_ITEM)))
+
+    def login_finished(self):
+        """로그인 버튼이 사라져 로그인이 끝날 때까지 기다립니다."""
+        return self.until("login", EC.invisibility_of_element_located((By.CSS_SELECTOR, SIGN_IN_BUTTON)))
+
+    def deadline_present(self):
+        """상세 페이지에 body5 마감 시간(~ 뒤의 span)이 나타날 때까지 기다립니다."""
+        return self.until("detail", EC.presence_of_element_located((By.XPATH, DEADLINE_SPAN)))
+
+    def month_snapshot(self):
+        """
+        달 이동 전 상태(헤더 텍스트, 첫 공고 요소)를 저장합니다. month_changed에 넘겨 쓴다.
+
+        Returns:
+            tuple: (헤더 텍스트 또는 None, 첫 .calendar-item 요소 또는 None)
+        """
+        headers = self.driver.find_elements(By.CSS_SELECTOR, self.month_header)
+        items = self.driver.find_elements(By.CSS_SELECTOR, CALENDAR_ITEM)
+        header = headers[0].text if headers else None
+        return header, (items[0] if items else None)
+
+    def month_changed(self, snapshot):
+        """
+        addMonth(1) 클릭 후 달 헤더가 바뀌거나 기존 공고 목록이 다시 그려질 때까지 기다린 뒤,
+        새 달의 .calendar-item 목록이 그려질 때까지 기다립니다.
+
+        Args:
+            snapshot (tuple): 클릭 전에 month_snapshot()으로 저장한 상태.
+        """
+        header, first_item = snapshot
+
+        def changed(driver):
+            if header is not None:
+                headers = driver.find_elements(By.CSS_SELECTOR, self.month_header)
+                if headers and headers[0].text != header:
+                    return True
+            if first_item is not None:
+                return EC.staleness_of(first_item)(driver)
+            return header is None
+
+        return self.until("month", changed) and self.calendar_rendered()
+
+    def summary(self):
+        """
+        단계별 대기 횟수와 시간 합계를 반환합니다.
+
+        Returns:
+            dict: 단계 이름 -> {"count", "total", "max", "timeouts"}
+        """
+        result = {}
+        for step, seconds, ok in self.timings:
+            entry = result.setdefault(step, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            entry["count"] += 1
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+            if not ok:
+                entry["timeouts"] += 1
+        return result
+
+    def report(self):
+        """단계별 대기 시간을 출력합니다."""
+        for step, entry in self.summary().items():
+            print(
+                f"[INFO] 대기 '{step}': {entry['count']}회, 합계 {entry['total']:.2f}초, "
+                f"최대 {entry['max']:.2f}초, 시간 초과 {entry['timeouts']}회"
+            )
@@ -0,0 +1,157 @@
+from contextlib import contextmanager
+from crawltools.chrome_profile import process_tree
+from crawltools.metrics import METRICS
+import os
+import signal
+import threading
+
+# 페이지 하나를 여는 최대 시간(초) (.env의 DRIVER_PAGE_TIMEOUT). 넘기면 driver.get이 TimeoutException을 낸다.
+DEFAULT_PAGE_TIMEOUT = 30
+
+# 드라이버를 새로 띄우기 전까지 열 최대 페이지 수 (.env의 DRIVER_MAX_PAGES, 0이면 제한 없음)
+DEFAULT_MAX_PAGES = 200
+
+# 크롬 프로세스 전체의 최대 메모리(MB) (.env의 DRIVER_MAX_RSS_MB, 0이면 제한 없음)
+DEFAULT_MAX_RSS_MB = 1500
+
+# page_timeout이 지나도 이만큼(초) 더 응답이 없으면 크롬이 멈춘 것으로 보고 프로세스를 강제로 종료한다
+HANG_GRACE = 15
+
+# 메모리는 /proc 전체를 읽어야 하므로 이 페이지 수마다 한 번씩만 확인한다
+RSS_CHECK_EVERY = 10
+
+
+class Watchdog:
+    """
+    Fetcher의 크롬 드라이버를 감시합니다.
+
+    - 드라이버에 페이지 로딩 타임아웃(page_timeout)을 건다.
+    - navigation()으로 감싼 호출이 page_timeout + HANG_GRACE초 안에 끝나지 않으면 크롬 프로세스를 강제로 종료해
+      막힌 호출을 풀고, hung으로 표시한다.
+    - check()를 부를 때 드라이버가 멈췄거나, max_pages개 넘게 페이지를 열었거나, 크롬 메모리가 max_rss_mb를 넘었으면
+      드라이버를 새로 띄우고 remember()로 기억해 둔 로그인 세션을 복원한다.
+    """
+
+    def __init__(self, fetcher, page_timeout=None, max_pages=None, max_rss_mb=None):
+        """
+        Args:
+            fetcher (Fetcher): 감시할 Fetcher. restart_driver()와 chrome_pid()가 있어야 한다.
+            page_timeout (float): 페이지 로딩 타임아웃(초). 없으면 .env의 DRIVER_PAGE_TIMEOUT (기본 30).
+            max_pages (int): 드라이버 하나로 열 최대 페이지 수. 없으면 .env의 DRIVER_MAX_PAGES (기본 200).
+            max_rss_mb (int): 크롬 메모리 한도(MB). 없으면 .env의 DRIVER_MAX_RSS_MB (기본 1500).
+        """
+        self.fetcher = fetcher
+        self.page_timeout = page_timeout or float(os.getenv("DRIVER_PAGE_TIMEOUT", DEFAULT_PAGE_TIMEOUT))
+        self.max_pages = max_pages if max_pages is not None else int(os.getenv("DRIVER_MAX_PAGES", DEFAULT_MAX_PAGES))
+        self.max_rss_mb = (
+            max_rss_mb if max_rss_mb is not None else int(os.getenv("DRIVER_MAX_RSS_MB", DEFAULT_MAX_RSS_MB))
+        )
+        # 지금 드라이버로 연 페이지 수, 새로 띄운 횟수
+        self.pages = 0
+        self.restarts = 0
+        # 크롬이 멈춰서 강제로 종료했는지 (다음 check()에서 새로 띄운다)
+        self.hung = False
+        # 새 드라이버에 복원할 로그인 세션 (URL, SessionStore.load() 형식의 dict)
+        self.session = None
+
+    def configure(self, driver):
+        """새로 띄운 드라이버에 타임아웃을 겁니다."""
+        driver.set_page_load_timeout(self.page_timeout)
+        driver.set_script_timeout(self.page_timeout)
+
+    def remember(self, url, session):
+        """
+        드라이버를 새로 띄운 뒤 복원할 로그인 세션을 기억합니다.
+
+        Args:
+            url (str): 세션을 복원할 페이지 URL.
+            session (dict): {"cookies": [...], "local_storage": {...}}
+        """
+        self.session = (url, session)
+
+    @contextmanager
+    def navigation(self):
+        """
+        페이지 이동 한 번을 감시합니다. 시간 안에 끝나지 않으면 크롬을 강제로 종료해 호출이 예외로 끝나게 한다.
+        """
+        timer = threading.Timer(self.page_timeout + HANG_GRACE, self.kill)
+        timer.daemon = True
+        timer.start()
+        try:
+            yield
+        finally:
+            timer.cancel()
+            self.pages += 1
+
+    def kill(self):
+        """멈춘 chromedriver와 크롬 프로세스를 모두 강제로 종료합니다."""
+        self.hung = True
+        METRICS.inc("driver_hangs")
+        print(f"[ERROR] 크롬이 {self.page_timeout + HANG_GRACE:.0f}초 넘게 응답하지 않아 강제로 종료합니다.")
+        pid = self.fetcher.chrome_pid()
+        if pid is None:
+            return
+        # /proc가 없으면 chromedriver만 종료한다 (크롬은 chromedriver가 끊기면 따라 종료된다)
+        for child in process_tree(pid) or [pid]:
+            try:
+                os.kill(child, getattr(signal, "SIGKILL", signal.SIGTERM))
+            except OSError:
+                pass
+
+    def check(self):
+        """
+        페이지를 열기 전(안전한 시점)에 부릅니다. 멈췄거나 한도를 넘은 드라이버를 새로 띄운다.
+
+        Returns:
+            bool: 드라이버를 새로 띄웠으면 True.
+        """
+        if self.hung:
+            reason = "hung"
+        elif self.max_pages and self.pages >= self.max_pages:
+            reason = "pages"
+        elif self.max_rss_mb and self.pages and self.pages % RSS_CHECK_EVERY == 0 and self.over_memory():
+            reason = "memory"
+        else:
+            return False
+        self.recycle(reason)
+        return True
+
+    def over_memory(self):
+        rss = self.fetcher.chrome_rss_kb()
+        return rss is not None and rss > self.max_rss_mb * 1024
+
+    def recycle(self, reason):
+        """
+        드라이버를 새로 띄우고 로그인 세션을 복원합니다.
+
+        살아 있는 드라이버면 지금 쿠키와 localStorage를 가져가고, 멈춘 드라이버면 remember()로 기억해 둔 세션을 쓴다.
+
+        Args:
+            reason (str): 'hung', 'pages', 'memory'.
+
+        Returns:
+            bool: 로그인 세션을 복원했으면 True. 복원할 세션이 없거나 만료되었으면 False.
+        """
+        print(f"[INFO] 크롬 드라이버를 새로 띄웁니다. (이유: {reason}, 연 페이지 {self.pages}개)")
+        if not self.hung and self.session is not None:
+            try:
+                self.session = (self.session[0], {
+                    "cookies": self.fetcher.get_cookies(),
+                    "local_storage": self.fetcher.get_local_storage(),
+                })
+            except Exception as e:
+                print(f"[ERROR] 세션 가져오기 실패, 기억해 둔 세션을 씁니다: {e}")
+
+        with METRICS.span("driver_restart", reason=reason):
+            self.fetcher.restart_driver(kill=self.hung)
+        self.hung = False
+        self.pages = 0
+        self.restarts += 1
+
+        if self.session is None:
+            return False
+        url, session = self.session
+        if self.fetcher.restore_session(url, session) is None:
+            print("[ERROR] 새 드라이버에 로그인 세션을 복원하지 못했습니다.")
+            return False
+        return True
@@ -0,0 +1,107 @@
+from crawltools.json_parser import JsonParser
+from crawltools.metrics import METRICS
+import base64
+import json
+import os
+import re
+
+# 달력 데이터를 주는 API로 볼 URL 패턴. .env의 XHR_URL_PATTERN으로 바꿀 수 있다.
+URL_PATTERN = r"jasoseol\.com/.*(calendar|employment|recruit)"
+
+
+class XhrCapture:
+    """
+    크롬 performance 로그에서 달력 API의 JSON 응답을 꺼냅니다.
+
+    Fetcher의 드라이버를 performance 로그를 켠 상태로 띄워야 한다. (chrome_options의 network_log)
+    응답 본문은 CDP의 Network.getResponseBody로 읽는다.
+    """
+
+    def __init__(self, fetcher, pattern=None):
+        """
+        Args:
+            fetcher (Fetcher): performance 로그를 켠 크롬 드라이버를 가진 Fetcher.
+            pattern (str): 가져올 응답 URL의 정규식. 없으면 .env의 XHR_URL_PATTERN.
+        """
+        self.fetcher = fetcher
+        self.pattern = re.compile(pattern or os.getenv("XHR_URL_PATTERN", URL_PATTERN))
+        # 응답 헤더는 왔지만 본문을 아직 다 받지 못한 요청 (requestId -> URL)
+        self.pending = {}
+
+    def drain(self):
+        """
+        지금까지 쌓인 performance 로그를 읽고 비우면서, 다 받은 JSON 응답을 반환합니다.
+
+        Returns:
+            list: (URL, JSON 데이터) 목록.
+        """
+        try:
+            entries = self.fetcher.driver.get_log("performance")
+        except Exception as e:
+            print(f"[ERROR] performance 로그 읽기 실패: {e}")
+            return []
+
+        finished = set()
+        for entry in entries:
+            message = json.loads(entry["message"]).get("message", {})
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.responseReceived":
+                response = params.get("response", {})
+                if "json" in response.get("mimeType", "") and self.pattern.search(response.get("url", "")):
+                    self.pending[params["requestId"]] = response["url"]
+            elif method == "Network.loadingFinished":
+                finished.add(params.get("requestId"))
+            elif method == "Network.loadingFailed":
+                self.pending.pop(params.get("requestId"), None)
+
+        payloads = []
+        for request_id in [request_id for request_id in self.pending if request_id in finished]:
+            url = self.pending.pop(request_id)
+            try:
+                body = self.fetcher.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                text = base64.b64decode(body["body"]).decode() if body.get("base64Encoded") else body["body"]
+                payloads.append((url, json.loads(text)))
+            except Exception as e:
+                print(f"[ERROR] 응답 본문 읽기 실패 ({url}): {e}")
+        METRICS.inc("xhr_responses", len(payloads))
+        return payloads
+
+    def clear(self):
+        """쌓인 로그를 버립니다. (상세 페이지처럼 JSON을 쓰지 않는 페이지를 연 뒤)"""
+        try:
+            self.fetcher.driver.get_log("performance")
+        except Exception:
+            pass
+        self.pending.clear()
+
+    def calendar(self, skip_ids=frozenset()):
+        """
+        쌓인 응답에서 달력 공고를 뽑습니다.
+
+        Returns:
+            tuple | None: JsonParser.calendar의 결과. 달력 응답이 없으면 None.
+        """
+        return JsonParser.calendar(self.drain(), skip_ids)
+
+    def wait_calendar(self, waiter, skip_ids=frozenset()):
+        """
+        달력 API 응답이 올 때까지 기다렸다가 공고를 뽑습니다. 화면이 다 그려질 때까지 기다리지 않는다.
+
+        Args:
+            waiter (Waiter): 드라이버의 Waiter. 'xhr' 단계 타임아웃을 쓴다.
+            skip_ids (set): 이미 파싱한 공고 ID.
+
+        Returns:
+            tuple | None: JsonParser.calendar의 결과. 시간 안에 달력 응답이 오지 않으면 None.
+        """
+        found = {}
+
+        def arrived(driver):
+            result = self.calendar(skip_ids)
+            if result is not None:
+                found["result"] = result
+            return result is not None
+
+        waiter.until("xhr", arrived)
+        return found.get("result")
@@ -0,0 +1,157 @@
+from google.state_store import StateStore
+from crawltools.scheduler import open_crawler
+from crawltools.metrics import METRICS
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from main import run_cycle
+from outputs.factory import open_output
+import json
+import os
+import random
+import signal
+import threading
+import time
+
+# 기본 설정 (.env로 덮어쓸 수 있다)
+DEFAULT_INTERVAL = 30 * 60   # 실행 간격(초)
+DEFAULT_JITTER = 0.2         # 실행 간격을 ±20% 흔들어 매번 같은 시각에 접속하지 않게 한다
+STATUS_FILE = ".state/daemon_status.json"
+# 연속으로 이만큼 실패하면 상태를 unhealthy로 보고한다
+UNHEALTHY_AFTER = 3
+
+
+class DaemonStatus:
+    """
+    데몬의 상태를 기록하고 상태 파일(JSON)에 씁니다. 상태 엔드포인트도 이 내용을 그대로 보여준다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.data = {
+            "pid": os.getpid(),
+            "state": "starting",
+            "started_at": time.time(),
+            "cycles": 0,
+            "consecutive_failures": 0,
+            "healthy": True,
+            "last_cycle": None,
+            "next_run_at": None,
+        }
+
+    def update(self, **values):
+        with self.lock:
+            self.data.update(values)
+            self.data["healthy"] = self.data["consecutive_failures"] < UNHEALTHY_AFTER
+            snapshot = dict(self.data)
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.data)
+
+
+def start_status_server(status, port):
+    """
+    127.0.0.1:port에서 상태를 JSON으로 보여주는 HTTP 서버를 띄웁니다. 건강하면 200, 아니면 503으로 응답한다.
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버.
+    """
+    class StatusHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            data = status.snapshot()
+            body = json.dumps(data, ensure_ascii=False).encode()
+            self.send_response(200 if data["healthy"] else 503)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), StatusHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"[INFO] 상태 엔드포인트: http://127.0.0.1:{port}/")
+    return server
+
+
+def next_delay(interval, jitter):
+    """실행 간격에 ±jitter 비율만큼 무작위로 흔든 대기 시간(초)을 반환합니다."""
+    return interval * random.uniform(1 - jitter, 1 + jitter)
+
+
+def main():
+    """
+    크롬과 캘린더 출력을 계속 띄워 둔 채로, 일정 간격마다 즐겨찾기 달력을 확인해 바뀐 것만 반영합니다.
+    """
+    interval = float(os.getenv("DAEMON_INTERVAL", DEFAULT_INTERVAL))
+    jitter = float(os.getenv("DAEMON_JITTER", DEFAULT_JITTER))
+    sync = os.getenv("DAEMON_SYNC", "0") == "1"
+    port = int(os.getenv("DAEMON_STATUS_PORT", "0"))
+
+    print("📂 자소설 마감 일정 데몬 시작!")
+    status = DaemonStatus(os.getenv("DAEMON_STATUS_FILE", STATUS_FILE))
+    status.update()
+    server = start_status_server(status, port) if port else None
+
+    # SIGTERM / Ctrl+C를 받으면 현재 사이클을 마치고 종료
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+
+    # 한 번만 띄우고 계속 쓰는 크롬과 출력 (Google이면 캘린더 서비스)
+    crawler = open_crawler()
+    output = open_output()
+    store = StateStore(output.calendar_id)
+
+    while not stop.is_set():
+        status.update(state="running", next_run_at=None)
+        started = time.time()
+        try:
+            report = run_cycle(crawler, output, store, sync)
+            cycle = {
+                "started_at": started,
+                "duration": time.time() - started,
+                "ok": True,
+                "created": len(report["created"]),
+                "updated": len(report["updated"]),
+                "deleted": len(report["deleted"]),
+                "failed": len(report["failed"]),
+            }
+            failures = 0
+        except Exception as e:
+            print(f"🚨 사이클 실패: {e}")
+            cycle = {"started_at": started, "duration": time.time() - started, "ok": False, "error": str(e)}
+            failures = status.snapshot()["consecutive_failures"] + 1
+            # 다음 사이클에서 로그인 상태부터 다시 확인
+            crawler.reset_login()
+
+        METRICS.observe("cycle", cycle["duration"], ok=cycle["ok"])
+        METRICS.export()
+
+        delay = next_delay(interval, jitter)
+        status.update(
+            state="sleeping",
+            cycles=status.snapshot()["cycles"] + 1,
+            consecutive_failures=failures,
+            last_cycle=cycle,
+            next_run_at=time.time() + delay,
+        )
+        print(f"[INFO] 사이클 {cycle['duration']:.1f}초, 다음 실행까지 {delay:.0f}초 대기")
+        stop.wait(delay)
+
+    status.update(state="stopped", next_run_at=None)
+    if server:
+        server.shutdown()
+    crawler.close()
+    print("✅ 데몬 종료")
+
+
+if __name__ == "__main__":
+    main()
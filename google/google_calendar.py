@@ -1,15 +1,39 @@
 import os
 import pytz
 import re
-from datetime import timedelta
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+import time
+from datetime import datetime, timedelta
+from googleapiclient.errors import HttpError
+from google.state_store import StateStore, content_hash
+from crawltools.metrics import METRICS
+from crawltools.retry import AdaptiveLimiter, TokenBucket, backoff_delay, is_retryable, retry_attempts, retry_call
+from sources.registry import posting_url
 
 # Google Calendar API 권한 설정
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# 배치 요청 하나에 묶을 최대 API 호출 수 (Calendar API 권장 한도)
+BATCH_SIZE = 50
+
+# 초당 보낼 API 호출 수 (.env의 GOOGLE_API_RATE, 0이면 제한 없음)와 순간 허용량 (.env의 GOOGLE_API_BURST).
+# Calendar API의 기본 할당량(사용자당 분당 600회)에 맞춘 값이다. 배치 요청은 안에 든 호출 수만큼 센다.
+DEFAULT_API_RATE = 10
+DEFAULT_API_BURST = BATCH_SIZE
+
+# 처리하지 못한 공고를 포기하기 전까지 다시 시도할 최대 실행 횟수 (.env의 PENDING_ATTEMPTS)
+DEFAULT_PENDING_ATTEMPTS = 5
+
+_api_bucket = None
+_batch_limiter = None
+
+# 토큰 파일 경로 -> 한 번 불러온 인증 정보와 서비스 객체 (daemon처럼 한 프로세스에서 여러 번 로그인할 때 재사용)
+_services = {}
+
+# 이벤트의 extendedProperties.private에 넣는 키. 이 도구가 만든 이벤트를 description 없이 구분한다.
+SOURCE_KEY = 'source'
+SOURCE_VALUE = 'jasoseol'
+EMPLOYMENT_ID_KEY = 'employment_id'
+
 
 def get_new_credentials(credentials_path, scopes, token_path):
     """
@@ -23,6 +47,8 @@ def get_new_credentials(credentials_path, scopes, token_path):
     Returns:
         google.oauth2.credentials.Credentials: 새로 발급받은 인증 객체.
     """
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     try:
         flow = InstalledAppFlow.from_client_secrets_file(
             credentials_path, scopes)
@@ -39,25 +65,30 @@ def get_new_credentials(credentials_path, scopes, token_path):
         raise # 인증 실패 시 프로그램 중단
 
 
-def google_calendar_login():
+def load_credentials(token_path, credentials_path):
     """
-    Google Calendar API에 인증하고 서비스 객체를 반환합니다.
+    저장된 토큰으로 인증 정보를 불러오고, 만료되었으면 갱신합니다.
     Refresh 토큰 만료 시 token.json을 삭제하고 새로 인증을 시도합니다.
 
+    Args:
+        token_path (str): 토큰 파일 경로.
+        credentials_path (str): OAuth 클라이언트 credentials.json 경로.
+
     Returns:
-        googleapiclient.discovery.Resource: Google Calendar API 서비스 객체.
+        google.oauth2.credentials.Credentials: 유효한 인증 객체.
     """
-    creds = None
-    cred_folder = 'google/cred/'
-    token_path = os.path.join(cred_folder, 'token.json')
-    credentials_path = os.path.join(cred_folder, 'credentials.json')
+    from google.oauth2.credentials import Credentials
 
+    creds = None
     # 기존 인증 토큰 파일(token.json)이 있는 경우 로드
     if os.path.exists(token_path):
         creds = Credentials.from_authorized_user_file(token_path, SCOPES)
     # 인증이 없거나 만료된 경우 새로 인증
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
+            # 토큰을 갱신할 때만 requests 기반 전송 계층을 불러온다
+            from google.auth.transport.requests import Request
+
             # 토큰 갱신 시도
             try:
                 creds.refresh(Request())  # 토큰 갱신
@@ -70,12 +101,82 @@ def google_calendar_login():
         else:
             # 기존에 토큰이 없거나, 유효하지 않거나, refresh_token이 없는 경우
             creds = get_new_credentials(credentials_path, SCOPES, token_path)
+    return creds
+
+
+def google_calendar_login(token_path=None, credentials_path=None):
+    """
+    Google Calendar API에 인증하고 서비스 객체를 반환합니다.
+
+    인증 정보는 토큰 파일마다 한 번만 불러오고, 같은 프로세스에서 다시 부르면 만든 서비스 객체를 그대로 돌려준다.
+    (googleapiclient의 HTTP 전송 계층이 만료된 액세스 토큰을 알아서 갱신한다)
+    API 구조(discovery 문서)는 google-api-python-client에 들어 있는 정적 사본으로 만들어 네트워크 요청을 하지 않는다.
+
+    Args:
+        token_path (str): 토큰 파일 경로. 없으면 google/cred/token.json (계정마다 따로 둘 때 지정).
+        credentials_path (str): OAuth 클라이언트 credentials.json 경로. 없으면 google/cred/credentials.json.
 
-    # Google Calendar API 서비스 객체 생성
-    service = build('calendar', 'v3', credentials=creds)
+    Returns:
+        googleapiclient.discovery.Resource: Google Calendar API 서비스 객체.
+    """
+    cred_folder = 'google/cred/'
+    token_path = token_path or os.path.join(cred_folder, 'token.json')
+    credentials_path = credentials_path or os.path.join(cred_folder, 'credentials.json')
+    if token_path in _services:
+        return _services[token_path]
+    os.makedirs(os.path.dirname(token_path) or '.', exist_ok=True)
+
+    with METRICS.span("startup", phase="credentials"):
+        creds = load_credentials(token_path, credentials_path)
+
+    # Google Calendar API 서비스 객체 생성 (googleapiclient.discovery는 import만 0.2초 넘게 걸려 여기서 불러온다)
+    with METRICS.span("startup", phase="calendar_client"):
+        from googleapiclient.discovery import build
+
+        service = build('calendar', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
+    _services[token_path] = service
     return service
 
 
+def api_bucket():
+    """
+    프로세스에서 함께 쓰는 API 호출 토큰 버킷을 반환합니다. (.env를 읽은 뒤에 처음 만든다)
+
+    Returns:
+        TokenBucket: 초당 GOOGLE_API_RATE개씩 차는 버킷.
+    """
+    global _api_bucket
+    if _api_bucket is None:
+        rate = float(os.getenv('GOOGLE_API_RATE', DEFAULT_API_RATE))
+        _api_bucket = TokenBucket(rate, int(os.getenv('GOOGLE_API_BURST', DEFAULT_API_BURST)))
+    return _api_bucket
+
+
+def batch_limiter():
+    """
+    배치 크기를 정하는 AdaptiveLimiter를 반환합니다.
+    요청 한도 초과나 5xx가 나면 배치를 작게 나눠 보내고, 성공이 이어지면 BATCH_SIZE까지 다시 키운다.
+    """
+    global _batch_limiter
+    if _batch_limiter is None:
+        _batch_limiter = AdaptiveLimiter(BATCH_SIZE, maximum=BATCH_SIZE, name="캘린더 배치")
+    return _batch_limiter
+
+
+def execute(request, name):
+    """
+    API 요청 하나를 토큰 버킷에 맞춰 보내고, 요청 한도 초과나 5xx면 지수 백오프로 다시 시도합니다.
+
+    Args:
+        request (googleapiclient.http.HttpRequest): 보낼 요청.
+        name (str): 로그와 지표에 쓸 API 메서드 이름.
+
+    Returns:
+        dict: 응답.
+    """
+    return retry_call(request.execute, bucket=api_bucket(), name=name)
+
+
 def get_or_create_calendar(service, calendar_name='recruit_schedule'):
     """
     Google Calendar에서 특정 이름의 캘린더를 가져오거나, 없으면 새로 생성합니다.
@@ -88,7 +189,7 @@ def get_or_create_calendar(service, calendar_name='recruit_schedule'):
         str: 캘린더 ID.
     """
     # 1. 캘린더 목록 가져오기
-    calendars = service.calendarList().list().execute().get('items', [])
+    calendars = execute(service.calendarList().list(), 'calendarList.list').get('items', [])
     for calendar in calendars:
         if calendar['summary'] == calendar_name:
             print(f"📅 '{calendar_name}' 캘린더가 이미 존재합니다.")
@@ -100,56 +201,260 @@ def get_or_create_calendar(service, calendar_name='recruit_schedule'):
         'summary': calendar_name,
         'timeZone': 'Asia/Seoul'
     }
-    created_calendar = service.calendars().insert(body=new_calendar).execute()
+    created_calendar = execute(service.calendars().insert(body=new_calendar), 'calendars.insert')
     print(f"✅ '{calendar_name}' 캘린더 생성 완료: {created_calendar['id']}")
     return created_calendar['id']  # 새로 생성된 캘린더 ID 반환
 
 
-def get_all_events(service, calendar_id):
+def list_events(service, calendar_id, sync_token=None, private_property=None):
     """
-    Google Calendar에서 모든 이벤트를 가져와, description 필드에서 recruit/ 뒤의 숫자를 추출하여 set으로 반환.
+    캘린더의 이벤트를 nextPageToken을 따라 끝까지 가져옵니다.
+
+    sync_token을 주면 그 이후에 바뀐 이벤트(삭제된 이벤트 포함)만 가져옵니다.
+    토큰이 만료되었으면 Google API가 410 Gone으로 응답하며, 이때는 HttpError가 그대로 전달됩니다.
 
     Args:
         service (googleapiclient.discovery.Resource): Google Calendar API 서비스 객체.
         calendar_id (str): 캘린더의 ID.
+        sync_token (str): 이전 목록 조회에서 받은 nextSyncToken.
+        private_property (str): 'key=value' 형식의 extendedProperties.private 필터. sync_token과 함께 쓸 수 없다.
 
     Returns:
-        set: recruit/ 뒤의 숫자로 구성된 집합.
+        tuple: (이벤트 리스트, 다음 조회에 쓸 nextSyncToken. 필터를 쓰면 None)
     """
-    # Google Calendar API를 통해 이벤트 목록 가져오기
-    events_result = service.events().list(
-        calendarId=calendar_id,
-        maxResults=2500,  # 최대 2500개의 이벤트 가져오기
-        singleEvents=True,
-        orderBy='startTime'
-    ).execute()
-    events = events_result.get('items', [])
+    events = []
+    page_token = None
+    while True:
+        params = {
+            'calendarId': calendar_id,
+            'maxResults': 2500,  # 페이지당 최대 2500개
+            'singleEvents': True,
+            'pageToken': page_token,
+        }
+        if sync_token:
+            params['syncToken'] = sync_token
+        if private_property:
+            params['privateExtendedProperty'] = private_property
+        events_result = execute(service.events().list(**params), 'events.list')
+        METRICS.inc("api_calls", method="events.list")
+        METRICS.inc("api_round_trips")
+        events.extend(events_result.get('items', []))
 
-    recruit_ids = set()  # recruit/ 뒤의 숫자를 저장할 set
+        page_token = events_result.get('nextPageToken')
+        if not page_token:
+            return events, events_result.get('nextSyncToken')
 
-    if not events:
-        print("📅 가져올 일정이 없습니다.")
+
+def extract_recruit_id(event):
+    """
+    이벤트의 공고 ID를 반환합니다.
+    extendedProperties.private의 employment_id를 먼저 보고, 없으면(예전에 만든 이벤트) description의 recruit/ 뒤 숫자를 쓴다.
+
+    Returns:
+        str | None: 공고 ID. 이 도구가 만든 이벤트가 아니면 None.
+    """
+    private = event.get('extendedProperties', {}).get('private', {})
+    if private.get(EMPLOYMENT_ID_KEY):
+        return private[EMPLOYMENT_ID_KEY]
+    description = event.get('description', '')  # description 필드 가져오기
+    match = re.search(r'recruit/(\d+)', description)  # recruit/ 뒤의 숫자 추출
+    return match.group(1) if match else None
+
+
+def save_event_state(store, event):
+    """
+    이벤트 하나의 상태를 StateStore에 반영합니다. 삭제된 이벤트는 지웁니다.
+
+    Args:
+        store (StateStore): 로컬 상태 저장소.
+        event (dict): Google Calendar 이벤트.
+    """
+    recruit_id = extract_recruit_id(event)
+    if event.get('status') == 'cancelled' or not recruit_id:
+        store.remove_events([event['id']])
+        return
+
+    # 마감 시간은 한국 시간 기준 naive ISO 문자열로 저장 (크롤링 결과와 같은 형식)
+    deadline = event.get('end', {}).get('dateTime')
+    if deadline:
+        local_tz = pytz.timezone('Asia/Seoul')
+        deadline = datetime.fromisoformat(deadline).astimezone(local_tz).replace(tzinfo=None).isoformat()
+    # subtitle이 없는 공고는 첫 줄이 비어 있다. (예전 버전은 'None'을 그대로 적었다)
+    subtitle = event.get('description', '').split('\n')[0]
+    if subtitle in ('', 'None'):
+        subtitle = None
+    store.upsert(recruit_id, event['id'], deadline, subtitle, event.get('summary'))
+
+
+def rebuild_state(service, calendar_id, store):
+    """
+    이 도구가 만든 이벤트만 필터 조회(privateExtendedProperty)로 가져와 로컬 상태를 다시 만듭니다.
+
+    employment_id 속성이 없는 예전 이벤트는 처음 한 번만 전체 목록에서 description으로 찾아 넣습니다.
+
+    Args:
+        service (googleapiclient.discovery.Resource): Google Calendar API 서비스 객체.
+        calendar_id (str): 캘린더의 ID.
+        store (StateStore): 로컬 상태 저장소.
+    """
+    if store.get_meta('legacy_scanned'):
+        events, _ = list_events(service, calendar_id, private_property=f'{SOURCE_KEY}={SOURCE_VALUE}')
     else:
+        events, _ = list_events(service, calendar_id)
+
+    store.clear()
+    for event in events:
+        save_event_state(store, event)
+    store.set_meta('legacy_scanned', '1')
+
+
+@METRICS.timed("get_all_events")
+def get_all_events(service, calendar_id, store=None, incremental=None):
+    """
+    Google Calendar의 이벤트를 로컬 상태 저장소(StateStore)에 동기화하고, 등록된 공고 ID를 set으로 반환.
+
+    증분 모드에서는 지난 실행에서 저장한 syncToken으로 바뀐 이벤트만 가져와 반영합니다.
+    토큰이 만료되었거나 저장된 토큰이 없으면 전체 목록을 다시 가져옵니다.
+    전체 모드에서는 이 도구가 만든 이벤트만 필터 조회로 가져와 상태를 다시 만듭니다.
+
+    Args:
+        service (googleapiclient.discovery.Resource): Google Calendar API 서비스 객체.
+        calendar_id (str): 캘린더의 ID.
+        store (StateStore): 로컬 상태 저장소. 없으면 캘린더의 기본 저장소를 연다.
+        incremental (bool): 증분 동기화 여부. 없으면 .env의 CALENDAR_SYNC ('incremental' 기본, 'full').
+
+    Returns:
+        set: 캘린더에 등록된 공고 ID 집합.
+    """
+    if store is None:
+        store = StateStore(calendar_id)
+    if incremental is None:
+        incremental = os.getenv('CALENDAR_SYNC', 'incremental').lower() != 'full'
+
+    if not incremental:
+        rebuild_state(service, calendar_id, store)
+        store.set_meta('sync_token', None)
+    else:
+        sync_token = store.get_meta('sync_token')
+        try:
+            events, next_token = list_events(service, calendar_id, sync_token)
+        except HttpError as e:
+            if e.resp.status != 410:
+                raise
+            print("📅 동기화 토큰이 만료되어 전체 목록을 다시 가져옵니다.")
+            sync_token = None
+            events, next_token = list_events(service, calendar_id)
+
+        if sync_token:
+            print(f"📅 마지막 실행 이후 바뀐 일정: {len(events)}개")
+        else:
+            # 전체 목록이면 로컬 상태를 새로 만든다 (삭제된 이벤트는 목록에 없으므로)
+            store.clear()
+            store.set_meta('legacy_scanned', '1')
+
+        # 변경 사항을 로컬 상태에 반영 (삭제된 이벤트는 status가 cancelled)
         for event in events:
-            description = event.get('description', '')  # description 필드 가져오기
-            match = re.search(r'recruit/(\d+)', description)  # recruit/ 뒤의 숫자 추출
-            if match:
-                recruit_ids.add(match.group(1))  # 숫자를 set에 추가
+            save_event_state(store, event)
+        store.set_meta('sync_token', next_token)
 
-    print(f"📅 recruit/ 뒤의 숫자 ID: {recruit_ids}")
+    recruit_ids = store.known_ids()
+    if not recruit_ids:
+        print("📅 가져올 일정이 없습니다.")
+    print(f"📅 캘린더에 등록된 공고 ID: {recruit_ids}")
     return recruit_ids
 
 
-def create_event(service, calendar_id, company_name, deadline, description="자소설 마감 일정입니다"):
+def execute_batch(service, requests, attempts=None):
     """
-    Google Calendar에 새로운 이벤트를 생성합니다.
+    여러 API 요청을 배치 요청(최대 BATCH_SIZE개씩)으로 묶어 실행합니다.
+    요청마다 성공/실패를 따로 기록하므로, 일부가 실패해도 나머지는 그대로 처리됩니다.
+
+    요청 한도 초과(429, rateLimitExceeded)나 5xx로 실패한 요청만 모아 지수 백오프 뒤에 다시 배치로 보낸다.
+    배치 크기는 batch_limiter가 정하며, 다시 시도할 오류가 나면 줄어들었다가 성공이 이어지면 다시 커진다.
 
     Args:
         service (googleapiclient.discovery.Resource): Google Calendar API 서비스 객체.
-        calendar_id (str): 이벤트를 추가할 캘린더의 ID.
+        requests (list): (키, HttpRequest) 튜플 목록. 키는 결과를 구분하는 데 쓰이며 서로 달라야 한다.
+        attempts (int): 요청마다 최대 시도 횟수. 없으면 .env의 RETRY_ATTEMPTS (기본 5).
+
+    Returns:
+        tuple: (성공한 키 -> 응답 dict, 실패한 키 -> 예외 dict)
+    """
+    attempts = retry_attempts(attempts)
+    limiter = batch_limiter()
+    succeeded, failed = {}, {}
+    pending = list(requests)
+
+    for attempt in range(attempts):
+        retry = []
+        start = 0
+        while start < len(pending):
+            chunk = pending[start:start + limiter.limit]
+            start += len(chunk)
+            errors = {}
+
+            def callback(request_id, response, exception):
+                if exception is not None:
+                    errors[request_id] = exception
+                else:
+                    succeeded[request_id] = response
+
+            batch = service.new_batch_http_request(callback=callback)
+            for key, request in chunk:
+                batch.add(request, request_id=str(key))
+            api_bucket().acquire(len(chunk))
+            try:
+                with METRICS.span("calendar_batch"):
+                    batch.execute()
+                METRICS.inc("api_round_trips")
+                METRICS.inc("api_calls", len(chunk), method="batch")
+            except Exception as e:
+                if not isinstance(e, HttpError) and not is_retryable(e):
+                    raise
+                # 배치 요청 자체가 실패하면 이 묶음의 결과가 없는 요청은 모두 실패로 기록
+                print(f"🚨 배치 요청 실패: {e}")
+                for key, _ in chunk:
+                    if str(key) not in succeeded:
+                        errors.setdefault(str(key), e)
+
+            # 배치 크기는 요청 단위로 늘린다. (배치마다 한 번씩 세면 limit개 배치가 지나야 1 커진다)
+            if any(is_retryable(error) for error in errors.values()):
+                limiter.record(False)
+            else:
+                for _ in range(len(chunk) - len(errors)):
+                    limiter.record(True)
+            for key, request in chunk:
+                error = errors.get(str(key))
+                if error is None:
+                    continue
+                if is_retryable(error) and attempt + 1 < attempts:
+                    retry.append((key, request))
+                else:
+                    failed[str(key)] = error
+
+        if not retry:
+            break
+        delay = backoff_delay(attempt)
+        METRICS.inc("retries", len(retry), call="batch")
+        print(f"[INFO] 배치 요청 {len(retry)}건 재시도 {attempt + 1}/{attempts - 1} ({delay:.1f}초 후)")
+        time.sleep(delay)
+        pending = retry
+
+    return succeeded, failed
+
+
+def build_event(company_name, deadline, description="자소설 마감 일정입니다", employment_id=None):
+    """
+    Google Calendar 이벤트 데이터를 만듭니다.
+
+    Args:
         company_name (str): 회사 이름.
         deadline (datetime): 마감 시간.
         description (str): 이벤트 설명. 기본값은 "자소설 마감 일정입니다".
+        employment_id (str): 공고 ID. 주어지면 extendedProperties.private에 넣어 필터 조회에 쓴다.
+
+    Returns:
+        dict: events().insert에 넘길 이벤트 데이터.
     """
     local_tz = pytz.timezone('Asia/Seoul')  # 한국 시간대 설정
     end_time = local_tz.localize(deadline)  # 마감 시간 설정
@@ -175,14 +480,37 @@ def create_event(service, calendar_id, company_name, deadline, description="자
             ],
         },
     }
+    if employment_id:
+        event['extendedProperties'] = {
+            'private': {SOURCE_KEY: SOURCE_VALUE, EMPLOYMENT_ID_KEY: str(employment_id)},
+        }
+    return event
+
+
+def create_event(service, calendar_id, company_name, deadline, description="자소설 마감 일정입니다"):
+    """
+    Google Calendar에 새로운 이벤트를 생성합니다.
+
+    Args:
+        service (googleapiclient.discovery.Resource): Google Calendar API 서비스 객체.
+        calendar_id (str): 이벤트를 추가할 캘린더의 ID.
+        company_name (str): 회사 이름.
+        deadline (datetime): 마감 시간.
+        description (str): 이벤트 설명. 기본값은 "자소설 마감 일정입니다".
+    """
+    event = build_event(company_name, deadline, description)
 
     # Google Calendar에 이벤트 추가
-    created_event = service.events().insert(calendarId=calendar_id, body=event).execute()
+    with METRICS.span("calendar_insert"):
+        created_event = execute(service.events().insert(calendarId=calendar_id, body=event), 'events.insert')
+    METRICS.inc("api_calls", method="events.insert")
+    METRICS.inc("api_round_trips")
     print(f"✅ {company_name} 일정 등록됨: {created_event.get('htmlLink')}")
 
-def create_events(service, calendar_id, posts, ids, base_url):
+def create_events(service, calendar_id, posts, ids, base_url, store=None):
     """
     새로 추가된 공고만 Google Calendar에 이벤트로 등록합니다.
+    배치 요청으로 묶어서 보내고, 공고마다 성공/실패를 따로 처리합니다.
 
     Args:
         service (googleapiclient.discovery.Resource): Google Calendar API 서비스 객체.
@@ -190,14 +518,206 @@ def create_events(service, calendar_id, posts, ids, base_url):
         posts (dict): 크롤링된 공고 데이터.
         ids (set): 새로 추가된 공고 ID 집합.
         base_url (str): 공고 상세 URL의 기본 경로.
+        store (StateStore): 로컬 상태 저장소. 주어지면 등록된 이벤트를 바로 기록한다.
+
+    Returns:
+        tuple: (등록에 성공한 공고 ID set, 실패한 공고 ID -> 예외 dict)
     """
     # 새로 추가된 공고만 캘린더에 업로드
-    while ids:
-        key = ids.pop()
+    requests = []
+    missing = {}
+    for key in sorted(ids):
         value = posts[key]
         if value["date"]:  # 날짜가 있는 경우에만 이벤트 생성
             # 시스템 엔지니어 직무는 summary에 반영하고 description은 원본 유지
-            job_title_description = f"{value['subtitle']}\n{base_url}/{key}"
-            create_event(service, calendar_id, value["company_name"], value["date"], job_title_description)
+            job_title_description = f"{value['subtitle'] or ''}\n{posting_url(key, base_url)}"
+            event = build_event(value["company_name"], value["date"], job_title_description, key)
+            requests.append((key, service.events().insert(calendarId=calendar_id, body=event)))
+        else:
+            missing[key] = "마감 시간을 가져오지 못함"
+
+    succeeded, failed = execute_batch(service, requests)
+
+    # 마감 시간을 못 가져온 공고와 등록에 실패한 공고는 다음 실행에서 다시 처리
+    if store is not None:
+        store.add_pending(posts, missing, 'detail')
+        store.add_pending(posts, failed, 'create')
+        store.resolve_pending(succeeded)
+
+    for key, created_event in succeeded.items():
+        print(f"✅ {posts[key]['company_name']} 일정 등록됨: {created_event.get('htmlLink')}")
+        if store is not None:
+            store.upsert(
+                key, created_event.get('id'), posts[key]["date"].isoformat(),
+                posts[key]["subtitle"], created_event.get('summary'),
+            )
+    for key, error in failed.items():
+        print(f"🚨 {posts[key]['company_name']} 일정 등록 실패: {error}")
+
+    print(f"✅ 모든 새 공고 일정 등록 완료! (성공 {len(succeeded)}건, 실패 {len(failed)}건)")
+    return set(succeeded), failed
 
-    print("✅ 모든 새 공고 일정 등록 완료!")
\ No newline at end of file
+
+def restore_pending(store, posts, max_attempts=None):
+    """
+    지난 실행에서 마감 시간을 가져오지 못했거나 등록에 실패한 공고를 posts에 다시 넣습니다.
+    크롤링 기간이 지나 이번 크롤링 결과에 없는 공고도 저장해 둔 회사 이름과 링크로 다시 처리한다.
+
+    max_attempts번 넘게 실패한 공고와 이미 캘린더에 등록된 공고는 pending에서 지운다.
+    수정/삭제에 실패한 공고는 동기화 모드가 다음 실행에서 다시 비교하므로 posts에 넣지 않고,
+    max_attempts번 넘게 실패했거나 상태 DB에서 빠진(일정이 이미 지워진) 공고만 pending에서 지운다.
+
+    Args:
+        store (StateStore): 로컬 상태 저장소.
+        posts (dict): 이번에 크롤링한 공고 데이터. 다시 처리할 공고가 추가된다.
+        max_attempts (int): 최대 실행 횟수. 없으면 .env의 PENDING_ATTEMPTS (기본 5).
+
+    Returns:
+        set: posts에 새로 추가한 공고 ID.
+    """
+    max_attempts = max_attempts or int(os.getenv('PENDING_ATTEMPTS', DEFAULT_PENDING_ATTEMPTS))
+    pending = store.pending()
+    if not pending:
+        return set()
+
+    known = store.known_ids(pending)
+    added, dropped = set(), set()
+    for key, row in pending.items():
+        if row['stage'] in ('update', 'delete'):
+            if key not in known:
+                dropped.add(key)
+            elif row['attempts'] >= max_attempts:
+                action = '수정' if row['stage'] == 'update' else '삭제'
+                print(f"🚨 {row['company_name'] or key} 일정을 {row['attempts']}번 {action}하지 못해 포기합니다: {row['error']}")
+                dropped.add(key)
+        elif key in known:
+            dropped.add(key)
+        elif row['attempts'] >= max_attempts:
+            print(f"🚨 {row['company_name'] or key} 공고를 {row['attempts']}번 처리하지 못해 포기합니다: {row['error']}")
+            dropped.add(key)
+        elif key not in posts:
+            posts[key] = {'company_name': row['company_name'] or '회사 이름 없음', 'link': row['link'] or f'/recruit/{key}'}
+            added.add(key)
+    store.resolve_pending(dropped)
+
+    retrying = len([key for key, row in pending.items() if row['stage'] in ('detail', 'create') and key not in dropped])
+    if retrying:
+        print(f"[INFO] 지난 실행에서 처리하지 못한 공고 {retrying}개를 다시 시도합니다. (크롤링 결과에 없던 공고 {len(added)}개)")
+    return added
+
+
+def in_window(window, key, deadline):
+    """
+    즐겨찾기에서 빠진 공고를 지워도 되는지 확인합니다. 크롤링한 기간 안에 아직 마감되지 않은 공고만 지운다.
+
+    Args:
+        window (tuple | callable): sync_events의 window.
+        key (str): 공고 키.
+        deadline (str): 저장된 ISO 형식의 마감 시간.
+
+    Returns:
+        bool: 지워도 되면 True.
+    """
+    if callable(window):
+        window = window(key)
+    if window is None or not deadline:
+        return False
+    start, end = window
+    start = max(start, datetime.now())
+    return start.isoformat() <= deadline < end.isoformat()
+
+
+def sync_events(service, calendar_id, posts, store, base_url, window):
+    """
+    크롤링한 공고와 캘린더를 양방향으로 맞춥니다. 필요한 API 호출만 합니다.
+
+    - 캘린더에 없는 공고는 새로 등록
+    - 마감 시간이나 subtitle이 바뀐 공고는 해당 이벤트만 patch
+    - 즐겨찾기에서 빠진 공고는 이벤트 삭제. 단, 크롤링한 기간(window) 안에 아직 마감되지 않은 공고만 지운다.
+      (기간 밖의 공고는 크롤링 결과에 없는 것이 당연하고, 지난 공고는 기록으로 남긴다)
+
+    Args:
+        service (googleapiclient.discovery.Resource): Google Calendar API 서비스 객체.
+        calendar_id (str): 캘린더의 ID.
+        posts (dict): 마감 시간까지 채운 크롤링 공고 데이터.
+        store (StateStore): 캘린더와 동기화된 로컬 상태 저장소.
+        base_url (str): 공고 상세 URL의 기본 경로.
+        window (tuple | callable): 크롤링한 기간 (시작 datetime, 끝 datetime),
+            또는 공고 키를 받아 그 공고 소스의 크롤링 기간(크롤링하지 않은 소스면 None)을 반환하는 함수.
+
+    Returns:
+        dict: {"created": [...], "updated": [...], "deleted": [...], "failed": {공고 ID: 예외}}
+    """
+    report = {'created': [], 'updated': [], 'deleted': [], 'failed': {}}
+
+    # 1. 새 공고 등록
+    new_ids = store.new_ids(posts.keys())
+    created, failed = create_events(service, calendar_id, posts, new_ids, base_url, store)
+    report['created'] = sorted(created)
+    report['failed'].update(failed)
+
+    # 2. 바뀐 공고 patch
+    requests = []
+    patched = {}
+    for key in sorted(set(posts) - new_ids):
+        value = posts[key]
+        if not value.get("date"):
+            continue
+        saved = store.get(key)
+        if saved['content_hash'] == content_hash(value["date"].isoformat(), value["subtitle"]):
+            continue
+        job_title_description = f"{value['subtitle'] or ''}\n{posting_url(key, base_url)}"
+        event = build_event(value["company_name"], value["date"], job_title_description, key)
+        requests.append((key, service.events().patch(calendarId=calendar_id, eventId=saved['event_id'], body=event)))
+        patched[key] = saved['event_id']
+
+    # 3. 즐겨찾기에서 빠진 공고 삭제
+    deleted = {}
+    for key in sorted(store.known_ids() - set(posts)):
+        saved = store.get(key)
+        if in_window(window, key, saved['deadline']):
+            requests.append((key, service.events().delete(calendarId=calendar_id, eventId=saved['event_id'])))
+            deleted[key] = saved
+
+    # patch와 delete를 같은 배치로 보낸다
+    succeeded, failed = execute_batch(service, requests)
+    report['failed'].update(failed)
+    store.add_pending(posts, {key: error for key, error in failed.items() if key in patched}, 'update')
+    store.add_pending(posts, {key: error for key, error in failed.items() if key in deleted}, 'delete')
+    store.resolve_pending(succeeded)
+    for key, updated_event in succeeded.items():
+        if key in patched:
+            value = posts[key]
+            store.upsert(key, patched[key], value["date"].isoformat(), value["subtitle"], updated_event.get('summary'))
+            report['updated'].append(key)
+        else:
+            store.remove_events([deleted[key]['event_id']])
+            report['deleted'].append(key)
+
+    # 4. 결과 보고
+    print_sync_report(report, posts, deleted)
+    return report
+
+
+def print_sync_report(report, posts, deleted):
+    """
+    동기화 결과를 출력합니다.
+
+    Args:
+        report (dict): sync_events의 결과.
+        posts (dict): 크롤링한 공고 데이터.
+        deleted (dict): 삭제한 공고 ID -> 저장되어 있던 상태 (StateStore.get 형식).
+    """
+    print("📋 동기화 결과")
+    for key in report['created']:
+        print(f"  ➕ 등록: {posts[key]['company_name']} ({key})")
+    for key in report['updated']:
+        print(f"  ✏️ 수정: {posts[key]['company_name']} ({key}) → {posts[key]['date']}")
+    for key in report['deleted']:
+        print(f"  🗑️ 삭제: {deleted[key]['summary']} ({key})")
+    for key, error in report['failed'].items():
+        print(f"  🚨 실패: {key} ({error})")
+    print(
+        f"✅ 동기화 완료! 등록 {len(report['created'])}건, 수정 {len(report['updated'])}건, "
+        f"삭제 {len(report['deleted'])}건, 실패 {len(report['failed'])}건"
+    )
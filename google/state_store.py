@@ -0,0 +1,246 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+# 상태 DB를 저장할 폴더
+STATE_DIR = 'google/cred/'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    employment_id TEXT PRIMARY KEY,
+    event_id TEXT,
+    deadline TEXT,
+    subtitle TEXT,
+    summary TEXT,
+    content_hash TEXT,
+    last_seen REAL
+);
+CREATE INDEX IF NOT EXISTS postings_event_id ON postings (event_id);
+CREATE TABLE IF NOT EXISTS pending (
+    employment_id TEXT PRIMARY KEY,
+    company_name TEXT,
+    link TEXT,
+    stage TEXT,
+    error TEXT,
+    attempts INTEGER,
+    updated_at REAL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# IN (...) 조회 한 번에 넣을 최대 값 개수 (SQLite 변수 개수 제한보다 작게)
+QUERY_CHUNK = 500
+
+
+def content_hash(deadline, subtitle):
+    """
+    공고 내용(마감 시간, subtitle)의 해시를 만듭니다. 내용이 바뀌었는지 비교하는 데 쓴다.
+
+    Args:
+        deadline (str): ISO 형식의 마감 시간.
+        subtitle (str): 공고 subtitle.
+
+    Returns:
+        str: sha256 해시 문자열.
+    """
+    return hashlib.sha256(f"{deadline or ''}\n{subtitle or ''}".encode()).hexdigest()
+
+
+class StateStore:
+    """
+    캘린더에 등록된 공고 상태를 로컬 SQLite에 저장합니다.
+
+    공고 ID -> 캘린더 이벤트 ID, 마감 시간, subtitle, 마지막으로 본 시각, 내용 해시를 기록하고,
+    증분 동기화에 쓰는 syncToken 같은 값은 meta 테이블에 저장합니다.
+    마감 시간을 가져오지 못했거나 캘린더 반영에 실패한 공고는 pending 테이블에 남겨 다음 실행에서 다시 처리합니다.
+    캘린더마다 DB 파일을 따로 둡니다.
+    """
+
+    def __init__(self, calendar_id, path=None):
+        """
+        Args:
+            calendar_id (str): 캘린더 ID.
+            path (str): DB 파일 경로. 없으면 STATE_DIR/state_<캘린더 ID 해시>.db
+        """
+        if path is None:
+            name = hashlib.sha256(calendar_id.encode()).hexdigest()[:16]
+            path = os.path.join(os.getenv('STATE_DIR', STATE_DIR), f'state_{name}.db')
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        # pipeline.py에서는 이벤트 루프와 asyncio.to_thread의 업로드 스레드가 동시에 읽고 쓴다.
+        # 연결 하나를 함께 쓰므로 모든 조회와 쓰기를 lock 안에서 한다
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def get_meta(self, key):
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self.lock, self.conn:
+            if value is None:
+                self.conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+            else:
+                self.conn.execute(
+                    "INSERT INTO meta (key, value) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                    (key, value),
+                )
+
+    def upsert(self, employment_id, event_id, deadline=None, subtitle=None, summary=None):
+        """
+        공고 상태를 추가하거나 갱신합니다.
+
+        Args:
+            employment_id (str): 공고 ID.
+            event_id (str): 캘린더 이벤트 ID.
+            deadline (str): ISO 형식의 마감 시간.
+            subtitle (str): 공고 subtitle.
+            summary (str): 이벤트 제목.
+        """
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO postings (employment_id, event_id, deadline, subtitle, summary, content_hash, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(employment_id) DO UPDATE SET event_id = excluded.event_id, "
+                "deadline = excluded.deadline, subtitle = excluded.subtitle, summary = excluded.summary, "
+                "content_hash = excluded.content_hash, last_seen = excluded.last_seen",
+                (employment_id, event_id, deadline, subtitle, summary,
+                 content_hash(deadline, subtitle), time.time()),
+            )
+
+    def remove_events(self, event_ids):
+        """캘린더에서 삭제된 이벤트들의 공고 상태를 지웁니다."""
+        with self.lock, self.conn:
+            self.conn.executemany("DELETE FROM postings WHERE event_id = ?", [(e,) for e in event_ids])
+
+    def clear(self):
+        """모든 공고 상태를 지웁니다. (전체 재동기화 전)"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM postings")
+
+    def touch(self, employment_ids):
+        """크롤링에서 다시 본 공고의 last_seen을 현재 시각으로 갱신합니다."""
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "UPDATE postings SET last_seen = ? WHERE employment_id = ?",
+                [(now, id) for id in employment_ids],
+            )
+
+    def known_ids(self, employment_ids=None):
+        """
+        저장된 공고 ID를 반환합니다.
+
+        Args:
+            employment_ids (iterable): 주어지면 이 중에서 저장된 것만 인덱스로 조회한다.
+
+        Returns:
+            set: 공고 ID 집합.
+        """
+        with self.lock:
+            if employment_ids is None:
+                return {row[0] for row in self.conn.execute("SELECT employment_id FROM postings")}
+
+            employment_ids = list(employment_ids)
+            known = set()
+            for start in range(0, len(employment_ids), QUERY_CHUNK):
+                chunk = employment_ids[start:start + QUERY_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                known.update(
+                    row[0] for row in self.conn.execute(
+                        f"SELECT employment_id FROM postings WHERE employment_id IN ({placeholders})", chunk
+                    )
+                )
+        return known
+
+    def new_ids(self, employment_ids):
+        """
+        아직 캘린더에 등록되지 않은 공고 ID를 반환합니다.
+
+        Args:
+            employment_ids (iterable): 크롤링한 공고 ID.
+
+        Returns:
+            set: 저장되지 않은 공고 ID 집합.
+        """
+        employment_ids = set(employment_ids)
+        return employment_ids - self.known_ids(employment_ids)
+
+    def rows(self):
+        """
+        저장된 모든 공고 상태를 반환합니다. (ics 파일처럼 전체를 한 번에 다시 쓸 때)
+
+        Returns:
+            list: 컬럼 이름 -> 값 딕셔너리 목록. 마감 시간 순서.
+        """
+        with self.lock:
+            cursor = self.conn.execute("SELECT * FROM postings ORDER BY deadline, employment_id")
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor]
+
+    def get(self, employment_id):
+        """
+        공고 하나의 상태를 반환합니다.
+
+        Returns:
+            dict | None: 컬럼 이름 -> 값. 없으면 None.
+        """
+        with self.lock:
+            cursor = self.conn.execute("SELECT * FROM postings WHERE employment_id = ?", (employment_id,))
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip([column[0] for column in cursor.description], row))
+
+    def add_pending(self, posts, errors, stage):
+        """
+        처리하지 못한 공고를 다음 실행에서 다시 처리하도록 기록합니다. 이미 있으면 시도 횟수를 늘린다.
+
+        Args:
+            posts (dict): 공고 ID -> 크롤링 데이터 ("company_name", "link"). 없는 공고는 빈 값으로 기록한다.
+            errors (dict): 공고 ID -> 실패 이유 (예외 또는 문자열).
+            stage (str): 실패한 단계 ('detail', 'create', 'update', 'delete').
+        """
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO pending (employment_id, company_name, link, stage, error, attempts, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, 1, ?) "
+                "ON CONFLICT(employment_id) DO UPDATE SET company_name = COALESCE(excluded.company_name, company_name), "
+                "link = COALESCE(excluded.link, link), stage = excluded.stage, error = excluded.error, "
+                "attempts = attempts + 1, updated_at = excluded.updated_at",
+                [
+                    (id, posts.get(id, {}).get("company_name"), posts.get(id, {}).get("link"), stage, str(error), now)
+                    for id, error in errors.items()
+                ],
+            )
+
+    def resolve_pending(self, employment_ids):
+        """처리에 성공했거나 더 처리할 필요가 없는 공고를 pending에서 지웁니다."""
+        with self.lock, self.conn:
+            self.conn.executemany("DELETE FROM pending WHERE employment_id = ?", [(id,) for id in employment_ids])
+
+    def pending(self):
+        """
+        다음 실행에서 다시 처리할 공고를 반환합니다.
+
+        Returns:
+            dict: 공고 ID -> {"company_name", "link", "stage", "error", "attempts", "updated_at"}
+        """
+        with self.lock:
+            cursor = self.conn.execute("SELECT * FROM pending ORDER BY updated_at")
+            columns = [column[0] for column in cursor.description]
+            return {row[0]: dict(zip(columns[1:], row[1:])) for row in cursor}
@@ -1,38 +1,114 @@
-from google.google_calendar import (
-    google_calendar_login,
-    get_or_create_calendar,
-    get_all_events,
-    create_events
-)
+import time
+
+# 프로그램 시작 시각. 아래 모듈을 불러오는 시간과 크롬을 띄우기 전까지의 시간을 잰다.
+STARTED = time.perf_counter()
+
+from google.google_calendar import restore_pending
+from google.state_store import StateStore
 from crawltools.crawler import Crawler, START_URL
+from crawltools.metrics import METRICS
+from crawltools.scheduler import open_crawler
+from outputs.factory import open_output
+import os
+import sys
 
-def main():
-    print("📂 자소설 마감 일정 등록 시작!")
+IMPORT_SECONDS = time.perf_counter() - STARTED
+METRICS.observe("startup", IMPORT_SECONDS, phase="imports")
 
-    # 0. 크롤러
-    crawler = Crawler()
+def run_cycle(crawler, output, store, sync=False, pipeline=None):
+    """
+    크롤링부터 캘린더 반영까지 한 번 실행합니다. 로그인된 크롤러와 출력은 호출하는 쪽에서 재사용한다.
+
+    Args:
+        crawler (Crawler | FetchScheduler): 크롤러. (crawltools.scheduler.open_crawler)
+        output (GoogleOutput | IcsOutput | CaldavOutput): 일정을 내보낼 곳 (outputs.factory.open_output).
+        store (StateStore): 캘린더의 로컬 상태 저장소.
+        sync (bool): True면 새 공고 등록에 더해, 바뀐 마감 시간은 수정하고 즐겨찾기에서 빠진 공고는 삭제한다.
+        pipeline (str): 'staged'(단계별로 차례로 실행) 또는 'async'(단계를 겹쳐서 실행, pipeline.py).
+            없으면 .env의 PIPELINE (기본 'staged').
+
+    Returns:
+        dict: {"created": [...], "updated": [...], "deleted": [...], "failed": {공고 ID: 예외}}
+    """
+    pipeline = (pipeline or os.getenv("PIPELINE", "staged")).lower()
+    # 재사용하는 크롤러의 대기 시간, 처리량 기록은 이번 실행 것만 남긴다
+    crawler.reset_stats()
+    if pipeline == "async" and not isinstance(crawler, Crawler):
+        print("[INFO] 여러 사이트를 크롤링할 때는 비동기 파이프라인 대신 단계별로 실행합니다.")
+        pipeline = "staged"
+    if pipeline == "async":
+        # asyncio 파이프라인은 쓸 때만 불러온다
+        import asyncio
+        from pipeline import run_pipeline
+        return asyncio.run(run_pipeline(crawler, output, store, sync))
+    if pipeline != "staged":
+        raise ValueError("[ERROR] PIPELINE 값이 잘못되었습니다. 'staged' 또는 'async' 중 하나를 설정하세요.")
 
     # 1. 크롤링 데이터 가져오기
     base_url = START_URL
     posts = crawler.get_all_stars()  # 크롤링된 공고 데이터
     print(posts)
 
-    # 2. Google Calendar API 로그인
-    service = google_calendar_login()
+    # 2. 캘린더의 바뀐 일정 가져오기
+    output.get_all_events(store)
+
+    store.touch(posts.keys())
+    # 지난 실행에서 처리하지 못한 공고도 다시 처리 (크롤링 기간이 지난 공고 포함)
+    restore_pending(store, posts)
+    if sync:
+        # 3. 동기화 모드: 모든 공고의 마감 시간을 확인 (상세 페이지 캐시 사용)
+        crawler.add_times(posts, set(posts.keys()))
 
-    # 3. recruit_schedule 캘린더에 접근하거나 생성, 모든 일정 가져오기
-    calendar_id = get_or_create_calendar(service)
-    saved = get_all_events(service, calendar_id)
+        # 4. 캘린더와 비교해서 등록/수정/삭제
+        return output.sync_events(posts, store, base_url, crawler.window_for)
 
-    # 4. 새로 생긴 공고만 구분
-    ids = set(posts.keys()).difference(saved)  # 새로 추가된 공고 ID
+    # 3. 새로 생긴 공고만 구분 (로컬 상태 DB 조회)
+    ids = store.new_ids(posts.keys())  # 새로 추가된 공고 ID
     crawler.add_times(posts, ids)
 
-    # 5. 새로 추가된 공고를 캘린더에 등록
-    create_events(service, calendar_id, posts, ids, base_url)
+    # 4. 새로 추가된 공고를 캘린더에 등록
+    created, failed = output.create_events(posts, ids, base_url, store)
+    return {'created': sorted(created), 'updated': [], 'deleted': [], 'failed': failed}
+
+
+def main(sync=False, crawler=None, service=None, store=None, pipeline=None, output=None):
+    """
+    즐겨찾기한 공고의 마감 일정을 구글 캘린더(또는 .env의 OUTPUT으로 고른 .ics 파일, CalDAV 서버)에 등록합니다.
+
+    Args:
+        sync (bool): True면 새 공고 등록에 더해, 바뀐 마감 시간은 수정하고 즐겨찾기에서 빠진 공고는 삭제한다.
+        crawler (Crawler | FetchScheduler): 사용할 크롤러. 없으면 .env의 SOURCES에 맞게 새로 만든다.
+        service (googleapiclient.discovery.Resource): 'google' 출력에 쓸 캘린더 서비스. 없으면 로그인해서 만든다.
+        store (StateStore): 사용할 로컬 상태 저장소. 없으면 출력의 기본 저장소를 연다.
+        pipeline (str): 'staged' 또는 'async'. run_cycle 참고.
+        output (GoogleOutput | IcsOutput | CaldavOutput): 일정을 내보낼 곳. 없으면 .env의 OUTPUT으로 만든다.
+
+    Returns:
+        dict: run_cycle의 결과.
+    """
+    print("📂 자소설 마감 일정 등록 시작!")
+    startup = time.perf_counter() - STARTED
+    METRICS.observe("startup", startup, phase="before_chrome")
+    print(f"[INFO] 크롬을 띄우기 전까지 {startup:.2f}초 (모듈 import {IMPORT_SECONDS:.2f}초)")
+
+    # 0. 크롤러
+    crawler = crawler or open_crawler()
+
+    # 1. 출력 준비 (Google이면 로그인하고 recruit_schedule 캘린더에 접근하거나 생성)
+    output = output or open_output(service=service)
+    store = store or StateStore(output.calendar_id)
+
+    # 2. 크롤링부터 캘린더 등록까지
+    report = run_cycle(crawler, output, store, sync, pipeline)
+
+    # 3. 단계별 대기 시간, 백엔드별 처리량, 캐시 통계, 메트릭 출력
+    crawler.report()
+    METRICS.report()
+    METRICS.export()
 
     print("✅ 모든 작업 완료!")
+    return report
 
 
 if __name__ == "__main__":
-    main()
+    main(sync="--sync" in sys.argv[1:], pipeline="async" if "--async" in sys.argv[1:] else None)
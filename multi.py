@@ -0,0 +1,210 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+
+# 기본 설정 (.env로 덮어쓸 수 있다)
+ACCOUNTS_FILE = "accounts.json"
+ACCOUNTS_DIR = ".accounts"   # 계정별 세션, 상태 DB, 캐시, 로그를 두는 폴더
+DEFAULT_CHROME = 2           # 모든 계정을 합쳐 동시에 띄울 크롬 수
+
+# 계정 프로필 키 -> 크롤러가 읽는 환경 변수
+PROFILE_ENV = {
+    "login_method": "LOGIN_METHOD",
+    "user_id": "USER_ID",
+    "user_pw": "USER_PW",
+    "kakao_id": "KAKAO_ID",
+    "kakao_pw": "KAKAO_PW",
+}
+
+
+def load_accounts(path):
+    """
+    계정 프로필 목록을 읽습니다.
+
+    Args:
+        path (str): 프로필 JSON 파일 경로. 각 항목은 name과 login_method, 로그인 정보,
+            선택적으로 token_path, credentials_path, env(추가 환경 변수)를 가진다. (account_google_paths 참고)
+
+    Returns:
+        list: 프로필 딕셔너리 목록.
+    """
+    with open(path, encoding="utf-8") as f:
+        accounts = json.load(f)
+
+    names = set()
+    for account in accounts:
+        name = account.get("name")
+        if not name or not re.fullmatch(r"[\w.-]+", name):
+            raise ValueError(f"[ERROR] 계정 이름이 없거나 잘못되었습니다: {name!r} (영문, 숫자, _, -, . 만 가능)")
+        if name in names:
+            raise ValueError(f"[ERROR] 계정 이름이 중복되었습니다: {name}")
+        names.add(name)
+    return accounts
+
+
+def account_env(account, directory):
+    """
+    계정 하나를 실행할 때 쓸 환경 변수를 만듭니다. 세션, 상태 DB, 캐시는 계정 폴더 안에 따로 둔다.
+
+    Returns:
+        dict: 환경 변수 이름 -> 값.
+    """
+    env = {
+        "SESSION_DIR": os.path.join(directory, "session"),
+        "STATE_DIR": os.path.join(directory, "state"),
+        "DETAIL_CACHE_PATH": os.path.join(directory, "cache", "detail_cache.db"),
+        "CHROME_USER_DATA_DIR": os.path.join(directory, "chrome-profile"),
+        # OUTPUT=ics일 때 계정마다 .ics 파일을 따로 쓴다
+        "ICS_PATH": os.path.join(directory, "recruit_schedule.ics"),
+        # 크롬 수는 chrome_slots로 제한하므로 계정 안에서는 크롬을 하나만 쓴다
+        "DETAIL_WORKERS": "1",
+    }
+    for key, name in PROFILE_ENV.items():
+        if account.get(key):
+            env[name] = account[key]
+    env.update({key: str(value) for key, value in account.get("env", {}).items()})
+    return env
+
+
+def account_google_paths(account, directory):
+    """
+    계정의 구글 토큰과 OAuth 클라이언트 파일 경로를 정합니다.
+
+    토큰은 구글 계정(캘린더)마다 달라야 하므로, token_path가 없으면 계정 폴더의 token.json을 쓴다.
+    (google/cred/token.json을 함께 쓰면 모든 계정이 같은 캘린더에 등록한다)
+    OAuth 클라이언트(credentials.json)는 계정끼리 함께 써도 되므로, 계정 폴더에 없으면 google/cred/credentials.json을 쓴다.
+
+    Returns:
+        tuple: (토큰 파일 경로, credentials.json 경로 또는 None)
+    """
+    token_path = account.get("token_path") or os.path.join(directory, "token.json")
+    credentials_path = account.get("credentials_path")
+    if not credentials_path and os.path.exists(os.path.join(directory, "credentials.json")):
+        credentials_path = os.path.join(directory, "credentials.json")
+    return token_path, credentials_path
+
+
+def run_account(account, sync, chrome_slots, root):
+    """
+    계정 하나의 크롤링부터 캘린더 반영까지 실행합니다. 별도 프로세스에서 실행된다.
+
+    출력은 계정 폴더의 run.log에 쓰고, 크롬은 chrome_slots 자리를 얻은 동안에만 띄운다.
+
+    Returns:
+        dict: {"account", "ok", "duration", "created", "updated", "deleted", "failed", "error"}
+    """
+    # crawler를 import할 때 .env를 다시 읽으므로, 계정 설정은 import한 뒤에 덮어쓴다
+    from crawltools.scheduler import open_crawler
+    from main import main
+    from outputs.factory import get_output_kind, open_output
+
+    name = account["name"]
+    directory = os.path.join(root, name)
+    os.makedirs(directory, exist_ok=True)
+    os.environ.update(account_env(account, directory))
+
+    result = {"account": name, "ok": False, "duration": 0.0,
+              "created": [], "updated": [], "deleted": [], "failed": {}, "error": None}
+    start = time.perf_counter()
+
+    # 구글 로그인은 run.log로 출력을 돌리기 전에 한다. (토큰이 없으면 인증 안내가 터미널에 보여야 한다)
+    service = None
+    try:
+        if get_output_kind() == "google":
+            from google.google_calendar import google_calendar_login
+            token_path, credentials_path = account_google_paths(account, directory)
+            if not os.path.exists(token_path):
+                print(f"[INFO] {name}: 구글 토큰이 없어 인증을 시작합니다. ({token_path})")
+            service = google_calendar_login(token_path, credentials_path)
+    except Exception as e:
+        print(f"🚨 {name}: 구글 로그인 실패: {e}")
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["duration"] = time.perf_counter() - start
+        return result
+
+    with open(os.path.join(directory, "run.log"), "a", encoding="utf-8") as log, redirect_stdout(log):
+        print(f"===== {time.strftime('%Y-%m-%d %H:%M:%S')} =====")
+        try:
+            output = open_output(service=service)
+            with chrome_slots:
+                crawler = open_crawler()
+                try:
+                    report = main(sync=sync, crawler=crawler, output=output)
+                finally:
+                    crawler.close()
+            result.update(report, ok=True)
+            # 예외 객체는 프로세스 사이로 넘기지 않고 메시지만 남긴다
+            result["failed"] = {id: str(error) for id, error in report["failed"].items()}
+        except Exception as e:
+            print(f"🚨 계정 실행 실패: {e}")
+            result["error"] = f"{type(e).__name__}: {e}"
+    result["duration"] = time.perf_counter() - start
+    return result
+
+
+def run_all(accounts, sync=False, workers=None, chrome=None, root=None):
+    """
+    여러 계정을 프로세스 풀에서 동시에 실행합니다.
+
+    Args:
+        accounts (list): load_accounts()로 읽은 프로필 목록.
+        sync (bool): True면 main --sync와 같은 동기화 모드로 실행한다.
+        workers (int): 동시에 실행할 계정 수. 없으면 .env의 MULTI_WORKERS (기본 계정 수와 CPU 수 중 작은 값).
+        chrome (int): 모든 계정을 합쳐 동시에 띄울 크롬 수. 없으면 .env의 MULTI_CHROME (기본 2).
+        root (str): 계정별 폴더를 만들 곳. 없으면 .env의 ACCOUNTS_DIR (기본 .accounts).
+
+    Returns:
+        list: 계정별 run_account 결과 (프로필 순서).
+    """
+    workers = workers or int(os.getenv("MULTI_WORKERS", "0")) or min(len(accounts), os.cpu_count() or 1)
+    chrome = chrome or int(os.getenv("MULTI_CHROME", DEFAULT_CHROME))
+    root = root or os.getenv("ACCOUNTS_DIR", ACCOUNTS_DIR)
+
+    results = {}
+    with multiprocessing.Manager() as manager:
+        chrome_slots = manager.BoundedSemaphore(chrome)
+        # 계정마다 새 프로세스에서 실행한다. 워커를 재사용하면 앞 계정의 환경 변수(로그인 정보, env)와
+        # 모듈 전역 상태(METRICS, 캘린더 서비스, API 버킷)가 다음 계정에 남는다
+        with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as executor:
+            futures = {
+                executor.submit(run_account, account, sync, chrome_slots, root): account["name"]
+                for account in accounts
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    # 워커 프로세스 자체가 죽은 경우
+                    results[name] = {"account": name, "ok": False, "duration": 0.0, "created": [],
+                                     "updated": [], "deleted": [], "failed": {}, "error": str(e)}
+                result = results[name]
+                if result["ok"]:
+                    print(
+                        f"[INFO] {name}: {result['duration']:.1f}초, 등록 {len(result['created'])}, "
+                        f"수정 {len(result['updated'])}, 삭제 {len(result['deleted'])}, 실패 {len(result['failed'])}"
+                    )
+                else:
+                    print(f"🚨 {name}: 실패 ({result['error']})")
+    return [results[account["name"]] for account in accounts]
+
+
+def main():
+    """accounts.json의 모든 계정에 대해 즐겨찾기한 공고의 마감 일정을 각자의 구글 캘린더에 등록합니다."""
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    path = args[0] if args else os.getenv("ACCOUNTS_FILE", ACCOUNTS_FILE)
+
+    print("📂 자소설 마감 일정 등록 시작! (여러 계정)")
+    accounts = load_accounts(path)
+    results = run_all(accounts, sync="--sync" in sys.argv[1:])
+    print(f"✅ 모든 작업 완료! (성공 {sum(result['ok'] for result in results)}/{len(results)}개 계정)")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+from google.google_calendar import build_event, in_window, print_sync_report
+from google.state_store import content_hash
+
+# 이 도구가 만든 일정의 UID 뒤에 붙이는 도메인. 공고 ID가 같으면 UID도 항상 같다.
+UID_DOMAIN = "recruit-calendar.jasoseol"
+
+
+def event_uid(employment_id):
+    """
+    공고 ID로 만든 일정 UID를 반환합니다. 실행이 바뀌어도 같은 공고는 같은 UID를 가진다.
+
+    Args:
+        employment_id (str): 공고 ID.
+
+    Returns:
+        str: '<공고 ID>@recruit-calendar.jasoseol'
+    """
+    return f"{employment_id}@{UID_DOMAIN}"
+
+
+def event_row(posts, key, base_url):
+    """
+    크롤링한 공고 하나를 StateStore와 같은 형식의 일정 상태로 만듭니다. 제목은 build_event와 같다.
+
+    Returns:
+        dict: {"employment_id", "event_id", "deadline", "subtitle", "summary"}
+    """
+    value = posts[key]
+    summary = build_event(value["company_name"], value["date"], employment_id=key)['summary']
+    return {
+        "employment_id": key,
+        "event_id": event_uid(key),
+        "deadline": value["date"].isoformat(),
+        "subtitle": value["subtitle"],
+        "summary": summary,
+    }
+
+
+class StoreOutput:
+    """
+    로컬 상태 저장소(StateStore)를 기준으로 일정을 내보내는 출력의 공통 부분입니다.
+
+    Google Calendar처럼 서버에 목록을 묻지 않고, 무엇을 등록/수정/삭제할지는 StateStore와 비교해서 정한다.
+    하위 클래스는 put_events(등록과 수정), delete_events를 구현하고, 바뀐 내용을 한 번에 반영해야 하면 flush를 구현한다.
+    create_events, sync_events의 인자와 반환값은 google_calendar의 같은 이름 함수와 같다.
+    """
+
+    name = None
+    calendar_id = None
+
+    def get_all_events(self, store):
+        """
+        등록된 공고 ID를 반환합니다.
+
+        Returns:
+            set: 등록된 공고 ID 집합.
+        """
+        return store.known_ids()
+
+    def put_events(self, rows, base_url):
+        """
+        일정을 등록하거나 덮어씁니다.
+
+        Args:
+            rows (list): event_row 형식의 일정 목록.
+            base_url (str): 공고 상세 URL의 기본 경로.
+
+        Returns:
+            tuple: (성공한 공고 ID set, 실패한 공고 ID -> 예외 dict)
+        """
+        raise NotImplementedError
+
+    def delete_events(self, rows):
+        """
+        일정을 지웁니다.
+
+        Args:
+            rows (list): StateStore.get 형식의 저장된 상태 목록.
+
+        Returns:
+            tuple: (성공한 공고 ID set, 실패한 공고 ID -> 예외 dict)
+        """
+        raise NotImplementedError
+
+    def flush(self, store, base_url):
+        """바뀐 내용을 한 번에 반영합니다. (하나의 파일로 쓰는 출력용)"""
+
+    def stale(self):
+        """바뀐 내용이 없어도 flush해야 하면 True. (내보낸 파일이 지워졌을 때)"""
+        return False
+
+    def put_new(self, posts, ids, base_url, store):
+        """새 공고를 등록하고 StateStore와 pending에 반영합니다."""
+        rows = []
+        missing = {}
+        for key in sorted(ids):
+            if posts[key]["date"]:  # 날짜가 있는 경우에만 일정 생성
+                rows.append(event_row(posts, key, base_url))
+            else:
+                missing[key] = "마감 시간을 가져오지 못함"
+
+        succeeded, failed = self.put_events(rows, base_url) if rows else (set(), {})
+        for row in rows:
+            if row["employment_id"] in succeeded:
+                store.upsert(row["employment_id"], row["event_id"], row["deadline"], row["subtitle"], row["summary"])
+
+        # 마감 시간을 못 가져온 공고와 등록에 실패한 공고는 다음 실행에서 다시 처리
+        store.add_pending(posts, missing, 'detail')
+        store.add_pending(posts, failed, 'create')
+        store.resolve_pending(succeeded)
+        return succeeded, failed
+
+    def create_events(self, posts, ids, base_url, store):
+        """
+        새로 추가된 공고만 일정으로 등록합니다.
+
+        Returns:
+            tuple: (등록에 성공한 공고 ID set, 실패한 공고 ID -> 예외 dict)
+        """
+        succeeded, failed = self.put_new(posts, ids, base_url, store)
+        for key in sorted(succeeded):
+            print(f"✅ {posts[key]['company_name']} 일정 등록됨 ({self.name})")
+        for key, error in failed.items():
+            print(f"🚨 {posts[key]['company_name']} 일정 등록 실패: {error}")
+        if succeeded or self.stale():
+            self.flush(store, base_url)
+
+        print(f"✅ 모든 새 공고 일정 등록 완료! (성공 {len(succeeded)}건, 실패 {len(failed)}건)")
+        return set(succeeded), failed
+
+    def sync_events(self, posts, store, base_url, window):
+        """
+        크롤링한 공고와 일정을 양방향으로 맞춥니다. 규칙은 google_calendar.sync_events와 같다.
+
+        Returns:
+            dict: {"created": [...], "updated": [...], "deleted": [...], "failed": {공고 ID: 예외}}
+        """
+        report = {'created': [], 'updated': [], 'deleted': [], 'failed': {}}
+
+        # 1. 새 공고 등록
+        new_ids = store.new_ids(posts.keys())
+        created, failed = self.put_new(posts, new_ids, base_url, store)
+        report['created'] = sorted(created)
+        report['failed'].update(failed)
+
+        # 2. 바뀐 공고 덮어쓰기
+        rows = []
+        for key in sorted(set(posts) - new_ids):
+            value = posts[key]
+            if not value.get("date"):
+                continue
+            if store.get(key)['content_hash'] != content_hash(value["date"].isoformat(), value["subtitle"]):
+                rows.append(event_row(posts, key, base_url))
+        updated, failed = self.put_events(rows, base_url) if rows else (set(), {})
+        report['failed'].update(failed)
+        store.add_pending(posts, failed, 'update')
+        for row in rows:
+            if row["employment_id"] in updated:
+                store.upsert(row["employment_id"], row["event_id"], row["deadline"], row["subtitle"], row["summary"])
+                report['updated'].append(row["employment_id"])
+
+        # 3. 즐겨찾기에서 빠진 공고 삭제 (크롤링한 기간 안에 아직 마감되지 않은 공고만)
+        deleted = {}
+        for key in sorted(store.known_ids() - set(posts)):
+            saved = store.get(key)
+            if in_window(window, key, saved['deadline']):
+                deleted[key] = saved
+        removed, failed = self.delete_events(list(deleted.values())) if deleted else (set(), {})
+        report['failed'].update(failed)
+        store.add_pending(posts, failed, 'delete')
+        store.remove_events([deleted[key]['event_id'] for key in sorted(removed)])
+        report['deleted'] = sorted(removed)
+        store.resolve_pending(updated | removed)
+
+        if created or updated or removed or self.stale():
+            self.flush(store, base_url)
+
+        # 4. 결과 보고
+        print_sync_report(report, posts, deleted)
+        return report
@@ -0,0 +1,171 @@
+from concurrent.futures import ThreadPoolExecutor
+from crawltools.retry import AdaptiveLimiter, http_status, retry_call
+from outputs.base import StoreOutput, UID_DOMAIN
+from outputs.ics_output import vcalendar
+from urllib.parse import quote, unquote, urljoin, urlsplit
+import os
+import xml.etree.ElementTree as ElementTree
+
+# 동시에 보낼 PUT/DELETE 요청 수 (.env의 CALDAV_WORKERS)
+DEFAULT_WORKERS = 8
+
+# 요청 타임아웃(초)
+TIMEOUT = 30
+
+DAV = "{DAV:}"
+CTAG = "{http://calendarserver.org/ns/}getctag"
+
+PROPFIND_CTAG = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<d:propfind xmlns:d="DAV:" xmlns:cs="http://calendarserver.org/ns/"><d:prop><cs:getctag/></d:prop></d:propfind>'
+)
+PROPFIND_ETAG = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<d:propfind xmlns:d="DAV:"><d:prop><d:getetag/></d:prop></d:propfind>'
+)
+
+
+class CaldavOutput(StoreOutput):
+    """
+    CalDAV 서버(Nextcloud, Radicale, Baikal 등)의 캘린더 컬렉션에 일정을 씁니다.
+
+    일정 하나가 <컬렉션 URL>/<UID>.ics 리소스 하나이고, UID는 공고 ID로 만든다.
+    등록과 수정은 같은 PUT이므로 여러 번 보내도 결과가 같다. 요청은 keep-alive 세션 하나로
+    CALDAV_WORKERS개까지 동시에 보내고, 429나 5xx 응답이 늘면 동시 요청 수를 줄인다.
+    """
+
+    name = "caldav"
+
+    def __init__(self, url=None, username=None, password=None, workers=None):
+        """
+        Args:
+            url (str): 캘린더 컬렉션 URL. 없으면 .env의 CALDAV_URL.
+            username (str): 사용자 이름. 없으면 .env의 CALDAV_USER.
+            password (str): 비밀번호(앱 비밀번호). 없으면 .env의 CALDAV_PASSWORD.
+            workers (int): 동시에 보낼 요청 수. 없으면 .env의 CALDAV_WORKERS (기본 8).
+        """
+        # requests는 CalDAV 출력을 쓸 때만 불러온다
+        from requests.adapters import HTTPAdapter
+        import requests
+
+        url = url or os.getenv("CALDAV_URL")
+        if not url or urlsplit(url).scheme not in ("http", "https"):
+            raise ValueError("[ERROR] CALDAV_URL 값이 잘못되었습니다. 캘린더 컬렉션의 http(s) URL을 설정하세요.")
+        self.url = url if url.endswith("/") else url + "/"
+        self.calendar_id = f"caldav:{self.url}"
+        self.workers = workers or int(os.getenv("CALDAV_WORKERS", DEFAULT_WORKERS))
+        self.limiter = AdaptiveLimiter(self.workers, name="CalDAV")
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        username = username or os.getenv("CALDAV_USER")
+        if username:
+            self.session.auth = (username, password or os.getenv("CALDAV_PASSWORD", ""))
+
+    def href(self, event_id):
+        return urljoin(self.url, quote(event_id, safe="@") + ".ics")
+
+    def request(self, method, url, **kwargs):
+        response = self.session.request(method, url, timeout=TIMEOUT, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def propfind(self, depth, body):
+        """
+        PROPFIND 요청을 보냅니다.
+
+        Returns:
+            list: (href, {속성 이름: 값}) 목록.
+        """
+        response = retry_call(
+            self.request, "PROPFIND", self.url, data=body.encode(), name="CalDAV 목록 조회",
+            headers={"Depth": str(depth), "Content-Type": "application/xml; charset=utf-8"},
+        )
+        results = []
+        for item in ElementTree.fromstring(response.content).iter(f"{DAV}response"):
+            href = item.findtext(f"{DAV}href") or ""
+            props = {}
+            for prop in item.iter(f"{DAV}prop"):
+                props.update({child.tag: (child.text or "").strip() for child in prop})
+            results.append((href, props))
+        return results
+
+    def get_all_events(self, store):
+        """
+        서버의 일정 목록으로 StateStore를 맞추고, 등록된 공고 ID를 반환합니다.
+
+        컬렉션의 getctag가 지난번과 같으면 목록을 받지 않는다. 서버에서 지워진 일정은 저장소에서도 지워
+        다시 등록하게 하고, 저장소에 없는 이 도구의 일정은 내용을 모르는 상태로 저장해 동기화 모드에서 덮어쓴다.
+
+        Returns:
+            set: 등록된 공고 ID 집합.
+        """
+        ctag = next((props.get(CTAG) for _, props in self.propfind(0, PROPFIND_CTAG)), None)
+        if ctag and ctag == store.get_meta("caldav_ctag"):
+            print("[INFO] CalDAV 캘린더가 바뀌지 않아 목록을 다시 받지 않습니다.")
+            return store.known_ids()
+
+        remote = set()
+        collection = urlsplit(self.url).path
+        for href, _ in self.propfind(1, PROPFIND_ETAG):
+            name = unquote(urlsplit(href).path)
+            if name.rstrip("/") == collection.rstrip("/") or not name.endswith(".ics"):
+                continue
+            uid = name.rsplit("/", 1)[-1][:-len(".ics")]
+            if uid.endswith(f"@{UID_DOMAIN}"):
+                remote.add(uid)
+
+        saved = {store.get(id)["event_id"]: id for id in store.known_ids()}
+        missing = [event_id for event_id in saved if event_id not in remote]
+        store.remove_events(missing)
+        for uid in remote - set(saved):
+            store.upsert(uid.split("@", 1)[0], uid)
+        if missing:
+            print(f"[INFO] CalDAV 서버에서 지워진 일정 {len(missing)}개를 다시 등록합니다.")
+        if ctag:
+            store.set_meta("caldav_ctag", ctag)
+        return store.known_ids()
+
+    def send(self, rows, method, make_request):
+        """rows를 동시에 요청하고 (성공한 공고 ID set, 실패한 공고 ID -> 예외 dict)를 반환합니다."""
+        def send_one(row):
+            with self.limiter.slot():
+                return retry_call(make_request, row, limiter=self.limiter, name=f"CalDAV {method}")
+
+        succeeded, failed = set(), {}
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(rows))) as executor:
+            futures = {row["employment_id"]: executor.submit(send_one, row) for row in rows}
+            for id, future in futures.items():
+                try:
+                    future.result()
+                    succeeded.add(id)
+                except Exception as e:
+                    failed[id] = e
+        return succeeded, failed
+
+    def put_events(self, rows, base_url):
+        def put(row):
+            return self.request(
+                "PUT", self.href(row["event_id"]), data=vcalendar([row], base_url).encode(),
+                headers={"Content-Type": "text/calendar; charset=utf-8"},
+            )
+        return self.send(rows, "PUT", put)
+
+    def delete_events(self, rows):
+        def delete(row):
+            try:
+                return self.request("DELETE", self.href(row["event_id"]))
+            except Exception as e:
+                # 이미 지워진 일정
+                if http_status(e) == 404:
+                    return None
+                raise
+        return self.send(rows, "DELETE", delete)
+
+    def flush(self, store, base_url):
+        # 이 실행에서 바꾼 내용 때문에 다음 실행에서 목록을 다시 받지 않도록 바뀐 getctag를 저장한다
+        ctag = next((props.get(CTAG) for _, props in self.propfind(0, PROPFIND_CTAG)), None)
+        if ctag:
+            store.set_meta("caldav_ctag", ctag)
@@ -0,0 +1,43 @@
+import os
+
+# 일정을 내보낼 곳 (.env의 OUTPUT)
+OUTPUT_KINDS = ("google", "ics", "caldav")
+
+
+def get_output_kind(kind=None):
+    """
+    사용할 출력 종류를 반환합니다.
+
+    Args:
+        kind (str): 'google', 'ics', 'caldav'. 없으면 .env의 OUTPUT (기본 'google').
+
+    Returns:
+        str: 출력 종류.
+    """
+    kind = (kind or os.getenv("OUTPUT", "google")).lower()
+    if kind not in OUTPUT_KINDS:
+        raise ValueError("[ERROR] OUTPUT 값이 잘못되었습니다. 'google', 'ics', 'caldav' 중 하나를 설정하세요.")
+    return kind
+
+
+def open_output(kind=None, service=None):
+    """
+    일정을 내보낼 출력을 만듭니다. 고른 출력의 모듈만 불러온다.
+
+    Args:
+        kind (str): 'google', 'ics', 'caldav'. 없으면 .env의 OUTPUT (기본 'google').
+        service (googleapiclient.discovery.Resource): 'google' 출력에 쓸 캘린더 서비스. 없으면 로그인해서 만든다.
+
+    Returns:
+        GoogleOutput | IcsOutput | CaldavOutput: get_all_events, create_events, sync_events와
+            상태 DB를 고를 calendar_id가 있는 출력.
+    """
+    kind = get_output_kind(kind)
+    if kind == "ics":
+        from outputs.ics_output import IcsOutput
+        return IcsOutput()
+    if kind == "caldav":
+        from outputs.caldav_output import CaldavOutput
+        return CaldavOutput()
+    from outputs.google_output import GoogleOutput
+    return GoogleOutput.open(service)
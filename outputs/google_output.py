@@ -0,0 +1,40 @@
+from google import google_calendar
+
+
+class GoogleOutput:
+    """
+    Google Calendar의 recruit_schedule 캘린더에 일정을 씁니다. (기본 출력)
+
+    google_calendar 모듈의 함수에 서비스 객체와 캘린더 ID를 넘겨 주기만 한다.
+    """
+
+    name = "google"
+
+    def __init__(self, service, calendar_id):
+        """
+        Args:
+            service (googleapiclient.discovery.Resource): Google Calendar API 서비스 객체.
+            calendar_id (str): recruit_schedule 캘린더 ID.
+        """
+        self.service = service
+        self.calendar_id = calendar_id
+
+    @classmethod
+    def open(cls, service=None):
+        """
+        로그인하고 recruit_schedule 캘린더에 접근하거나 생성합니다.
+
+        Args:
+            service (googleapiclient.discovery.Resource): 사용할 캘린더 서비스. 없으면 로그인해서 만든다.
+        """
+        service = service or google_calendar.google_calendar_login()
+        return cls(service, google_calendar.get_or_create_calendar(service))
+
+    def get_all_events(self, store):
+        return google_calendar.get_all_events(self.service, self.calendar_id, store)
+
+    def create_events(self, posts, ids, base_url, store):
+        return google_calendar.create_events(self.service, self.calendar_id, posts, ids, base_url, store)
+
+    def sync_events(self, posts, store, base_url, window):
+        return google_calendar.sync_events(self.service, self.calendar_id, posts, store, base_url, window)
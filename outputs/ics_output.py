@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+from outputs.base import StoreOutput
+from sources.registry import posting_url
+import os
+import pytz
+
+# .ics 파일 기본 경로 (.env의 ICS_PATH)
+ICS_PATH = "calendar/recruit_schedule.ics"
+
+# 일정 알림 (분 단위, build_event와 같다)
+ALARM_MINUTES = (30, 1440)
+
+SITE_TIMEZONE = pytz.timezone('Asia/Seoul')
+
+
+def escape_text(value):
+    """iCalendar TEXT 값의 특수 문자(백슬래시, 세미콜론, 쉼표, 줄바꿈)를 이스케이프합니다."""
+    return (
+        str(value or "").replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def fold_line(line):
+    """
+    75바이트가 넘는 줄을 RFC 5545 방식으로 접습니다. (다음 줄은 공백 하나로 시작)
+    UTF-8 글자 중간에서 자르지 않는다.
+    """
+    if len(line.encode()) <= 75:
+        return line
+    parts, current, size = [], "", 0
+    for char in line:
+        width = len(char.encode())
+        # 이어지는 줄은 앞의 공백 한 칸까지 75바이트
+        if size + width > (75 if not parts else 74):
+            parts.append(current)
+            current, size = "", 0
+        current += char
+        size += width
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+def utc_stamp(value):
+    """naive 한국 시간(또는 aware datetime)을 iCalendar UTC 시간 문자열(YYYYMMDDTHHMMSSZ)로 바꿉니다."""
+    if value.tzinfo is None:
+        value = SITE_TIMEZONE.localize(value)
+    return value.astimezone(pytz.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def vevent_lines(row, base_url, stamp):
+    """
+    저장된 일정 상태 하나를 VEVENT 줄 목록으로 만듭니다. 시작은 마감 5분 전이다. (build_event와 같다)
+
+    Args:
+        row (dict): StateStore 형식의 일정 상태 (employment_id, event_id, deadline, subtitle, summary).
+        base_url (str): 공고 상세 URL의 기본 경로.
+        stamp (str): DTSTAMP 값.
+
+    Returns:
+        list: 접지 않은 줄 목록.
+    """
+    end = datetime.fromisoformat(row["deadline"])
+    link = posting_url(row['employment_id'], base_url)
+    description = f"{row['subtitle'] or ''}\n{link}"
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{row['event_id']}",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART:{utc_stamp(end - timedelta(minutes=5))}",
+        f"DTEND:{utc_stamp(end)}",
+        f"SUMMARY:{escape_text(row['summary'])}",
+        f"DESCRIPTION:{escape_text(description)}",
+        f"URL:{link}",
+    ]
+    for minutes in ALARM_MINUTES:
+        lines += [
+            "BEGIN:VALARM",
+            "ACTION:DISPLAY",
+            f"DESCRIPTION:{escape_text(row['summary'])}",
+            f"TRIGGER:-PT{minutes}M",
+            "END:VALARM",
+        ]
+    lines.append("END:VEVENT")
+    return lines
+
+
+def vcalendar(rows, base_url, name="recruit_schedule"):
+    """
+    일정 목록을 VCALENDAR 문서 하나로 만듭니다.
+
+    Args:
+        rows (list): StateStore 형식의 일정 상태 목록. 마감 시간이 없는 일정은 건너뛴다.
+        base_url (str): 공고 상세 URL의 기본 경로.
+        name (str): 캘린더 이름 (X-WR-CALNAME).
+
+    Returns:
+        str: CRLF 줄바꿈의 iCalendar 문서.
+    """
+    stamp = utc_stamp(datetime.now(pytz.utc))
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//recruit-calendar//jasoseol//KO",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+        "X-WR-TIMEZONE:Asia/Seoul",
+    ]
+    for row in rows:
+        if row.get("deadline"):
+            lines += vevent_lines(row, base_url, stamp)
+    lines.append("END:VCALENDAR")
+    return "".join(fold_line(line) + "\r\n" for line in lines)
+
+
+class IcsOutput(StoreOutput):
+    """
+    즐겨찾기한 공고의 마감 일정을 구독할 수 있는 .ics 파일 하나로 내보냅니다. Google API를 부르지 않는다.
+
+    일정 상태는 StateStore에 두고, 바뀐 내용이 있을 때만 파일 전체를 한 번에 다시 쓴다. (임시 파일에 쓴 뒤 교체)
+    UID는 공고 ID로 만들므로 구독하는 캘린더 앱은 같은 공고를 같은 일정으로 알아본다.
+    """
+
+    name = "ics"
+
+    def __init__(self, path=None, calendar_name="recruit_schedule"):
+        """
+        Args:
+            path (str): .ics 파일 경로. 없으면 .env의 ICS_PATH (기본 calendar/recruit_schedule.ics).
+            calendar_name (str): 캘린더 이름.
+        """
+        self.path = path or os.getenv("ICS_PATH", ICS_PATH)
+        self.calendar_name = calendar_name
+        # 파일마다 상태 DB를 따로 둔다
+        self.calendar_id = f"ics:{os.path.abspath(self.path)}"
+
+    def put_events(self, rows, base_url):
+        # 일정 상태는 StateStore에 저장되고 flush에서 파일로 쓰므로 여기서는 할 일이 없다
+        return {row["employment_id"] for row in rows}, {}
+
+    def delete_events(self, rows):
+        return {row["employment_id"] for row in rows}, {}
+
+    def stale(self):
+        return not os.path.exists(self.path)
+
+    def flush(self, store, base_url):
+        """StateStore의 모든 일정을 .ics 파일로 씁니다."""
+        rows = store.rows()
+        body = vcalendar(rows, base_url, self.calendar_name)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(body)
+        os.replace(temp_path, self.path)
+        print(f"📅 일정 {len(rows)}개를 '{self.path}'에 썼습니다.")
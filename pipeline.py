@@ -0,0 +1,196 @@
+from google.google_calendar import BATCH_SIZE, restore_pending
+from crawltools.crawler import START_URL
+import asyncio
+import os
+
+# 단계 사이 큐의 최대 크기 (.env의 PIPELINE_QUEUE로 덮어쓸 수 있다). 큐가 차면 앞 단계가 기다린다.
+DEFAULT_QUEUE_SIZE = 100
+
+# 등록할 공고가 나온 뒤 같은 배치에 묶을 다음 공고를 기다리는 시간(초) (.env의 PIPELINE_LINGER)
+DEFAULT_LINGER = 0.2
+
+# 단계가 끝났음을 다음 단계에 알리는 값
+DONE = object()
+
+
+async def run_pipeline(crawler, output, store, sync=False, queue_size=None, linger=None):
+    """
+    크롤링부터 캘린더 등록까지를 겹쳐서 실행합니다. run_cycle과 같은 결과를 반환한다.
+
+        크롤링 ──(공고 ID)──> 상세 페이지 수집 ──(HTML)──> 파싱 ──(공고 ID)──> 등록
+        캘린더 일정 조회 ──┘ (새 공고인지 판단)
+
+    - 캘린더 일정 조회는 크롤링과 동시에 시작한다.
+    - 한 달을 파싱할 때마다 새 공고를 바로 다음 단계로 넘기고, 마감 시간이 나온 공고는 바로 등록한다.
+      (공고가 linger초 안에 이어서 나오면 BATCH_SIZE개까지 한 배치로 묶는다)
+    - 캐시, 달력 API 응답, HTTP로 얻는 마감 시간은 크롤링 중에도 가져오고, 크롬이 필요한 상세 페이지는
+      크롬 드라이버를 크롤링과 함께 쓰므로 크롤링이 끝난 뒤에 DETAIL_WORKERS개 워커로 나눠서 연다.
+
+    동기화 모드는 즐겨찾기 전체를 알아야 지울 공고를 정할 수 있으므로, 크롤링과 일정 조회만 겹치고
+    나머지는 run_cycle과 같다.
+
+    Args:
+        crawler (Crawler): 크롤러.
+        output (GoogleOutput | IcsOutput | CaldavOutput): 일정을 내보낼 곳.
+        store (StateStore): 캘린더의 로컬 상태 저장소.
+        sync (bool): True면 동기화 모드.
+        queue_size (int): 단계 사이 큐의 크기. 없으면 .env의 PIPELINE_QUEUE (기본 100).
+        linger (float): 배치에 묶을 다음 공고를 기다리는 시간(초). 없으면 .env의 PIPELINE_LINGER (기본 0.2).
+
+    Returns:
+        dict: {"created": [...], "updated": [...], "deleted": [...], "failed": {공고 ID: 예외}}
+    """
+    loop = asyncio.get_running_loop()
+    queue_size = queue_size or int(os.getenv("PIPELINE_QUEUE", DEFAULT_QUEUE_SIZE))
+    if linger is None:
+        linger = float(os.getenv("PIPELINE_LINGER", DEFAULT_LINGER))
+    backend = os.getenv("DETAIL_BACKEND", "selenium").lower()
+    fetch_workers = int(os.getenv("HTTP_WORKERS", "8")) if backend == "http" else 1
+    browser_workers = int(os.getenv("DETAIL_WORKERS", "1"))
+
+    found = asyncio.Queue(queue_size)    # 크롤링에서 찾은 공고 ID
+    fetched = asyncio.Queue(queue_size)  # (공고 ID, 파싱 결과, HTML)
+    parsed = asyncio.Queue(queue_size)   # 마감 시간까지 채운 공고 ID
+    # 브라우저로 열어야 하는 공고 ID. 크롤링이 끝날 때까지 쌓아 두므로 크기를 제한하지 않는다
+    # (제한하면 드라이버를 쥔 크롤링과 서로 기다리게 된다)
+    browser = asyncio.Queue()
+    posts = {}
+
+    def on_found(new_posts):
+        # 크롤링 스레드에서 불린다. 큐가 차 있으면 자리가 날 때까지 크롤링을 멈춘다.
+        if backend == "http":
+            # HttpFetcher는 드라이버의 쿠키로 만들므로 드라이버를 쓰는 이 스레드에서 미리 만든다
+            crawler.get_http_fetcher()
+        posts.update(new_posts)
+        for id in new_posts:
+            asyncio.run_coroutine_threadsafe(found.put(id), loop).result()
+
+    async def crawl_stage():
+        try:
+            result = await asyncio.to_thread(crawler.get_all_stars, on_found=None if sync else on_found)
+            if not sync:
+                # 지난 실행에서 처리하지 못한 공고 중 이번 크롤링에서 나오지 않은 공고도 넘긴다
+                # (저장소는 일정 조회가 끝난 뒤에 읽는다)
+                await listing_task
+                for id in sorted(restore_pending(store, posts)):
+                    await found.put(id)
+            return result
+        finally:
+            await found.put(DONE)
+
+    if sync:
+        all_posts, _ = await asyncio.gather(
+            crawl_stage(), asyncio.to_thread(output.get_all_events, store)
+        )
+        store.touch(all_posts.keys())
+        restore_pending(store, all_posts)
+        await asyncio.to_thread(crawler.add_times, all_posts, set(all_posts))
+        return await asyncio.to_thread(
+            output.sync_events, all_posts, store, START_URL, crawler.window_for
+        )
+
+    def fetch_one(id):
+        # 0. 달력 API 응답이나 캐시에 마감 시간이 있으면 페이지를 가져오지 않는다
+        ext = crawler.json_details.get(id) or crawler.cache.get(id)
+        if ext is not None:
+            return id, ext, None
+        # 1. HTTP로 먼저 가져온다 (브라우저가 필요하면 None)
+        if backend == "http":
+            html = crawler.detail_html_http(id)
+            if html is not None:
+                return id, None, html
+        return None
+
+    async def list_events():
+        await asyncio.to_thread(output.get_all_events, store)
+        return store.known_ids()
+
+    async def fetch_stage():
+        # 캘린더 조회가 끝나야 어떤 공고가 새 공고인지 알 수 있다
+        known = await listing_task
+        while (id := await found.get()) is not DONE:
+            if id in known:
+                continue
+            item = await asyncio.to_thread(fetch_one, id)
+            if item is None:
+                browser.put_nowait(id)
+            else:
+                await fetched.put(item)
+        # 다른 수집 워커도 끝나도록 다시 넣는다
+        await found.put(DONE)
+        await fetched.put(DONE)
+
+    async def parse_stage():
+        finished = 0
+        while finished < fetch_workers:
+            item = await fetched.get()
+            if item is DONE:
+                finished += 1
+                continue
+            id, ext, html = item
+            if html is not None:
+                ext = await asyncio.to_thread(crawler.parse_detail, id, html)
+                if ext is None:
+                    # HTTP로 받은 페이지에 마감 시간이 없으면 브라우저로 다시 가져온다
+                    browser.put_nowait(id)
+                    continue
+            posts[id]["date"], posts[id]["subtitle"] = ext
+            await parsed.put(id)
+        # 브라우저 단계에 넘길 공고는 여기까지다
+        browser.put_nowait(DONE)
+        await parsed.put(DONE)
+
+    async def browser_stage():
+        # 크롬 드라이버는 크롤링이 쓰고 있으므로 크롤링이 끝난 뒤에, 남은 공고를 모아 워커들에 나눠서 연다
+        await crawl_task
+        ids = []
+        while (id := await browser.get()) is not DONE:
+            ids.append(id)
+
+        def on_result(id, ext):
+            # 워커 스레드에서 불린다. 가져오는 대로 등록 단계로 넘긴다
+            posts[id]["date"], posts[id]["subtitle"] = ext or (None, None)
+            asyncio.run_coroutine_threadsafe(parsed.put(id), loop).result()
+
+        if ids:
+            await asyncio.to_thread(crawler.fetch_details_browser, ids, browser_workers, on_result)
+        await parsed.put(DONE)
+
+    async def upload_stage():
+        created, failed = set(), {}
+        # 파싱 단계와 브라우저 단계가 모두 끝날 때까지
+        producers = 2
+        while producers:
+            # 공고가 linger초 넘게 끊기거나 BATCH_SIZE개가 모이면 한 배치로 묶어서 등록
+            items = [await parsed.get()]
+            while len(items) < BATCH_SIZE and items.count(DONE) < producers:
+                try:
+                    items.append(await asyncio.wait_for(parsed.get(), linger))
+                except TimeoutError:
+                    break
+            ids = {item for item in items if item is not DONE}
+            producers -= len(items) - len(ids)
+            if ids:
+                succeeded, errors = await asyncio.to_thread(
+                    output.create_events, posts, ids, START_URL, store
+                )
+                created |= succeeded
+                failed.update(errors)
+        return created, failed
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            listing_task = group.create_task(list_events())
+            crawl_task = group.create_task(crawl_stage())
+            for _ in range(fetch_workers):
+                group.create_task(fetch_stage())
+            group.create_task(parse_stage())
+            group.create_task(browser_stage())
+            upload_task = group.create_task(upload_stage())
+    except ExceptionGroup as errors:
+        # 한 단계가 실패하면 나머지는 취소된다. run_cycle처럼 처음 난 예외를 그대로 올린다
+        raise errors.exceptions[0]
+
+    created, failed = upload_task.result()
+    store.touch(posts.keys())
+    return {'created': sorted(created), 'updated': [], 'deleted': [], 'failed': failed}
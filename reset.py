@@ -1,4 +1,12 @@
-from google.google_calendar import google_calendar_login, get_or_create_calendar
+import time
+
+# 프로그램 시작 시각 (모듈 import와 로그인에 걸린 시간을 잰다)
+STARTED = time.perf_counter()
+
+from google.google_calendar import google_calendar_login, get_or_create_calendar, execute_batch, list_events
+from google.state_store import StateStore
+
+IMPORT_SECONDS = time.perf_counter() - STARTED
 
 def delete_all_events(service, calendar_id):
     """
@@ -7,27 +15,35 @@ def delete_all_events(service, calendar_id):
     Args:
         service (googleapiclient.discovery.Resource): Google Calendar API 서비스 객체.
         calendar_id (str): 이벤트를 삭제할 캘린더의 ID.
+
+    Returns:
+        tuple: (삭제에 성공한 이벤트 ID set, 실패한 이벤트 ID -> 예외 dict)
     """
-    # Google Calendar API를 통해 이벤트 목록 가져오기
-    events_result = service.events().list(
-        calendarId=calendar_id,
-        maxResults=2500,  # 최대 2500개의 이벤트 가져오기
-        singleEvents=True,
-        orderBy='startTime'
-    ).execute()
-    events = events_result.get('items', [])
+    # Google Calendar API를 통해 이벤트 목록 가져오기 (모든 페이지)
+    events, _ = list_events(service, calendar_id)
 
     if not events:
         print("📅 삭제할 일정이 없습니다.")
-        return
+        return set(), {}
+
+    # 모든 이벤트를 배치 요청으로 삭제
+    summaries = {event['id']: event.get('summary', '제목 없음') for event in events}
+    requests = [
+        (event_id, service.events().delete(calendarId=calendar_id, eventId=event_id))
+        for event_id in summaries
+    ]
+    succeeded, failed = execute_batch(service, requests)
 
-    # 모든 이벤트 삭제
-    for event in events:
-        event_id = event['id']
-        service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
-        print(f"🗑️ 삭제된 이벤트: {event.get('summary', '제목 없음')}")
+    for event_id in succeeded:
+        print(f"🗑️ 삭제된 이벤트: {summaries[event_id]}")
+    for event_id, error in failed.items():
+        print(f"🚨 삭제 실패: {summaries[event_id]} ({error})")
 
-    print("✅ 모든 일정이 삭제되었습니다.")
+    if failed:
+        print(f"⚠️ {len(failed)}개의 일정을 삭제하지 못했습니다. 다시 실행해 주세요.")
+    else:
+        print("✅ 모든 일정이 삭제되었습니다.")
+    return set(succeeded), failed
 
 
 def main():
@@ -35,12 +51,14 @@ def main():
 
     # Google Calendar API 로그인
     service = google_calendar_login()
+    print(f"[INFO] 로그인까지 {time.perf_counter() - STARTED:.2f}초 (모듈 import {IMPORT_SECONDS:.2f}초)")
 
     # recruit_schedule 캘린더 ID 가져오기
     calendar_id = get_or_create_calendar(service)
 
-    # 캘린더의 모든 일정 삭제
-    delete_all_events(service, calendar_id)
+    # 캘린더의 모든 일정 삭제 후 로컬 상태에서도 지우기
+    deleted, _ = delete_all_events(service, calendar_id)
+    StateStore(calendar_id).remove_events(deleted)
 
     print("✅ 캘린더 초기화 완료!")
 
@@ -3,6 +3,15 @@
 if [ "$1" == "-r" ]; then
     # reset.py 실행
     uv run reset.py
+elif [ "$1" == "-s" ]; then
+    # main.py 동기화 모드 실행
+    uv run main.py --sync
+elif [ "$1" == "-m" ]; then
+    # multi.py 실행 (accounts.json의 여러 계정을 동시에)
+    uv run multi.py "${@:2}"
+elif [ "$1" == "-d" ]; then
+    # daemon.py 실행 (크롬을 띄워 둔 채 주기적으로 확인)
+    uv run daemon.py
 else
     # main.py 실행
     uv run main.py
@@ -0,0 +1,162 @@
+from crawltools.metrics import METRICS
+from datetime import datetime
+import hashlib
+
+# 공고 키에서 소스 이름과 사이트의 공고 ID를 나누는 문자. 자소설닷컴 공고는 예전처럼 ID만 쓴다.
+KEY_SEPARATOR = ":"
+
+# 기본 소스 (키에 소스 이름을 붙이지 않는다)
+DEFAULT_SOURCE = "jasoseol"
+
+
+def split_key(key):
+    """
+    공고 키를 (소스 이름, 사이트의 공고 ID)로 나눕니다.
+
+    Returns:
+        tuple: 'saramin:123' -> ('saramin', '123'), '123' -> ('jasoseol', '123')
+    """
+    name, separator, id = str(key).partition(KEY_SEPARATOR)
+    return (name, id) if separator else (DEFAULT_SOURCE, name)
+
+
+class Source:
+    """
+    공고 사이트 하나의 로그인, 즐겨찾기 목록, 상세 페이지 파싱을 맡는 소스 플러그인입니다.
+
+    모든 소스는 같은 공고 형식을 만든다.
+        목록: 공고 키 -> {"company_name", "link"}
+        상세: posts[공고 키]["date"] (datetime | None), posts[공고 키]["subtitle"]
+    공고 키는 '<소스 이름>:<사이트의 공고 ID>'라서 여러 사이트의 공고가 같은 상태 DB와 캘린더에서 섞이지 않는다.
+
+    페이지는 직접 가져오지 않고 FetchScheduler(crawltools/scheduler.py)에 맡겨 호스트별 요청 제한을 지킨다.
+    하위 클래스는 list_postings, detail_url, parse_detail을 구현하고, 필요하면 login, add_times, detail_fragment를 덮어쓴다.
+    """
+
+    name = None
+
+    def __init__(self, config, scheduler=None):
+        """
+        Args:
+            config (dict): sources.json의 소스 설정. "name"이 있어야 한다.
+            scheduler (FetchScheduler): 페이지를 가져올 스케줄러. 상세 URL만 만들 때는 없어도 된다.
+        """
+        self.config = config
+        self.name = config.get("name") or self.name
+        self.scheduler = scheduler
+        # 마지막으로 크롤링한 기간 (시작 datetime, 끝 datetime). 이 기간 안의 공고만 동기화 모드에서 지운다
+        self.window = None
+        # 목록 페이지에 있던 마감 시간 (공고 키 -> (마감 시간, subtitle)). 있으면 상세 페이지를 열지 않는다
+        self.details = {}
+
+    def key(self, id):
+        return f"{self.name}{KEY_SEPARATOR}{id}"
+
+    def login(self):
+        """로그인이 필요한 사이트면 로그인합니다. 실패하면 예외를 올린다."""
+
+    def reset_login(self):
+        """다음 크롤링에서 로그인 상태부터 다시 확인하게 합니다."""
+
+    def list_postings(self):
+        """
+        즐겨찾기(또는 관심 공고) 목록을 가져옵니다. 끝나면 self.window를 채운다.
+
+        Returns:
+            dict: 공고 키 -> {"company_name", "link"}
+        """
+        raise NotImplementedError
+
+    def detail_url(self, id):
+        """사이트의 공고 ID로 상세 페이지 URL을 만듭니다."""
+        raise NotImplementedError
+
+    def parse_detail(self, html):
+        """
+        상세 페이지에서 마감 시간과 subtitle을 뽑습니다.
+
+        Returns:
+            tuple | None: (마감 시간 datetime, subtitle). 마감 시간을 찾지 못하면 None.
+        """
+        raise NotImplementedError
+
+    def detail_fragment(self, html):
+        """
+        상세 페이지에서 parse_detail이 읽는 부분만 반환합니다. 캐시에 저장한 것과 같으면 파싱하지 않는다.
+
+        Returns:
+            str | None: 해당 부분의 HTML(또는 텍스트). None이면 비교하지 않고 매번 파싱한다.
+        """
+        return None
+
+    def parse_cached(self, key, html):
+        """
+        상세 페이지를 파싱합니다. detail_fragment의 해시가 캐시에 저장된 것과 같으면 캐시 결과를 쓴다.
+
+        Returns:
+            tuple | None: (마감 시간, subtitle). 마감 시간을 찾지 못하면 None.
+        """
+        cache = self.scheduler.cache
+        fragment = self.detail_fragment(html)
+        fragment_hash = hashlib.sha256(fragment.encode()).hexdigest() if fragment else None
+        if fragment_hash:
+            cached = cache.get_by_hash(key, fragment_hash)
+            if cached is not None:
+                return cached
+        with METRICS.span("parse", kind="detail", source=self.name):
+            ext = self.parse_detail(html)
+        # 마감 시간을 찾은 결과만 캐시 (로딩이 덜 된 페이지를 저장하지 않도록)
+        if ext and ext[0]:
+            cache.put(key, ext, fragment_hash)
+        return ext
+
+    def fetch(self, url):
+        """스케줄러로 페이지를 가져옵니다."""
+        return self.scheduler.fetch(url)
+
+    def add_times(self, posts, keys):
+        """
+        공고들의 마감 시간과 subtitle을 posts에 채웁니다. 목록에 있던 마감 시간과 상세 페이지 캐시를 먼저 쓰고,
+        나머지 상세 페이지는 스케줄러가 호스트별 제한 안에서 동시에 가져온다.
+
+        Args:
+            posts (dict): 크롤링된 공고 데이터.
+            keys (iterable): 이 소스의 공고 키.
+        """
+        keys = sorted(keys)
+        cache = self.scheduler.cache
+        results = {}
+        for key in keys:
+            cached = self.details.get(key) or cache.get(key)
+            if cached is not None:
+                results[key] = cached
+        fetch_keys = [key for key in keys if key not in results]
+        urls = [self.detail_url(split_key(key)[1]) for key in fetch_keys]
+        for key, html in zip(fetch_keys, self.scheduler.map(self.fetch, urls)):
+            if html is None:
+                continue
+            METRICS.inc("pages_fetched", kind="detail", source=self.name)
+            results[key] = self.parse_cached(key, html)
+
+        for key in keys:
+            ext = results.get(key) or (None, None)
+            posts[key]["date"] = ext[0]
+            posts[key]["subtitle"] = ext[1]
+
+    def window_for(self, key):
+        """이 소스의 공고면 마지막으로 크롤링한 기간을, 아니면 None을 반환합니다."""
+        return self.window if split_key(key)[0] == self.name else None
+
+    def report(self):
+        """크롤링 통계를 출력합니다."""
+
+    def reset_stats(self):
+        """크롤링 통계를 비웁니다."""
+
+    def close(self):
+        """소스가 따로 연 자원을 닫습니다. (브라우저와 HTTP 연결은 스케줄러가 닫는다)"""
+
+    @staticmethod
+    def open_window():
+        """지금 열려 있는 공고를 모두 보는 소스의 크롤링 기간. (마감 시간의 끝이 없다)"""
+        return datetime.now(), datetime.max
@@ -0,0 +1,72 @@
+from sources.base import Source, DEFAULT_SOURCE
+
+# 자소설닷컴 공고 상세 URL의 기본 경로 (crawltools.crawler.START_URL과 같다)
+START_URL = "https://jasoseol.com/recruit"
+
+
+class JasoseolSource(Source):
+    """
+    자소설닷컴 즐겨찾기 달력을 크롤링하는 소스입니다. 로그인, 달력, 상세 페이지는 기존 Crawler가 그대로 맡는다.
+
+    공고 키는 예전처럼 공고 ID만 쓰므로 지금까지 만든 일정과 상태 DB를 그대로 쓴다.
+    크롬은 스케줄러의 브라우저 하나만 쓰고(DETAIL_WORKERS의 크롬 워커는 띄우지 않는다), 달력을 넘기는 동안에는
+    다른 소스가 브라우저를 쓰지 못하게 잡아 둔다. DETAIL_BACKEND=http의 요청은 스케줄러의 연결 풀과
+    호스트별 제한(초당 요청 수, 동시 요청 수)으로 보낸다.
+    """
+
+    name = DEFAULT_SOURCE
+
+    def __init__(self, config, scheduler=None):
+        super().__init__(config, scheduler)
+        self.crawler = None
+
+    def get_crawler(self):
+        if self.crawler is None:
+            # 크롤러(셀레니움, 파서)는 크롤링할 때만 불러온다
+            from crawltools.crawler import Crawler
+            self.crawler = Crawler(self.scheduler.browser(), scheduler=self.scheduler)
+        return self.crawler
+
+    def key(self, id):
+        return str(id)
+
+    def reset_login(self):
+        if self.crawler is not None:
+            self.crawler.reset_login()
+
+    def list_postings(self):
+        crawler = self.get_crawler()
+        with self.scheduler.browser_lock:
+            posts = crawler.get_all_stars()
+        self.window = crawler.window
+        return posts
+
+    def detail_url(self, id):
+        return f"{START_URL}/{id}"
+
+    def parse_detail(self, html):
+        from crawltools.parser import Parser
+        return Parser.extract_exp_time(html)
+
+    def detail_fragment(self, html):
+        from crawltools.parser import Parser
+        return Parser.detail_fragment(html)
+
+    def add_times(self, posts, keys):
+        # 캐시, 달력 API 응답, HTTP/브라우저 백엔드는 Crawler.add_times가 그대로 쓴다. 크롬은 공유 브라우저 하나만 쓴다
+        with self.scheduler.browser_lock:
+            self.get_crawler().add_times(posts, set(keys), workers=1)
+
+    def report(self):
+        if self.crawler is not None:
+            self.crawler.report()
+
+    def reset_stats(self):
+        if self.crawler is not None:
+            self.crawler.reset_stats()
+
+    def close(self):
+        # 크롬은 스케줄러가 닫으므로 Crawler.close()는 부르지 않는다
+        if self.crawler is not None and self.crawler.http_fetcher is not None:
+            self.crawler.http_fetcher.close()
+            self.crawler.http_fetcher = None
@@ -0,0 +1,110 @@
+from sources.base import DEFAULT_SOURCE, split_key
+import importlib
+import json
+import os
+
+# 사이트별 소스 설정 파일 (.env의 SOURCES_FILE)
+SOURCES_FILE = "sources.json"
+
+# 설정의 "type" -> 소스 클래스. "패키지.모듈:클래스" 형식으로 직접 만든 소스도 쓸 수 있다.
+SOURCE_TYPES = {
+    "jasoseol": "sources.jasoseol:JasoseolSource",
+    "selector": "sources.selector:SelectorSource",
+}
+
+# 상세 URL을 만들 때 쓰는 소스 객체 (이름 -> Source). 페이지를 가져오지 않으므로 스케줄러 없이 만든다
+_url_sources = {}
+
+
+def load_configs(path=None):
+    """
+    소스 설정 파일을 읽습니다. 파일이 없으면 자소설닷컴만 있는 것으로 본다.
+
+    Args:
+        path (str): 설정 파일 경로. 없으면 .env의 SOURCES_FILE (기본 sources.json).
+
+    Returns:
+        dict: 소스 이름 -> 설정 dict.
+    """
+    path = path or os.getenv("SOURCES_FILE", SOURCES_FILE)
+    configs = {DEFAULT_SOURCE: {"name": DEFAULT_SOURCE, "type": "jasoseol"}}
+    if not os.path.exists(path):
+        return configs
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"[ERROR] {path} 값이 잘못되었습니다. 소스 설정 목록(JSON 배열)이어야 합니다.")
+    for entry in entries:
+        name = entry.get("name") if isinstance(entry, dict) else None
+        if not name or ":" in name:
+            raise ValueError(f"[ERROR] 소스 이름이 없거나 잘못되었습니다: {name!r} (':'는 쓸 수 없음)")
+        configs[name] = {"type": "selector", **entry}
+    return configs
+
+
+def source_names(names=None):
+    """
+    크롤링할 소스 이름 목록을 반환합니다.
+
+    Args:
+        names (str | list): 'jasoseol,example' 또는 목록. 없으면 .env의 SOURCES (기본 'jasoseol').
+
+    Returns:
+        list: 소스 이름 목록 (중복 없이 순서 유지).
+    """
+    if names is None:
+        names = os.getenv("SOURCES", DEFAULT_SOURCE)
+    if isinstance(names, str):
+        names = names.split(",")
+    return list(dict.fromkeys(name.strip() for name in names if name.strip()))
+
+
+def source_class(config):
+    """설정의 type에 맞는 소스 클래스를 불러옵니다."""
+    target = SOURCE_TYPES.get(config["type"], config["type"])
+    module_name, _, class_name = target.partition(":")
+    if not class_name:
+        raise ValueError(f"[ERROR] 소스 '{config['name']}'의 type 값이 잘못되었습니다: {config['type']!r}")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def open_sources(scheduler, names=None, path=None):
+    """
+    소스 객체를 만듭니다.
+
+    Args:
+        scheduler (FetchScheduler): 소스가 페이지를 가져올 스케줄러.
+        names (str | list): 소스 이름. source_names 참고.
+        path (str): 설정 파일 경로. load_configs 참고.
+
+    Returns:
+        list: Source 목록.
+    """
+    configs = load_configs(path)
+    sources = []
+    for name in source_names(names):
+        if name not in configs:
+            raise ValueError(f"[ERROR] SOURCES 값이 잘못되었습니다. '{name}' 소스가 {path or SOURCES_FILE}에 없습니다.")
+        sources.append(source_class(configs[name])(configs[name], scheduler))
+    return sources
+
+
+def posting_url(key, base_url):
+    """
+    공고 키로 상세 페이지 URL을 만듭니다. 캘린더 일정 설명과 .ics의 URL에 쓴다.
+
+    Args:
+        key (str): 공고 키.
+        base_url (str): 자소설닷컴 공고 상세 URL의 기본 경로.
+
+    Returns:
+        str: 상세 페이지 URL. 설정에서 빠진 소스의 공고면 base_url 뒤에 키를 붙인다.
+    """
+    name, id = split_key(key)
+    if name == DEFAULT_SOURCE:
+        return f"{base_url}/{id}"
+    if name not in _url_sources:
+        config = load_configs().get(name)
+        _url_sources[name] = source_class(config)(config) if config else None
+    source = _url_sources[name]
+    return source.detail_url(id) if source else f"{base_url}/{key}"
@@ -0,0 +1,168 @@
+from datetime import datetime
+from sources.base import Source
+from urllib.parse import urljoin
+import os
+
+# 마감 시간 형식에 시간이 없으면 그날 이 시각을 마감으로 본다
+END_OF_DAY = (23, 59)
+
+
+def _text(element):
+    """요소면 하위 텍스트를 각각 strip해서 이어 붙이고, XPath 문자열 결과면 그대로 strip합니다."""
+    if isinstance(element, str):
+        return element.strip()
+    return "".join(text.strip() for text in element.itertext())
+
+
+class SelectorSource(Source):
+    """
+    sources.json의 XPath 설정만으로 크롤링하는 소스입니다. 코드를 고치지 않고 사이트를 추가할 때 쓴다.
+
+        {
+          "name": "example",
+          "type": "selector",
+          "list_url": "https://jobs.example.com/me/scraps?page={page}",
+          "pages": 3,
+          "item": "//li[contains(@class, 'scrap')]",
+          "id": "@data-job-id",
+          "company": ".//span[@class='company']",
+          "item_deadline": ".//span[@class='deadline']",
+          "item_deadline_format": "%Y.%m.%d",
+          "detail_url": "https://jobs.example.com/jobs/{id}",
+          "deadline": "//dd[@class='deadline']",
+          "subtitle": "//h1",
+          "deadline_format": "%Y.%m.%d %H:%M",
+          "cookie_env": "EXAMPLE_COOKIE",
+          "browser": false,
+          "rate": 1,
+          "concurrency": 2
+        }
+
+    - 목록 페이지를 page=1부터 pages까지(빈 페이지가 나오면 멈춤) 읽고, item마다 id, company를 뽑는다.
+      pages번째 페이지에도 공고가 있으면 목록을 다 읽지 못한 것으로 보고, 동기화 모드에서 이 소스의 일정을 지우지 않는다.
+    - item_deadline이 있으면 목록에서 마감 시간을 바로 읽어 상세 페이지를 열지 않는다.
+      (형식이 상세 페이지와 다르면 item_deadline_format)
+    - 로그인은 cookie_env 환경 변수에 넣은 Cookie 헤더(브라우저에서 복사)로 한다.
+    - browser가 true면 HTTP 대신 스케줄러의 크롬으로 연다. (자바스크립트로 그리는 사이트)
+    - rate(초당 요청 수), concurrency(동시 요청 수)로 이 사이트의 요청 제한을 따로 정할 수 있다.
+    """
+
+    REQUIRED = ("list_url", "item", "id", "detail_url", "deadline", "deadline_format")
+
+    def __init__(self, config, scheduler=None):
+        super().__init__(config, scheduler)
+        missing = [key for key in self.REQUIRED if not config.get(key)]
+        if missing:
+            raise ValueError(f"[ERROR] 소스 '{self.name}' 설정 값이 잘못되었습니다. 필요한 값: {', '.join(missing)}")
+        self.headers = {}
+
+    def login(self):
+        cookie_env = self.config.get("cookie_env")
+        if not cookie_env:
+            return
+        cookie = os.getenv(cookie_env)
+        if not cookie:
+            raise ValueError(f"[ERROR] {cookie_env} 값이 잘못되었습니다. 소스 '{self.name}'의 Cookie 헤더를 설정하세요.")
+        self.headers = {"Cookie": cookie}
+
+    def fetch(self, url):
+        if self.config.get("browser"):
+            return self.scheduler.fetch_browser(url)
+        return self.scheduler.fetch(url, headers=self.headers)
+
+    def parse_deadline(self, text, fmt=None):
+        """
+        마감 시간 문자열을 datetime으로 바꿉니다. 형식에 시간이 없으면 그날 23:59로 본다.
+
+        Args:
+            text (str): 마감 시간 문자열.
+            fmt (str): strptime 형식. 없으면 설정의 deadline_format.
+
+        Returns:
+            datetime | None: 형식이 맞지 않으면 None.
+        """
+        fmt = fmt or self.config["deadline_format"]
+        try:
+            deadline = datetime.strptime(text.strip(), fmt)
+        except ValueError as e:
+            print(f"[ERROR] {self.name} 날짜 파싱 실패: {e}")
+            return None
+        if "%H" not in fmt and "%I" not in fmt:
+            deadline = deadline.replace(hour=END_OF_DAY[0], minute=END_OF_DAY[1])
+        return deadline
+
+    def list_postings(self):
+        # lxml은 이 소스를 쓸 때만 불러온다
+        from lxml import html as lxml_html
+
+        self.login()
+        results = {}
+        self.details = {}
+        # 목록을 끝까지 읽었는지 (빈 페이지를 만났거나 페이지가 하나뿐). 아니면 동기화 모드에서 지우지 않는다
+        complete = False
+        for page in range(1, int(self.config.get("pages", 1)) + 1):
+            url = self.config["list_url"].format(page=page)
+            html = self.fetch(url)
+            if html is None:
+                raise RuntimeError(f"[ERROR] {self.name} 목록 페이지를 가져오지 못했습니다: {url}")
+            items = lxml_html.fromstring(html).xpath(self.config["item"])
+            if not items:
+                complete = True
+                break
+            for item in items:
+                ids = item.xpath(self.config["id"])
+                if not ids:
+                    continue
+                key = self.key(_text(ids[0]))
+                companies = item.xpath(self.config["company"]) if self.config.get("company") else []
+                results[key] = {
+                    "company_name": _text(companies[0]) if companies else "회사 이름 없음",
+                    "link": urljoin(url, self.detail_url(_text(ids[0]))),
+                }
+                if self.config.get("item_deadline"):
+                    deadlines = item.xpath(self.config["item_deadline"])
+                    fmt = self.config.get("item_deadline_format")
+                    deadline = self.parse_deadline(_text(deadlines[0]), fmt) if deadlines else None
+                    if deadline:
+                        self.details[key] = (deadline, None)
+            # 목록 URL에 페이지 번호가 없으면 한 페이지만 읽는다
+            if "{page}" not in self.config["list_url"]:
+                complete = True
+                break
+        if complete:
+            self.window = self.open_window()
+        else:
+            self.window = None
+            print(f"[INFO] {self.name}: {self.config.get('pages', 1)}페이지까지 공고가 있어 목록을 끝까지 읽지 못했습니다. "
+                  f"이번 실행에서는 이 소스의 일정을 지우지 않습니다. (pages 값을 늘리세요)")
+        print(f"[INFO] {self.name}: 공고 {len(results)}개 (목록에 마감 시간이 있던 공고 {len(self.details)}개)")
+        return results
+
+    def detail_url(self, id):
+        return self.config["detail_url"].format(id=id)
+
+    def detail_fragment(self, html):
+        """deadline, subtitle XPath가 가리키는 노드를 직렬화해 이어 붙입니다."""
+        from lxml import html as lxml_html
+
+        root = lxml_html.fromstring(html)
+        nodes = root.xpath(self.config["deadline"])
+        if self.config.get("subtitle"):
+            nodes += root.xpath(self.config["subtitle"])
+        return "".join(
+            node if isinstance(node, str) else lxml_html.tostring(node, encoding="unicode", with_tail=False)
+            for node in nodes
+        )
+
+    def parse_detail(self, html):
+        from lxml import html as lxml_html
+
+        root = lxml_html.fromstring(html)
+        deadlines = root.xpath(self.config["deadline"])
+        if not deadlines:
+            return None
+        deadline = self.parse_deadline(_text(deadlines[0]))
+        if deadline is None:
+            return None
+        subtitles = root.xpath(self.config["subtitle"]) if self.config.get("subtitle") else []
+        return deadline, _text(subtitles[0]) if subtitles else None